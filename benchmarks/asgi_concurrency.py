@@ -0,0 +1,156 @@
+"""
+Concurrent connections served by one worker, ASGI vs WSGI, under I/O latency.
+
+Clients issue the async read endpoints (transaction, budget and category
+list/detail GETs) over keep-alive connections. The number of concurrent
+clients steps up, and each step reports throughput and latency. The result
+is the highest concurrency whose p95 stays within ``--p95-ms``. Run the
+same steps against each deployment, with the same emulated per-query
+database latency, then compare:
+
+    export DJANGO_SETTINGS_MODULE=expense_tracker.settings_loadtest LOADTEST_DB_LATENCY_MS=20
+    gunicorn expense_tracker.wsgi --workers 1 --threads 8
+    python -m benchmarks.asgi_concurrency --label wsgi --save benchmarks/results/concurrency_wsgi.json
+
+    uvicorn expense_tracker.asgi:application --workers 1
+    python -m benchmarks.asgi_concurrency --label asgi --save benchmarks/results/concurrency_asgi.json
+
+    python -m benchmarks.asgi_concurrency --compare benchmarks/results/concurrency_*.json
+"""
+
+import argparse
+import json
+import os
+import random
+import threading
+import time
+
+from .loadtest import Stats, VirtualUser
+
+READS = [
+    ("/api/transactions/", "GET /api/transactions/"),
+    ("/api/transactions/{transaction}/", "GET /api/transactions/{id}/"),
+    ("/api/budget/", "GET /api/budget/"),
+    ("/api/budget/{budget}/", "GET /api/budget/{id}/"),
+    ("/api/categories/", "GET /api/categories/"),
+    ("/api/categories/{category}/", "GET /api/categories/{id}/"),
+]
+
+
+def client_loop(vuser, ready, active, stop):
+    if vuser.setup():
+        vuser.create_transaction()
+    ready.release()
+    if not vuser.transaction_ids or not vuser.budget_id:
+        return
+    ids = {
+        "transaction": vuser.transaction_ids[0],
+        "budget": vuser.budget_id,
+        "category": vuser.category_id,
+    }
+    while not stop.is_set():
+        if not active.is_set():
+            active.wait(0.2)
+            continue
+        path, name = random.choice(READS)
+        vuser.request("GET", path.format(**ids), name)
+
+
+def run(base_url, levels, step_seconds):
+    setup_stats = Stats()
+    ready = threading.Semaphore(0)
+    stop = threading.Event()
+
+    # Set every client up front so registration is not part of any step
+    clients = []
+    for _ in range(max(levels)):
+        vuser, active = VirtualUser(base_url, setup_stats), threading.Event()
+        thread = threading.Thread(target=client_loop, args=(vuser, ready, active, stop), daemon=True)
+        clients.append((vuser, active))
+        thread.start()
+    for _ in clients:
+        ready.acquire()
+
+    steps = []
+    for level in levels:
+        stats = Stats()
+        for index, (vuser, active) in enumerate(clients):
+            vuser.stats = stats
+            if index < level:
+                active.set()
+            else:
+                active.clear()
+        time.sleep(step_seconds)
+        summary = stats.summary(step_seconds)
+        latencies = sorted(value for values in stats.latencies.values() for value in values)
+        requests = len(latencies)
+        errors = sum(stats.errors.values())
+        steps.append(
+            {
+                "concurrency": level,
+                "rps": round(requests / step_seconds, 1),
+                "p50_ms": round(latencies[len(latencies) // 2], 1) if latencies else 0.0,
+                "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1], 1) if latencies else 0.0,
+                "error_rate": round(errors / requests, 4) if requests else 0.0,
+                "endpoints": summary,
+            }
+        )
+        print(
+            f"concurrency={level:<4} rps={steps[-1]['rps']:<8} p95={steps[-1]['p95_ms']}ms "
+            f"errors={steps[-1]['error_rate']}",
+            flush=True,
+        )
+    stop.set()
+    return steps
+
+
+def max_concurrency(steps, p95_ms, max_error_rate=0.01):
+    passing = [
+        step["concurrency"]
+        for step in steps
+        if step["p95_ms"] <= p95_ms and step["error_rate"] <= max_error_rate
+    ]
+    return max(passing, default=0)
+
+
+def compare(paths):
+    for path in paths:
+        with open(path) as fh:
+            result = json.load(fh)
+        print(f"{result['label']}: max concurrency within p95 {result['p95_ms']}ms = {result['max_concurrency']}")
+        for step in result["steps"]:
+            print(f"  {step['concurrency']:>4} clients  {step['rps']:>8} rps  p95 {step['p95_ms']:>8} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--levels", default="8,16,32,64,128", help="comma-separated client counts")
+    parser.add_argument("--step-seconds", type=float, default=20.0)
+    parser.add_argument("--p95-ms", type=float, default=250.0, help="latency objective per step")
+    parser.add_argument("--label", default="default", help="name of the deployment under test")
+    parser.add_argument("--save", help="write this run's result to a JSON file")
+    parser.add_argument("--compare", nargs="+", metavar="RESULT", help="compare saved results")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(args.compare)
+        return
+
+    levels = sorted(int(level) for level in args.levels.split(","))
+    steps = run(args.base_url, levels, args.step_seconds)
+    result = {
+        "label": args.label,
+        "p95_ms": args.p95_ms,
+        "max_concurrency": max_concurrency(steps, args.p95_ms),
+        "steps": steps,
+    }
+    print(f"max concurrency within p95 {args.p95_ms}ms: {result['max_concurrency']}")
+    if args.save:
+        os.makedirs(os.path.dirname(args.save) or ".", exist_ok=True)
+        with open(args.save, "w") as fh:
+            json.dump(result, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Latency and throughput of TransactionDetailView.get under different
+database connection modes.
+
+Each client thread registers, creates one transaction and then fetches it
+repeatedly for the run duration. Start the server once per mode and save a
+result for each, then compare:
+
+    DB_WEB_CONN_MAX_AGE=0 DJANGO_SETTINGS_MODULE=expense_tracker.settings_loadtest python manage.py runserver --noreload
+    python -m benchmarks.db_connections --label no-reuse --save benchmarks/results/db_no_reuse.json
+
+    DB_WEB_CONN_MAX_AGE=60 ...   # persistent connections (default)
+    DB_WEB_POOL=true ...         # psycopg pool
+
+    python -m benchmarks.db_connections --compare benchmarks/results/db_*.json
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+
+from .loadtest import Stats, VirtualUser
+
+ENDPOINT = "GET /api/transactions/{id}/"
+
+
+def client_loop(vuser, ready, start, stop):
+    if vuser.setup():
+        vuser.create_transaction()
+    ready.release()
+    start.wait()
+    if not vuser.transaction_ids:
+        return
+    path = f"/api/transactions/{vuser.transaction_ids[0]}/"
+    while not stop.is_set():
+        vuser.request("GET", path, ENDPOINT)
+
+
+def run(base_url, clients, duration):
+    setup_stats, stats = Stats(), Stats()
+    ready = threading.Semaphore(0)
+    start, stop = threading.Event(), threading.Event()
+
+    vusers = [VirtualUser(base_url, setup_stats) for _ in range(clients)]
+    threads = [
+        threading.Thread(target=client_loop, args=(vuser, ready, start, stop), daemon=True)
+        for vuser in vusers
+    ]
+    for thread in threads:
+        thread.start()
+    for _ in threads:
+        ready.acquire()
+
+    # Only the detail GETs are measured, not registration and setup
+    for vuser in vusers:
+        vuser.stats = stats
+    start.set()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join(timeout=30)
+    return stats.summary(duration).get(ENDPOINT, {})
+
+
+def compare(paths):
+    results = []
+    for path in paths:
+        with open(path) as fh:
+            results.append(json.load(fh))
+    columns = ("rps", "p50_ms", "p95_ms", "p99_ms", "error_rate")
+    print(f"{'mode':<16}" + "".join(f"{column:>12}" for column in columns))
+    for result in results:
+        print(f"{result['label']:<16}" + "".join(f"{result['metrics'].get(c, 0):>12}" for c in columns))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds")
+    parser.add_argument("--label", default="default", help="name of the connection mode under test")
+    parser.add_argument("--save", help="write this run's result to a JSON file")
+    parser.add_argument("--compare", nargs="+", metavar="RESULT", help="compare saved results")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(args.compare)
+        return
+
+    metrics = run(args.base_url, args.clients, args.duration)
+    result = {"label": args.label, "clients": args.clients, "duration_s": args.duration, "metrics": metrics}
+    print(json.dumps(result, indent=2))
+    if args.save:
+        os.makedirs(os.path.dirname(args.save) or ".", exist_ok=True)
+        with open(args.save, "w") as fh:
+            json.dump(result, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Emulates a remote database for the load tests by sleeping before every SQL
+query. Enabled by ``LOADTEST_DB_LATENCY_MS`` in ``settings_loadtest``.
+"""
+
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db.backends.signals import connection_created
+
+
+def _add_latency(connection, **kwargs):
+    delay = settings.LOADTEST_DB_LATENCY_MS / 1000
+
+    def delayed(execute, sql, params, many, context):
+        time.sleep(delay)
+        return execute(sql, params, many, context)
+
+    connection.execute_wrappers.append(delayed)
+
+
+class QueryLatencyMiddleware:
+    """Installs the delay on every new database connection; otherwise a pass-through."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        connection_created.connect(_add_latency, dispatch_uid="loadtest-db-latency")
+
+    def __call__(self, request):
+        return self.get_response(request)
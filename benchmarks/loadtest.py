@@ -0,0 +1,418 @@
+"""
+Local HTTP load test for the core API flows.
+
+Every virtual user registers, logs in, creates its own debit category and a
+budget for the current month, then loops over a weighted mix of transaction,
+budget and category requests. Users are started and stopped according to a
+ramp profile. At the end a per-endpoint report (throughput, latency
+percentiles, error rate, SLO status) is printed and optionally compared with a
+stored baseline.
+
+Start the app with the load-test settings so Celery runs in-process:
+    DJANGO_SETTINGS_MODULE=expense_tracker.settings_loadtest python manage.py runserver --noreload
+
+Then run:
+    python -m benchmarks.loadtest --profile steady
+    python -m benchmarks.loadtest --profile steady --save-baseline benchmarks/results/loadtest_baseline.json
+    python -m benchmarks.loadtest --profile steady --baseline benchmarks/results/loadtest_baseline.json
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+
+
+# Each stage is (duration in seconds, number of active users)
+RAMP_PROFILES = {
+    "smoke": [(10, 1)],
+    "steady": [(10, 5), (60, 20), (10, 5)],
+    "ramp": [(20, 5), (20, 10), (20, 20), (20, 40), (20, 10)],
+    "spike": [(15, 5), (10, 60), (15, 5)],
+}
+
+# Latency (p95, ms) and error-rate objectives per endpoint
+SLOS = {
+    "POST /api/auth/login/": {"p95_ms": 400, "error_rate": 0.01},
+    "POST /api/transactions/": {"p95_ms": 300, "error_rate": 0.01},
+    "GET /api/transactions/": {"p95_ms": 250, "error_rate": 0.01},
+    "PATCH /api/transactions/{id}/": {"p95_ms": 300, "error_rate": 0.01},
+    "DELETE /api/transactions/{id}/": {"p95_ms": 250, "error_rate": 0.01},
+    "GET /api/budget/": {"p95_ms": 250, "error_rate": 0.01},
+    "GET /api/budget/{id}/": {"p95_ms": 200, "error_rate": 0.01},
+    "GET /api/categories/": {"p95_ms": 200, "error_rate": 0.01},
+}
+
+PASSWORD = "Loadtest#2024"
+
+
+class Stats:
+    """Thread-safe latency and error collector keyed by endpoint name."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = {}
+        self.errors = {}
+
+    def record(self, name, elapsed_ms, ok):
+        with self._lock:
+            self.latencies.setdefault(name, []).append(elapsed_ms)
+            if not ok:
+                self.errors[name] = self.errors.get(name, 0) + 1
+
+    def summary(self, duration):
+        """Return a dict of per-endpoint metrics."""
+        result = {}
+        with self._lock:
+            for name, values in sorted(self.latencies.items()):
+                values = sorted(values)
+                count = len(values)
+                errors = self.errors.get(name, 0)
+                result[name] = {
+                    "count": count,
+                    "rps": round(count / duration, 2) if duration else 0.0,
+                    "p50_ms": round(percentile(values, 50), 2),
+                    "p90_ms": round(percentile(values, 90), 2),
+                    "p95_ms": round(percentile(values, 95), 2),
+                    "p99_ms": round(percentile(values, 99), 2),
+                    "max_ms": round(values[-1], 2),
+                    "error_rate": round(errors / count, 4) if count else 0.0,
+                }
+        return result
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile over an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+class VirtualUser:
+    """A single API client with its own keep-alive connection and data."""
+
+    def __init__(self, base_url, stats):
+        parsed = urlparse(base_url)
+        self.host = parsed.hostname
+        self.port = parsed.port or 80
+        self.stats = stats
+        self.conn = None
+        self.token = None
+        self.user_id = None
+        self.category_id = None
+        self.budget_id = None
+        self.transaction_ids = []
+        self.username = f"lt_{uuid.uuid4().hex[:12]}"
+
+    def request(self, method, path, name, body=None, expected=(200, 201, 204)):
+        """Send a request, record its latency under ``name`` and return parsed JSON."""
+        if self.conn is None:
+            self.conn = http.client.HTTPConnection(self.host, self.port, timeout=30)
+        headers = {"Content-Type": "application/json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        payload = json.dumps(body) if body is not None else None
+
+        start = time.perf_counter()
+        try:
+            self.conn.request(method, path, body=payload, headers=headers)
+            response = self.conn.getresponse()
+            raw = response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            self.conn.close()
+            self.conn = None
+            self.stats.record(name, (time.perf_counter() - start) * 1000, False)
+            return None
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        ok = status in expected
+        self.stats.record(name, elapsed_ms, ok)
+        if not ok or not raw:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+    def setup(self):
+        """Register, log in and create the category and budget used by the workload."""
+        data = self.request(
+            "POST",
+            "/api/auth/register/",
+            "setup",
+            {
+                "username": self.username,
+                "email": f"{self.username}@loadtest.local",
+                "password": PASSWORD,
+                "name": "Load Test",
+            },
+        )
+        if not data:
+            return False
+        self.user_id = data["data"]["user"]["id"]
+        if not self.login():
+            return False
+
+        data = self.request(
+            "POST",
+            "/api/categories/",
+            "setup",
+            {"name": f"lt-{uuid.uuid4().hex[:8]}", "type": "debit", "user": self.user_id},
+        )
+        if not data:
+            return False
+        self.category_id = data["data"]["id"]
+
+        today = datetime.now()
+        data = self.request(
+            "POST",
+            "/api/budget/",
+            "setup",
+            {
+                "amount": "5000.00",
+                "month_year": f"{today.month:02d}-{today.year}",
+                "user": self.user_id,
+                "category": self.category_id,
+            },
+        )
+        if data:
+            self.budget_id = data["data"]["id"]
+        return True
+
+    def login(self):
+        self.token = None
+        data = self.request(
+            "POST",
+            "/api/auth/login/",
+            "POST /api/auth/login/",
+            {"username": self.username, "password": PASSWORD},
+        )
+        if not data:
+            return False
+        self.token = data["data"]["tokens"]["access_token"]
+        return True
+
+    def create_transaction(self):
+        data = self.request(
+            "POST",
+            "/api/transactions/",
+            "POST /api/transactions/",
+            {
+                "user": self.user_id,
+                "category": self.category_id,
+                "amount": f"{random.uniform(1, 400):.2f}",
+                "date": datetime.now(timezone.utc).isoformat(),
+                "description": "load test",
+                "type": "debit",
+            },
+        )
+        if data:
+            self.transaction_ids.append(data["data"]["id"])
+
+    def list_transactions(self):
+        self.request("GET", "/api/transactions/", "GET /api/transactions/")
+
+    def patch_transaction(self):
+        if not self.transaction_ids:
+            return self.create_transaction()
+        pk = random.choice(self.transaction_ids)
+        self.request(
+            "PATCH",
+            f"/api/transactions/{pk}/",
+            "PATCH /api/transactions/{id}/",
+            {"amount": f"{random.uniform(1, 400):.2f}", "description": "patched"},
+        )
+
+    def delete_transaction(self):
+        if not self.transaction_ids:
+            return self.create_transaction()
+        pk = self.transaction_ids.pop(random.randrange(len(self.transaction_ids)))
+        self.request("DELETE", f"/api/transactions/{pk}/", "DELETE /api/transactions/{id}/")
+
+    def list_budgets(self):
+        self.request("GET", "/api/budget/", "GET /api/budget/")
+
+    def budget_status(self):
+        if not self.budget_id:
+            return self.list_budgets()
+        self.request("GET", f"/api/budget/{self.budget_id}/", "GET /api/budget/{id}/")
+
+    def list_categories(self):
+        self.request("GET", "/api/categories/", "GET /api/categories/")
+
+
+# (weight, VirtualUser method name)
+SCENARIOS = [
+    (25, "list_transactions"),
+    (20, "create_transaction"),
+    (10, "patch_transaction"),
+    (5, "delete_transaction"),
+    (15, "list_budgets"),
+    (10, "budget_status"),
+    (13, "list_categories"),
+    (2, "login"),
+]
+
+
+def user_loop(vuser, active, stop, think_time):
+    """Run weighted scenarios while this user's slot is active."""
+    weights = [weight for weight, _ in SCENARIOS]
+    names = [name for _, name in SCENARIOS]
+    if not vuser.setup():
+        return
+    while not stop.is_set():
+        if not active.is_set():
+            active.wait(0.5)
+            continue
+        getattr(vuser, random.choices(names, weights)[0])()
+        if think_time:
+            time.sleep(random.uniform(0, think_time))
+
+
+def run(base_url, stages, think_time=0.0, seed=None):
+    """Drive the ramp profile and return (summary, measured duration)."""
+    if seed is not None:
+        random.seed(seed)
+    stats = Stats()
+    stop = threading.Event()
+    slots = []
+
+    start = time.perf_counter()
+    for duration, users in stages:
+        while len(slots) < users:
+            active = threading.Event()
+            thread = threading.Thread(
+                target=user_loop,
+                args=(VirtualUser(base_url, stats), active, stop, think_time),
+                daemon=True,
+            )
+            slots.append((active, thread))
+            thread.start()
+        for index, (active, _) in enumerate(slots):
+            if index < users:
+                active.set()
+            else:
+                active.clear()
+        print(f"stage: {users} users for {duration}s", file=sys.stderr)
+        time.sleep(duration)
+
+    stop.set()
+    for active, thread in slots:
+        active.set()
+        thread.join(timeout=30)
+    elapsed = time.perf_counter() - start
+
+    summary = stats.summary(elapsed)
+    summary.pop("setup", None)
+    return summary, elapsed
+
+
+def check_slos(summary):
+    """Return a list of SLO violations."""
+    violations = []
+    for name, slo in SLOS.items():
+        metrics = summary.get(name)
+        if not metrics:
+            continue
+        if metrics["p95_ms"] > slo["p95_ms"]:
+            violations.append(f"{name}: p95 {metrics['p95_ms']}ms > {slo['p95_ms']}ms")
+        if metrics["error_rate"] > slo["error_rate"]:
+            violations.append(
+                f"{name}: error rate {metrics['error_rate']:.2%} > {slo['error_rate']:.2%}"
+            )
+    return violations
+
+
+def compare_with_baseline(summary, baseline, tolerance):
+    """Return a list of regressions against a stored baseline summary."""
+    regressions = []
+    for name, current in summary.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for key in ("p50_ms", "p95_ms", "p99_ms"):
+            if previous[key] and current[key] > previous[key] * (1 + tolerance):
+                regressions.append(
+                    f"{name}: {key} {previous[key]} -> {current[key]} "
+                    f"(+{(current[key] / previous[key] - 1):.0%})"
+                )
+        if previous["rps"] and current["rps"] < previous["rps"] * (1 - tolerance):
+            regressions.append(f"{name}: rps {previous['rps']} -> {current['rps']}")
+        if current["error_rate"] > previous["error_rate"] + 0.01:
+            regressions.append(
+                f"{name}: error rate {previous['error_rate']:.2%} -> {current['error_rate']:.2%}"
+            )
+    return regressions
+
+
+def print_report(summary, elapsed):
+    header = f"{'endpoint':34} {'count':>7} {'rps':>8} {'p50':>8} {'p90':>8} {'p95':>8} {'p99':>8} {'err%':>7}"
+    print(header)
+    print("-" * len(header))
+    total = 0
+    for name, m in summary.items():
+        total += m["count"]
+        print(
+            f"{name:34} {m['count']:>7} {m['rps']:>8} {m['p50_ms']:>8} {m['p90_ms']:>8} "
+            f"{m['p95_ms']:>8} {m['p99_ms']:>8} {m['error_rate'] * 100:>6.2f}%"
+        )
+    print(f"\n{total} requests in {elapsed:.1f}s ({total / elapsed:.1f} req/s)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--profile", choices=sorted(RAMP_PROFILES), default="steady")
+    parser.add_argument("--think-time", type=float, default=0.0, help="max seconds between requests")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", help="write this run's summary to a JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.20, help="allowed regression ratio")
+    args = parser.parse_args(argv)
+
+    summary, elapsed = run(args.base_url, RAMP_PROFILES[args.profile], args.think_time, args.seed)
+    print_report(summary, elapsed)
+
+    failed = False
+    violations = check_slos(summary)
+    if violations:
+        failed = True
+        print("\nSLO violations:")
+        for line in violations:
+            print(f"  {line}")
+
+    if args.baseline:
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)["endpoints"]
+        regressions = compare_with_baseline(summary, baseline, args.tolerance)
+        if regressions:
+            failed = True
+            print("\nRegressions against baseline:")
+            for line in regressions:
+                print(f"  {line}")
+        else:
+            print("\nNo regressions against baseline.")
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.save_baseline) or ".", exist_ok=True)
+        with open(args.save_baseline, "w") as fh:
+            json.dump(
+                {"profile": args.profile, "duration_s": round(elapsed, 1), "endpoints": summary},
+                fh,
+                indent=2,
+            )
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
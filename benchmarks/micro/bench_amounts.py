@@ -0,0 +1,83 @@
+"""
+SUM-heavy paths on minor-unit amounts: Decimal aggregates and rollups vs the
+integer helpers in ``utils.amounts``, and the budget list, which totals
+spending for every budget on the page.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+import uuid
+
+import pytest
+
+ROWS = 10_000
+BUDGETS = 100
+
+
+@pytest.fixture
+def spending(user, make_categories):
+    """``BUDGETS`` categories with a budget each and ``ROWS`` transactions this month."""
+    from django.utils import timezone
+
+    from budget.models import Budget
+    from category.models import Category
+    from transaction.models import Transaction
+
+    categories = Category.objects.bulk_create(make_categories(BUDGETS))
+    today = datetime.now()
+    Budget.objects.bulk_create(
+        Budget(user=user, category=category, year=today.year, month=today.month, amount=Decimal("5000.00"))
+        for category in categories
+    )
+    now = timezone.now()
+    Transaction.objects.bulk_create(
+        (
+            Transaction(
+                id=uuid.uuid4(),
+                user=user,
+                category=categories[i % BUDGETS],
+                amount=Decimal("12.34"),
+                date=now,
+                type="debit",
+            )
+            for i in range(ROWS)
+        ),
+        batch_size=2_000,
+    )
+    return Transaction.objects.filter(user=user)
+
+
+@pytest.mark.benchmark(group="spent-total")
+def test_total_decimal_aggregate(benchmark, spending):
+    from django.db.models import Sum
+
+    assert benchmark(lambda: spending.aggregate(total=Sum("amount"))["total"]) == Decimal("123400.00")
+
+
+@pytest.mark.benchmark(group="spent-total")
+def test_total_minor_aggregate(benchmark, spending):
+    from utils.amounts import sum_minor
+
+    assert benchmark(sum_minor, spending) == 12_340_000
+
+
+@pytest.mark.benchmark(group="spent-rollup")
+def test_rollup_decimal_values(benchmark, spending):
+    benchmark(lambda: sum(spending.values_list("amount", flat=True), Decimal("0")))
+
+
+@pytest.mark.benchmark(group="spent-rollup")
+def test_rollup_minor_array(benchmark, spending):
+    pytest.importorskip("numpy")
+    from utils.amounts import minor_array
+
+    assert benchmark(lambda: int(minor_array(spending).sum())) == 12_340_000
+
+
+@pytest.mark.benchmark(group="budget-list-spent")
+def test_budget_list_spent(benchmark, user, spending):
+    from budget.models import Budget
+    from budget.serializers import BudgetListSerializer
+
+    data = benchmark(lambda: BudgetListSerializer(Budget.objects.filter(user=user)).data)
+    assert {item["spent_amount"] for item in data} == {"1234.00"}
@@ -0,0 +1,25 @@
+"""Cost of bearer-token authentication on every API request."""
+
+import jwt
+from django.conf import settings
+
+from user.authentication import CustomTokenAuthentication
+
+
+def test_jwt_decode(benchmark, access_token):
+    benchmark(jwt.decode, access_token, settings.SECRET_KEY, algorithms=["HS256"])
+
+
+def test_authenticate(benchmark, access_token, make_request):
+    request = make_request(HTTP_AUTHORIZATION=f"Bearer {access_token}")
+    authentication = CustomTokenAuthentication()
+
+    result = benchmark(authentication.authenticate, request)
+    assert result is not None
+
+
+def test_authenticate_missing_header(benchmark, make_request):
+    request = make_request()
+    authentication = CustomTokenAuthentication()
+
+    assert benchmark(authentication.authenticate, request) is None
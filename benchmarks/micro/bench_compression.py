@@ -0,0 +1,34 @@
+"""CPU cost vs bytes saved when compressing TransactionListCreateView payloads."""
+
+import pytest
+
+SIZES = [100, 1_000]
+CASES = [("gzip", 1), ("gzip", 6), ("gzip", 9), ("br", 4), ("br", 11), ("zstd", 3), ("zstd", 10)]
+
+
+@pytest.fixture
+def payload(make_transactions):
+    from transaction.serializers import TransactionSerializer
+    from utils.renderers import FastJSONRenderer
+
+    def _make(size):
+        data = TransactionSerializer(make_transactions(size), many=True).data
+        return FastJSONRenderer().render({"data": data})
+
+    return _make
+
+
+@pytest.mark.benchmark(group="compression")
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("encoding,level", CASES)
+def test_compress(benchmark, payload, size, encoding, level):
+    from utils.compression import available_encodings, compress_bytes
+
+    if encoding not in available_encodings():
+        pytest.skip(f"{encoding} support is not installed")
+
+    body = payload(size)
+    compressed = benchmark(compress_bytes, encoding, body, level)
+    benchmark.extra_info["original_bytes"] = len(body)
+    benchmark.extra_info["compressed_bytes"] = len(compressed)
+    benchmark.extra_info["saved_ratio"] = round(1 - len(compressed) / len(body), 4)
@@ -0,0 +1,71 @@
+"""DRF ModelSerializer list path vs the values_list fast path at 10k rows."""
+
+import pytest
+
+ROWS = 10_000
+
+
+@pytest.fixture
+def saved_transactions(make_transactions):
+    from transaction.models import Transaction
+
+    Transaction.objects.bulk_create(make_transactions(ROWS), batch_size=2_000)
+    return Transaction.objects.filter(is_deleted=False)
+
+
+@pytest.fixture
+def saved_categories(make_categories):
+    from category.models import Category
+
+    Category.objects.bulk_create(make_categories(ROWS), batch_size=2_000)
+    return Category.objects.filter(is_deleted=False)
+
+
+@pytest.mark.benchmark(group="transaction-list-10k")
+def test_transaction_list_drf(benchmark, saved_transactions):
+    from transaction.serializers import TransactionSerializer
+
+    benchmark.pedantic(
+        lambda: TransactionSerializer(saved_transactions.all(), many=True).data,
+        rounds=5,
+        iterations=1,
+    )
+
+
+@pytest.mark.benchmark(group="transaction-list-10k")
+def test_transaction_list_fast(benchmark, saved_transactions):
+    from transaction.serializers import TransactionListSerializer, TransactionSerializer
+
+    expected = TransactionSerializer(saved_transactions.order_by("id"), many=True).data
+    assert TransactionListSerializer(saved_transactions.order_by("id")).data == [
+        {key: str(value) if key in ("user", "category") else value for key, value in row.items()}
+        for row in expected
+    ]
+
+    benchmark.pedantic(
+        lambda: TransactionListSerializer(saved_transactions.all()).data,
+        rounds=5,
+        iterations=1,
+    )
+
+
+@pytest.mark.benchmark(group="category-list-10k")
+def test_category_list_drf(benchmark, saved_categories):
+    from category.serializers import CategorySerializer
+
+    benchmark.pedantic(
+        lambda: CategorySerializer(saved_categories.all(), many=True).data,
+        rounds=5,
+        iterations=1,
+    )
+
+
+@pytest.mark.benchmark(group="category-list-10k")
+def test_category_list_fast(benchmark, saved_categories):
+    from category.serializers import CategoryListSerializer
+
+    benchmark.pedantic(
+        lambda: CategoryListSerializer(saved_categories.all()).data,
+        rounds=5,
+        iterations=1,
+    )
@@ -0,0 +1,42 @@
+"""Caller-side cost of a log call: synchronous file handler vs the queued JSON pipeline."""
+
+import logging
+
+import pytest
+
+
+@pytest.fixture
+def make_logger(tmp_path):
+    from utils.logging import JSONFormatter, QueueListenerHandler, RedactTokensFilter
+
+    created = []
+
+    def _make(mode):
+        file_handler = logging.FileHandler(tmp_path / f"{mode}.log")
+        file_handler.setFormatter(JSONFormatter() if mode == "queued" else logging.Formatter(
+            "%(asctime)s [%(levelname)s] %(message)s"
+        ))
+        if mode == "queued":
+            handler = QueueListenerHandler([file_handler])
+            handler.addFilter(RedactTokensFilter())
+        else:
+            handler = file_handler
+        logger = logging.getLogger(f"bench.logging.{mode}")
+        logger.propagate = False
+        logger.handlers = [handler]
+        logger.setLevel(logging.INFO)
+        created.append(handler)
+        return logger
+
+    yield _make
+    for handler in created:
+        if hasattr(handler, "listener"):
+            handler.listener.stop()
+        handler.close()
+
+
+@pytest.mark.benchmark(group="logging")
+@pytest.mark.parametrize("mode", ["sync-file", "queued"])
+def test_log_call(benchmark, make_logger, mode):
+    logger = make_logger(mode)
+    benchmark(logger.info, "Invalidated %s tokens for user %s.", 3, "bench_user")
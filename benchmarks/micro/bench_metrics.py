@@ -0,0 +1,37 @@
+"""Overhead of the Prometheus instrumentation on a request and on its hot-path hooks."""
+
+import pytest
+
+pytest.importorskip("prometheus_client")
+
+
+@pytest.mark.benchmark(group="metrics-request")
+@pytest.mark.parametrize("enabled", [False, True], ids=["off", "on"])
+def test_api_request(benchmark, db, monkeypatch, enabled):
+    from django.test import Client
+
+    from utils import metrics
+
+    monkeypatch.setattr(metrics, "ENABLED", enabled)
+    client = Client()
+
+    response = benchmark(client.get, "/api/categories/")
+    assert response.status_code == 401
+
+
+@pytest.mark.benchmark(group="metrics-hooks")
+def test_count_cache_lookup(benchmark):
+    from utils.metrics import count_cache_lookup
+
+    benchmark(count_cache_lookup, "response", "l1_hit")
+
+
+@pytest.mark.benchmark(group="metrics-hooks")
+def test_scrape(benchmark, db, rf, settings):
+    from utils.metrics import metrics_view
+
+    settings.METRICS = {**settings.METRICS, "TOKEN": "scrape-token"}
+    request = rf.get("/metrics", HTTP_AUTHORIZATION="Bearer scrape-token")
+    response = benchmark(metrics_view, request)
+    assert response.status_code == 200
+
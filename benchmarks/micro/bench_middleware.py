@@ -0,0 +1,54 @@
+"""Per-request middleware overhead on /api/ routes, stock stack vs lean stack."""
+
+import pytest
+
+STACKS = ["stock", "lean"]
+
+
+def stock_middleware(middleware):
+    """``middleware`` with each ``Lean*`` class replaced by the Django one it wraps."""
+    from django.utils.module_loading import import_string
+
+    from utils.middleware import LeanPathMixin
+
+    stack = []
+    for path in middleware:
+        cls = import_string(path)
+        if issubclass(cls, LeanPathMixin):
+            base = next(base for base in cls.__bases__ if base is not LeanPathMixin)
+            path = f"{base.__module__}.{base.__qualname__}"
+        stack.append(path)
+    return stack
+
+
+@pytest.fixture
+def make_client(settings):
+    from django.test import Client
+
+    def _make(stack):
+        if stack == "stock":
+            settings.MIDDLEWARE = stock_middleware(settings.MIDDLEWARE)
+        # The handler builds its middleware chain on the first request
+        return Client()
+
+    return _make
+
+
+@pytest.mark.benchmark(group="middleware-unauthenticated")
+@pytest.mark.parametrize("stack", STACKS)
+def test_api_request_unauthenticated(benchmark, db, make_client, stack):
+    client = make_client(stack)
+
+    response = benchmark(client.get, "/api/categories/")
+    assert response.status_code == 401
+
+
+@pytest.mark.benchmark(group="middleware-authenticated")
+@pytest.mark.parametrize("stack", STACKS)
+def test_api_request_authenticated(benchmark, access_token, category, make_client, stack):
+    client = make_client(stack)
+
+    response = benchmark(
+        client.get, f"/api/categories/{category.id}/", HTTP_AUTHORIZATION=f"Bearer {access_token}"
+    )
+    assert response.status_code == 200
@@ -0,0 +1,69 @@
+"""
+Monthly spending aggregate: date__year/date__month (EXTRACT) vs the
+half-open date range from ``utils.periods``. transaction/tests.py checks
+that both return the same total and that the range form uses the
+(user, category, date) index.
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+import uuid
+
+import pytest
+
+ROWS = 10_000
+MONTHS = 24
+
+
+@pytest.fixture
+def spread_transactions(user, category):
+    """Transactions spread evenly over the last ``MONTHS`` months."""
+    from django.db import connection
+    from django.utils import timezone
+
+    from transaction.models import Transaction
+
+    now = timezone.now()
+    step = timedelta(days=MONTHS * 30) / ROWS
+    Transaction.objects.bulk_create(
+        (
+            Transaction(
+                id=uuid.uuid4(),
+                user=user,
+                category=category,
+                amount=Decimal("10.00"),
+                date=now - step * i,
+                type="debit",
+            )
+            for i in range(ROWS)
+        ),
+        batch_size=2_000,
+    )
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE "{Transaction._meta.db_table}"')
+    return timezone.localtime(now - timedelta(days=180))
+
+
+def _month_total(user, category, **period):
+    from django.db.models import Sum
+
+    from transaction.models import Transaction
+
+    return Transaction.objects.filter(user=user, category=category, **period).aggregate(
+        total=Sum("amount")
+    )["total"]
+
+
+@pytest.mark.benchmark(group="month-spent-aggregate")
+def test_month_total_extract(benchmark, user, category, spread_transactions):
+    month = spread_transactions
+    benchmark(_month_total, user, category, date__year=month.year, date__month=month.month)
+
+
+@pytest.mark.benchmark(group="month-spent-aggregate")
+def test_month_total_range(benchmark, user, category, spread_transactions):
+    from utils.periods import period_filter
+
+    month = spread_transactions
+    benchmark(_month_total, user, category, **period_filter(month.year, month.month))
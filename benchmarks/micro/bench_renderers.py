@@ -0,0 +1,53 @@
+"""Render time of the JSON envelope for large transaction lists."""
+
+import pytest
+
+SIZES = [100, 10_000]
+
+
+@pytest.fixture
+def envelope(make_transactions):
+    from transaction.serializers import TransactionSerializer
+
+    def _make(size):
+        return {"data": TransactionSerializer(make_transactions(size), many=True).data}
+
+    return _make
+
+
+@pytest.mark.benchmark(group="render")
+@pytest.mark.parametrize("size", SIZES)
+def test_render_drf(benchmark, envelope, size):
+    from rest_framework.renderers import JSONRenderer
+
+    data = envelope(size)
+    benchmark(JSONRenderer().render, data)
+
+
+@pytest.mark.benchmark(group="render")
+@pytest.mark.parametrize("size", SIZES)
+def test_render_fast(benchmark, envelope, size):
+    from rest_framework.renderers import JSONRenderer
+    from utils.renderers import FastJSONRenderer
+
+    data = envelope(size)
+    assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+    benchmark(FastJSONRenderer().render, data)
+
+
+@pytest.mark.benchmark(group="parse")
+def test_parse_drf(benchmark):
+    import io
+    from rest_framework.parsers import JSONParser
+
+    body = b'{"amount": "125.50", "type": "debit", "description": "Weekly groceries"}'
+    benchmark(lambda: JSONParser().parse(io.BytesIO(body)))
+
+
+@pytest.mark.benchmark(group="parse")
+def test_parse_fast(benchmark):
+    import io
+    from utils.parsers import FastJSONParser
+
+    body = b'{"amount": "125.50", "type": "debit", "description": "Weekly groceries"}'
+    benchmark(lambda: FastJSONParser().parse(io.BytesIO(body)))
@@ -0,0 +1,26 @@
+"""Cost of the envelope helpers in utils/responses.py."""
+
+from transaction.serializers import TransactionSerializer
+from utils.responses import success_response, validation_error_response
+
+
+def test_validation_error_response_serializer_errors(benchmark, make_request):
+    serializer = TransactionSerializer(
+        data={"amount": "-1", "type": "debit"}, context={"request": make_request("post")}
+    )
+    serializer.is_valid()
+    errors = serializer.errors
+
+    benchmark(validation_error_response, errors)
+
+
+def test_validation_error_response_plain_dict(benchmark):
+    errors = {"detail": ["Invalid or expired token."], "name": "Required"}
+
+    benchmark(validation_error_response, errors)
+
+
+def test_success_response(benchmark, make_transactions):
+    data = TransactionSerializer(make_transactions(100), many=True).data
+
+    benchmark(success_response, data)
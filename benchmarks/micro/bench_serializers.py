@@ -0,0 +1,104 @@
+"""Serialization and validation cost of the model serializers."""
+
+from datetime import datetime
+
+import pytest
+
+from budget.serializers import BudgetSerializer
+from category.serializers import CategorySerializer
+from conftest import SIZES
+from transaction.serializers import TransactionSerializer
+from user.serializers import UserSerializer
+
+
+def run(benchmark, fn, size):
+    """Large inputs get a fixed number of rounds so the suite stays bounded."""
+    if size >= 10_000:
+        return benchmark.pedantic(fn, rounds=5, iterations=1)
+    return benchmark(fn)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_transaction_serialize(benchmark, make_transactions, size):
+    transactions = make_transactions(size)
+    run(benchmark, lambda: TransactionSerializer(transactions, many=True).data, size)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_budget_serialize(benchmark, make_budgets, make_request, size):
+    budgets = make_budgets(size)
+    context = {"request": make_request()}
+    run(benchmark, lambda: BudgetSerializer(budgets, many=True, context=context).data, size)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_category_serialize(benchmark, make_categories, size):
+    categories = make_categories(size)
+    run(benchmark, lambda: CategorySerializer(categories, many=True).data, size)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_user_serialize(benchmark, make_users, size):
+    users = make_users(size)
+    run(benchmark, lambda: UserSerializer(users, many=True).data, size)
+
+
+def test_transaction_validate(benchmark, user, category, make_request):
+    payload = {
+        "user": str(user.id),
+        "category": str(category.id),
+        "amount": "125.50",
+        "date": datetime.now().isoformat(),
+        "description": "Weekly groceries",
+        "type": "debit",
+    }
+    context = {"request": make_request("post")}
+
+    def validate():
+        serializer = TransactionSerializer(data=payload, context=context)
+        assert serializer.is_valid(), serializer.errors
+
+    benchmark(validate)
+
+
+def test_budget_validate(benchmark, user, category, make_request):
+    today = datetime.now()
+    payload = {
+        "amount": "5000.00",
+        "month_year": f"{today.month:02d}-{today.year}",
+        "user": str(user.id),
+        "category": str(category.id),
+    }
+    context = {"request": make_request("post")}
+
+    def validate():
+        serializer = BudgetSerializer(data=payload, context=context)
+        assert serializer.is_valid(), serializer.errors
+
+    benchmark(validate)
+
+
+def test_category_validate(benchmark, user, make_request):
+    payload = {"name": "Rent", "type": "debit", "user": str(user.id)}
+    context = {"request": make_request("post")}
+
+    def validate():
+        serializer = CategorySerializer(data=payload, context=context)
+        assert serializer.is_valid(), serializer.errors
+
+    benchmark(validate)
+
+
+def test_user_validate(benchmark, db):
+    payload = {
+        "username": "new_user",
+        "email": "new_user@example.com",
+        "password": "Str0ng#Password",
+        "name": "New User",
+    }
+
+    def validate():
+        serializer = UserSerializer(data=payload)
+        assert serializer.is_valid(), serializer.errors
+
+    benchmark(validate)
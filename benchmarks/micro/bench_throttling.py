@@ -0,0 +1,33 @@
+"""Cost of one token-bucket throttle check, in-process and in Redis."""
+
+import pytest
+
+
+@pytest.mark.benchmark(group="throttling")
+def test_local_bucket(benchmark):
+    from utils.throttling import LocalBuckets, parse_rate
+
+    buckets = LocalBuckets(max_buckets=1000)
+    capacity, refill = parse_rate("1000000/s")
+    allowed, _ = benchmark(buckets.consume, "read:user:1", capacity, refill)
+    assert allowed
+
+
+@pytest.mark.benchmark(group="throttling")
+def test_redis_bucket(benchmark, settings):
+    from django.core.cache import caches
+
+    from utils.throttling import TokenBuckets, parse_rate
+
+    if not hasattr(getattr(caches["default"], "_cache", None), "get_client"):
+        pytest.skip("default cache is not Redis")
+    buckets = TokenBuckets()
+    capacity, refill = parse_rate("1000000/s")
+    try:
+        caches["default"].get("throttle-bench")
+    except Exception:
+        pytest.skip("Redis is not reachable")
+
+    allowed, _ = benchmark(buckets.consume, "read:user:bench", capacity, refill)
+    assert allowed
+
@@ -0,0 +1,50 @@
+"""Cost of tracing hooks inside unsampled and sampled traces."""
+
+import pytest
+
+
+@pytest.fixture
+def trace(settings):
+    from utils import tracing
+
+    def _start(sampled):
+        traceparent = f"00-{'a' * 32}-{'b' * 16}-{'01' if sampled else '00'}"
+        return tracing.start_trace("bench", traceparent)
+
+    started = []
+
+    def _make(sampled):
+        started.append(_start(sampled))
+
+    yield _make
+    for root, token in reversed(started):
+        tracing._current.reset(token)
+
+
+def _open_span():
+    from utils.tracing import span
+
+    with span("bench.child", key="value"):
+        pass
+
+
+@pytest.mark.benchmark(group="tracing-span")
+@pytest.mark.parametrize("sampled", [False, True], ids=["unsampled", "sampled"])
+def test_span(benchmark, trace, sampled):
+    trace(sampled)
+    benchmark(_open_span)
+
+
+@pytest.mark.benchmark(group="tracing-request")
+@pytest.mark.parametrize("rate", [0.0, 1.0])
+def test_api_request(benchmark, db, settings, rate):
+    from django.test import Client
+
+    from utils.tracing import sampler
+
+    settings.TRACING = {**settings.TRACING, "SAMPLE_RATE": rate}
+    sampler._rate = None
+    client = Client()
+
+    response = benchmark(client.get, "/api/categories/")
+    assert response.status_code == 401
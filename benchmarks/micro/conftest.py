@@ -0,0 +1,143 @@
+"""
+Shared fixtures for the serializer, auth and response microbenchmarks.
+
+Objects that are only serialized are built in memory; objects that
+validators or the authentication class look up are saved to the test DB.
+Project imports live inside the fixtures so a plain ``pytest`` run from the
+repository root can skip this directory without configuring Django.
+"""
+
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+import uuid
+
+import pytest
+
+
+SIZES = [1, 100, 10_000]
+
+
+@pytest.fixture(autouse=True)
+def no_throttling(settings):
+    """Benchmarks repeat one request far past any bucket (utils.throttling)."""
+    settings.THROTTLING = {**settings.THROTTLING, "ENABLED": False}
+
+
+@pytest.fixture
+def user(db):
+    from user.models import CustomUser
+
+    return CustomUser.objects.create_user(
+        email="bench@example.com",
+        username="bench_user",
+        password="Bench#2024pass",
+        name="Bench User",
+    )
+
+
+@pytest.fixture
+def category(user):
+    from category.models import Category
+
+    return Category.objects.create(name="Groceries", user=user, type="debit")
+
+
+@pytest.fixture
+def access_token(user):
+    from utils.token import TokenHandler
+
+    return TokenHandler.generate_tokens_for_user(user)["access_token"]
+
+
+@pytest.fixture
+def make_request(user):
+    """Build a Django request carrying ``user`` for serializer contexts."""
+    from rest_framework.test import APIRequestFactory
+
+    factory = APIRequestFactory()
+
+    def _make(method="get", path="/", **extra):
+        request = getattr(factory, method)(path, **extra)
+        request.user = user
+        return request
+
+    return _make
+
+
+@pytest.fixture
+def make_transactions(user, category):
+    from transaction.models import Transaction
+
+    def _make(count):
+        now = datetime.now(dt_timezone.utc)
+        return [
+            Transaction(
+                id=uuid.uuid4(),
+                user=user,
+                category=category,
+                amount=Decimal("125.50"),
+                date=now,
+                description="Weekly groceries",
+                type="debit",
+                created_at=now,
+                updated_at=now,
+            )
+            for _ in range(count)
+        ]
+
+    return _make
+
+
+@pytest.fixture
+def make_budgets(user, category):
+    from budget.models import Budget
+
+    def _make(count):
+        today = datetime.now()
+        return [
+            Budget(
+                id=uuid.uuid4(),
+                user=user,
+                category=category,
+                year=today.year,
+                month=today.month,
+                amount=Decimal("5000.00"),
+            )
+            for _ in range(count)
+        ]
+
+    return _make
+
+
+@pytest.fixture
+def make_categories(user):
+    from category.models import Category
+
+    def _make(count):
+        return [
+            Category(id=uuid.uuid4(), name=f"Category {i}", user=user, type="debit")
+            for i in range(count)
+        ]
+
+    return _make
+
+
+@pytest.fixture
+def make_users():
+    from user.models import CustomUser
+
+    def _make(count):
+        now = datetime.now(dt_timezone.utc)
+        return [
+            CustomUser(
+                id=uuid.uuid4(),
+                username=f"user_{i}",
+                email=f"user_{i}@example.com",
+                name="Bench",
+                created_at=now,
+                updated_at=now,
+            )
+            for i in range(count)
+        ]
+
+    return _make
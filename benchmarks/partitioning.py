@@ -0,0 +1,226 @@
+"""
+Before/after benchmark for monthly partitioning of the transactions table.
+
+Seeds a scratch PostgreSQL database with synthetic transactions spread over
+several years, then runs the app's monthly query shapes under
+EXPLAIN (ANALYZE, BUFFERS) and times VACUUM. Run ``measure`` once on the
+plain table and once after ``manage.py partition_transactions --convert``
+and compare the two result files. Point DATABASES at a throwaway database.
+
+    python -m benchmarks.partitioning seed --rows 50000000
+    python -m benchmarks.partitioning measure --save benchmarks/results/partitioning_before.json
+    python manage.py partition_transactions --convert
+    python -m benchmarks.partitioning measure --save benchmarks/results/partitioning_after.json
+    python -m benchmarks.partitioning compare benchmarks/results/partitioning_before.json benchmarks/results/partitioning_after.json
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime
+
+
+def _setup_django():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "expense_tracker.settings")
+    import django
+
+    django.setup()
+
+
+def seed(rows, users, years, chunk):
+    from django.db import connection
+
+    from category.models import Category
+    from transaction.models import Transaction
+    from user.models import CustomUser
+
+    run = uuid.uuid4().hex[:8]
+    owners = CustomUser.objects.bulk_create(
+        CustomUser(username=f"part_{run}_{i}", email=f"part_{run}_{i}@example.com", name="bench")
+        for i in range(users)
+    )
+    categories = Category.objects.bulk_create(
+        Category(name=f"bench-{run}", user=owner, type="debit") for owner in owners
+    )
+    # Parallel arrays so each generated row gets a matching user/category pair
+    user_ids = [str(owner.id) for owner in owners]
+    category_ids = [str(category.id) for category in categories]
+
+    table = Transaction._meta.db_table
+    inserted = 0
+    started = time.perf_counter()
+    while inserted < rows:
+        batch = min(chunk, rows - inserted)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO "{table}"
+                    (id, created_at, updated_at, is_deleted, user_id, category_id,
+                     amount, date, description, type)
+                SELECT gen_random_uuid(), now(), now(), random() < 0.02,
+                       (%s::uuid[])[k], (%s::uuid[])[k],
+                       floor(random() * 50000)::bigint,
+                       now() - random() * (%s || ' years')::interval, '', 'debit'
+                FROM (
+                    SELECT 1 + floor(random() * %s)::int AS k
+                    FROM generate_series(1, %s)
+                ) picks
+                """,
+                [user_ids, category_ids, str(years), users, batch],
+            )
+        inserted += batch
+        print(f"{inserted}/{rows} rows ({time.perf_counter() - started:.0f}s)", flush=True)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'ANALYZE "{table}"')
+
+
+def _walk(plan, relations):
+    if "Relation Name" in plan:
+        relations.add(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        _walk(child, relations)
+
+
+def _explain(queryset):
+    result = json.loads(queryset.explain(format="json", analyze=True, buffers=True))[0]
+    relations = set()
+    _walk(result["Plan"], relations)
+    top = result["Plan"]
+    return {
+        "execution_ms": result["Execution Time"],
+        "planning_ms": result["Planning Time"],
+        "relations_scanned": len(relations),
+        "shared_blocks": top.get("Shared Hit Blocks", 0) + top.get("Shared Read Blocks", 0),
+    }
+
+
+def query_shapes(user_id, category_id, year, month):
+    """The monthly queries the app issues, keyed by name."""
+    from django.db.models import Sum
+    from django.utils import timezone
+
+    from transaction.models import Transaction
+    from utils.periods import month_range
+
+    start, end = month_range(year, month)
+    live = Transaction.objects.all()
+    return {
+        # Budget spent amount as a date range (prunes to one partition)
+        "month_sum_range": live.filter(
+            user_id=user_id, category_id=category_id, date__gte=start, date__lt=end
+        ).values("user_id").annotate(total=Sum("amount")),
+        # Same aggregate with date__year/date__month (EXTRACT, never pruned)
+        "month_sum_extract": live.filter(
+            user_id=user_id, category_id=category_id, date__year=year, date__month=month
+        ).values("user_id").annotate(total=Sum("amount")),
+        # Transaction list for one month
+        "month_list": live.filter(user_id=user_id, date__gte=start, date__lt=end).order_by("-date")[:100],
+        # Recent-activity list across all months
+        "recent_list": live.filter(user_id=user_id, date__lte=timezone.now()).order_by("-date")[:100],
+    }
+
+
+def measure(samples, seed_value):
+    from django.db import connection
+    from django.utils import timezone
+
+    from transaction.models import Transaction
+    from transaction.partitioning import is_partitioned
+    from utils.periods import add_months
+
+    rng = random.Random(seed_value)
+    pairs = list(
+        Transaction.all_objects.values_list("user_id", "category_id").distinct()[:1000]
+    )
+    if not pairs:
+        sys.exit("no transactions found; run the seed command first")
+
+    now = timezone.localtime()
+    results = {}
+    for _ in range(samples):
+        user_id, category_id = rng.choice(pairs)
+        year, month = add_months(now.year, now.month, -rng.randrange(0, 24))
+        for name, queryset in query_shapes(user_id, category_id, year, month).items():
+            results.setdefault(name, []).append(_explain(queryset))
+
+    summary = {}
+    for name, runs in results.items():
+        times = sorted(run["execution_ms"] for run in runs)
+        summary[name] = {
+            "median_ms": round(times[len(times) // 2], 3),
+            "max_ms": round(times[-1], 3),
+            "relations_scanned": max(run["relations_scanned"] for run in runs),
+            "shared_blocks": sorted(run["shared_blocks"] for run in runs)[len(runs) // 2],
+        }
+
+    table = Transaction._meta.db_table
+    started = time.perf_counter()
+    with connection.cursor() as cursor:
+        cursor.execute(f'VACUUM (ANALYZE) "{table}"')
+    summary["vacuum"] = {"seconds": round(time.perf_counter() - started, 2)}
+
+    return {
+        "partitioned": is_partitioned(),
+        "rows": Transaction.all_objects.count(),
+        "measured_at": datetime.now().isoformat(timespec="seconds"),
+        "queries": summary,
+    }
+
+
+def compare(before, after):
+    print(f"{'query':<20} {'metric':<18} {'before':>12} {'after':>12} {'change':>8}")
+    for name, metrics in before["queries"].items():
+        for metric, old in metrics.items():
+            new = after["queries"].get(name, {}).get(metric)
+            if new is None:
+                continue
+            change = f"{(new - old) / old * 100:+.0f}%" if old else "-"
+            print(f"{name:<20} {metric:<18} {old:>12} {new:>12} {change:>8}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    seed_cmd = commands.add_parser("seed", help="insert synthetic transactions")
+    seed_cmd.add_argument("--rows", type=int, default=50_000_000)
+    seed_cmd.add_argument("--users", type=int, default=10_000)
+    seed_cmd.add_argument("--years", type=int, default=5)
+    seed_cmd.add_argument("--chunk", type=int, default=1_000_000)
+
+    measure_cmd = commands.add_parser("measure", help="EXPLAIN ANALYZE the monthly queries and time VACUUM")
+    measure_cmd.add_argument("--samples", type=int, default=50)
+    measure_cmd.add_argument("--seed", type=int, default=0)
+    measure_cmd.add_argument("--save", help="write the results to a JSON file")
+
+    compare_cmd = commands.add_parser("compare", help="compare two measure results")
+    compare_cmd.add_argument("before")
+    compare_cmd.add_argument("after")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        with open(args.before) as before, open(args.after) as after:
+            compare(json.load(before), json.load(after))
+        return
+
+    _setup_django()
+    if args.command == "seed":
+        seed(args.rows, args.users, args.years, args.chunk)
+        return
+
+    result = measure(args.samples, args.seed)
+    print(json.dumps(result, indent=2))
+    if args.save:
+        os.makedirs(os.path.dirname(args.save) or ".", exist_ok=True)
+        with open(args.save, "w") as fh:
+            json.dump(result, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Cold-start time and memory of freshly started web, worker and manage.py processes.
+
+Each sample runs the target in a new interpreter and reports the wall time
+to import it, the peak RSS and which heavy optional modules got loaded.
+Targets:
+
+* ``manage``: ``django.setup()``, which every ``manage.py`` command pays.
+* ``web``: ``expense_tracker.wsgi`` plus the URLconf, as resolved by the
+  first request (this imports every view module).
+* ``worker``: the Celery app with all task modules imported.
+
+Record a baseline, then fail when a change slows cold start beyond a
+tolerance or an absolute budget (exit status 1):
+
+    python -m benchmarks.startup --save benchmarks/results/startup.json
+    python -m benchmarks.startup --check benchmarks/results/startup.json --tolerance 0.15 --budget web=1500
+
+Compare configurations, e.g. the API docs UI on and off:
+
+    API_DOCS_ENABLED=1 python -m benchmarks.startup --label docs-on --save benchmarks/results/startup_docs_on.json
+    API_DOCS_ENABLED=0 python -m benchmarks.startup --label docs-off --save benchmarks/results/startup_docs_off.json
+    python -m benchmarks.startup --compare benchmarks/results/startup_*.json
+
+Show where import time goes (``python -X importtime``), largest cumulative first:
+
+    python -m benchmarks.startup --importtime 25 --targets web
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+TARGETS = {
+    "manage": {
+        "code": "import django\ndjango.setup()",
+        "env": {},
+    },
+    "web": {
+        "code": "import expense_tracker.wsgi\nfrom django.urls import get_resolver\nget_resolver().url_patterns",
+        "env": {"DJANGO_PROCESS_TYPE": "web"},
+    },
+    "worker": {
+        "code": "import django\ndjango.setup()\nfrom expense_tracker.celery import app\napp.loader.import_default_modules()",
+        "env": {"DJANGO_PROCESS_TYPE": "worker"},
+    },
+}
+
+# Optional dependencies that should load only where they are used
+HEAVY_MODULES = ["drf_yasg", "sendgrid", "django_celery_beat", "numpy"]
+
+PROBE = """
+import json, resource, sys, time
+started = time.perf_counter()
+{code}
+seconds = time.perf_counter() - started
+print(json.dumps({{
+    "seconds": seconds,
+    "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "modules": len(sys.modules),
+    "heavy": [name for name in {heavy!r} if name in sys.modules],
+}}))
+"""
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def _run(target, *flags):
+    env = {**os.environ, **TARGETS[target]["env"]}
+    env.setdefault("DJANGO_SETTINGS_MODULE", "expense_tracker.settings")
+    code = PROBE.format(code=TARGETS[target]["code"], heavy=HEAVY_MODULES)
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code], env=env, check=True, capture_output=True, text=True
+    )
+
+
+def sample(target):
+    return json.loads(_run(target).stdout.strip().splitlines()[-1])
+
+
+def measure(target, samples):
+    sample(target)  # warm the filesystem cache and bytecode
+    runs = [sample(target) for _ in range(samples)]
+    seconds = sorted(run["seconds"] for run in runs)
+    return {
+        "target": target,
+        "samples": samples,
+        "median_ms": round(statistics.median(seconds) * 1000, 1),
+        "max_ms": round(seconds[-1] * 1000, 1),
+        "max_rss_mb": round(max(run["max_rss_kb"] for run in runs) / 1024, 1),
+        "modules": runs[-1]["modules"],
+        "heavy_modules": runs[-1]["heavy"],
+    }
+
+
+def importtime(target, top):
+    """Modules with the largest cumulative import time, in milliseconds."""
+    rows = []
+    for line in _run(target, "-X", "importtime").stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((int(cumulative_us) / 1000, int(self_us) / 1000, len(indent) // 2, name))
+    rows.sort(reverse=True)
+    print(f"{target}: top {top} imports by cumulative time")
+    print(f"  {'cumulative':>10}  {'self':>8}  module")
+    for cumulative_ms, self_ms, depth, name in rows[:top]:
+        print(f"  {cumulative_ms:>8.1f}ms  {self_ms:>6.1f}ms  {'  ' * depth}{name}")
+
+
+def check(result, baseline_path, tolerance, budgets):
+    """Failures against a saved baseline (relative) and per-target budgets (ms)."""
+    failures = []
+    baseline = {}
+    if baseline_path:
+        with open(baseline_path) as fh:
+            baseline = {row["target"]: row for row in json.load(fh)["targets"]}
+    for row in result["targets"]:
+        target, median = row["target"], row["median_ms"]
+        if target in baseline:
+            limit = baseline[target]["median_ms"] * (1 + tolerance)
+            if median > limit:
+                failures.append(
+                    f"{target}: {median} ms exceeds baseline {baseline[target]['median_ms']} ms "
+                    f"+{tolerance:.0%} ({limit:.1f} ms)"
+                )
+        if target in budgets and median > budgets[target]:
+            failures.append(f"{target}: {median} ms exceeds budget {budgets[target]} ms")
+    return failures
+
+
+def compare(paths):
+    for path in paths:
+        with open(path) as fh:
+            result = json.load(fh)
+        for row in result["targets"]:
+            print(
+                f"{result['label']:<16} {row['target']:<8} {row['median_ms']:>8} ms  "
+                f"{row['max_rss_mb']:>7} MB  {row['modules']:>5} modules  "
+                f"heavy={','.join(row['heavy_modules']) or '-'}"
+            )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--targets", default=",".join(TARGETS), help="comma-separated targets")
+    parser.add_argument("--samples", type=int, default=10)
+    parser.add_argument("--label", default="default", help="name of the configuration under test")
+    parser.add_argument("--save", help="write this run's result to a JSON file")
+    parser.add_argument("--compare", nargs="+", metavar="RESULT", help="compare saved results")
+    parser.add_argument("--importtime", type=int, metavar="N", help="print the N slowest imports")
+    parser.add_argument("--check", metavar="BASELINE", help="fail if slower than a saved result")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="allowed slowdown vs --check")
+    parser.add_argument(
+        "--budget", action="append", default=[], metavar="TARGET=MS", help="absolute limit per target"
+    )
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(args.compare)
+        return
+
+    targets = args.targets.split(",")
+    if args.importtime:
+        for target in targets:
+            importtime(target, args.importtime)
+        return
+
+    result = {
+        "label": args.label,
+        "targets": [measure(target, args.samples) for target in targets],
+    }
+    print(json.dumps(result, indent=2))
+    if args.save:
+        os.makedirs(os.path.dirname(args.save) or ".", exist_ok=True)
+        with open(args.save, "w") as fh:
+            json.dump(result, fh, indent=2)
+
+    budgets = {target: float(ms) for target, ms in (item.split("=", 1) for item in args.budget)}
+    if args.check or budgets:
+        failures = check(result, args.check, args.tolerance, budgets)
+        for failure in failures:
+            print(f"FAIL {failure}")
+        if failures:
+            sys.exit(1)
+        print("cold start within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Insert throughput and primary-key index bloat with UUIDv4 vs UUIDv7 keys.
+
+Creates two scratch tables shaped like the transactions table (UUID primary
+key plus a few columns), fills each with the same number of rows using keys
+from ``uuid.uuid4`` and ``utils.models.uuid7`` respectively, and reports
+rows/s, primary-key index size, and leaf density / fragmentation when the
+``pgstattuple`` extension is available. Point DATABASES at a throwaway
+PostgreSQL database; the tables are dropped afterwards unless ``--keep``.
+
+    python -m benchmarks.uuid_keys --rows 10000000
+    python -m benchmarks.uuid_keys --rows 1000000 --save benchmarks/results/uuid_keys.json
+"""
+
+import argparse
+import json
+import os
+import time
+import uuid
+
+
+def _setup_django():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "expense_tracker.settings")
+    import django
+
+    django.setup()
+
+
+def _index_stats(cursor, table):
+    index = f"{table}_pkey"
+    cursor.execute("SELECT pg_relation_size(%s::regclass), pg_relation_size(%s::regclass)", [index, table])
+    index_bytes, table_bytes = cursor.fetchone()
+    stats = {"index_mb": round(index_bytes / 2**20, 1), "table_mb": round(table_bytes / 2**20, 1)}
+    cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pgstattuple'")
+    if cursor.fetchone() is None:
+        stats["pgstattuple"] = "not installed (CREATE EXTENSION pgstattuple)"
+        return stats
+    cursor.execute("SELECT leaf_pages, avg_leaf_density, leaf_fragmentation FROM pgstatindex(%s)", [index])
+    leaf_pages, density, fragmentation = cursor.fetchone()
+    stats.update(leaf_pages=leaf_pages, avg_leaf_density=density, leaf_fragmentation=fragmentation)
+    return stats
+
+
+def run(name, make_id, rows, batch, keep):
+    from django.db import connection, transaction
+
+    table = f"bench_uuid_{name}"
+    with connection.cursor() as cursor:
+        cursor.execute(f'DROP TABLE IF EXISTS "{table}"')
+        cursor.execute(
+            f'CREATE TABLE "{table}" (id uuid PRIMARY KEY, user_id uuid NOT NULL, '
+            f"amount bigint NOT NULL, date timestamptz NOT NULL DEFAULT now())"
+        )
+
+    user_id = str(uuid.uuid4())
+    inserted = 0
+    batch_rates = []
+    started = time.perf_counter()
+    while inserted < rows:
+        size = min(batch, rows - inserted)
+        ids = [str(make_id()) for _ in range(size)]
+        batch_started = time.perf_counter()
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO "{table}" (id, user_id, amount) '
+                f"SELECT unnest(%s::uuid[]), %s, 1234",
+                [ids, user_id],
+            )
+        batch_rates.append(size / (time.perf_counter() - batch_started))
+        inserted += size
+    elapsed = time.perf_counter() - started
+
+    with connection.cursor() as cursor:
+        stats = _index_stats(cursor, table)
+        if not keep:
+            cursor.execute(f'DROP TABLE "{table}"')
+
+    tail = batch_rates[-max(1, len(batch_rates) // 10):]
+    return {
+        "rows": rows,
+        "seconds": round(elapsed, 1),
+        "rows_per_s": round(rows / elapsed),
+        # Throughput over the last 10% of batches, once the index no longer fits in cache
+        "rows_per_s_tail": round(sum(tail) / len(tail)),
+        **stats,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--batch", type=int, default=100_000)
+    parser.add_argument("--keep", action="store_true", help="keep the scratch tables")
+    parser.add_argument("--save", help="write the results to a JSON file")
+    args = parser.parse_args(argv)
+
+    _setup_django()
+    from utils.models import uuid7
+
+    results = {}
+    for name, make_id in (("v4", uuid.uuid4), ("v7", uuid7)):
+        results[name] = run(name, make_id, args.rows, args.batch, args.keep)
+        print(name, json.dumps(results[name]), flush=True)
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.save) or ".", exist_ok=True)
+        with open(args.save, "w") as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
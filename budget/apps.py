@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class BudgetConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "budget"
+
+    def ready(self):
+        from utils.versioning import track_writes
+        from .models import Budget
+
+        track_writes(Budget)
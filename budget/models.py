@@ -1,8 +1,10 @@
 from decimal import Decimal
 from django.db import models
+from django.db.models import Q
 from django.core.validators import MinValueValidator, MaxValueValidator
 from user.models import CustomUser
 from category.models import Category
+from utils.amounts import MinorUnitDecimalField
 from utils.models import BaseModel
 from datetime import timedelta
 
@@ -34,7 +36,7 @@ class Budget(BaseModel):
             MaxValueValidator(12),
         ]
     )
-    amount = models.DecimalField(
+    amount = MinorUnitDecimalField(
         max_digits=10, decimal_places=2, validators=[MinValueValidator(Decimal("0.01"))]
     )
 
@@ -43,6 +45,13 @@ class Budget(BaseModel):
     # Track if spending was previously below warning threshold
     was_below_warning = models.BooleanField(default=True)
 
-    class Meta:
+    class Meta(BaseModel.Meta):
         ordering = ["-year", "-month"]
-        unique_together = ["user", "category", "year", "month", "is_deleted"]
+        constraints = [
+            # One live budget per category and month; deleted rows may repeat
+            models.UniqueConstraint(
+                fields=["user", "category", "year", "month"],
+                condition=Q(is_deleted=False),
+                name="budget_unique_live_period",
+            ),
+        ]
@@ -1,15 +1,22 @@
+import logging
 from datetime import date
-from decimal import Decimal
 from django.db.models import Sum
 from rest_framework import serializers
 from .models import Budget
 from user.models import CustomUser
 from category.models import Category
 from transaction.models import Transaction  # Import Transaction model
+from transaction.archive import spending_sources
 from rest_framework.exceptions import ValidationError
+from utils.amounts import from_minor, minor_units, sum_minor
+from utils.periods import period_filter, period_index, periods_q
+from utils.serialization import ValuesListSerializer, decimal_converter, uuid_converter
+from utils.tracing import TracedValidationMixin
 
+logger = logging.getLogger(__name__)
 
-class BudgetSerializer(serializers.ModelSerializer):
+
+class BudgetSerializer(TracedValidationMixin, serializers.ModelSerializer):
     month_year = serializers.CharField(write_only=True)
     spent_amount = serializers.SerializerMethodField()
 
@@ -109,9 +116,7 @@ class BudgetSerializer(serializers.ModelSerializer):
                     "Staff members cannot create budgets for themselves"
                 )
 
-            target_user = CustomUser.objects.filter(
-                id=target_user_id, is_active=True
-            ).first()
+            target_user = CustomUser.objects.active().filter(id=target_user_id).first()
             if not target_user:
                 raise ValidationError("Target user must be active")
         else:
@@ -131,7 +136,6 @@ class BudgetSerializer(serializers.ModelSerializer):
                 category=data["category"],
                 year=self._validated_year,
                 month=self._validated_month,
-                is_deleted=False,
             ).exists()
 
             if existing_budget:
@@ -149,8 +153,7 @@ class BudgetSerializer(serializers.ModelSerializer):
         validated_data.pop("month_year", None)
         validated_data["month"] = self._validated_month
         validated_data["year"] = self._validated_year
-        print(self._validated_month)
-        print(self._validated_year)
+        logger.debug("Creating budget for %s-%s", self._validated_month, self._validated_year)
 
         # Create the budget
         budget = super().create(validated_data)
@@ -170,13 +173,69 @@ class BudgetSerializer(serializers.ModelSerializer):
 
     def get_spent_amount(self, obj):
         """Get current spent amount for budget"""
-        from transaction.models import Transaction
-
-        spent = Transaction.objects.filter(
-            user=obj.user,
-            category=obj.category,
-            date__year=obj.year,
-            date__month=obj.month,
-            is_deleted=False,
-        ).aggregate(total=Sum("amount"))["total"] or Decimal("0.00")
-        return str(spent)
+        spent = sum(
+            sum_minor(
+                source.filter(
+                    user=obj.user,
+                    category=obj.category,
+                    **period_filter(obj.year, obj.month),
+                )
+            )
+            for source in spending_sources(obj.year, obj.month)
+        )
+        return str(from_minor(spent))
+
+
+class BudgetListSerializer(ValuesListSerializer):
+    """
+    Read-only list output identical to ``BudgetSerializer(many=True)``.
+    Spent amounts for the whole page come from one grouped aggregate instead
+    of one query per budget.
+    """
+
+    fields = (
+        ("id", "id", uuid_converter),
+        ("amount", "amount", decimal_converter(2)),
+        ("user", "user_id", uuid_converter),
+        ("category", "category_id", uuid_converter),
+        ("spent_amount", None, None),
+        ("year", "year", None),
+        ("month", "month", None),
+        ("is_deleted", "is_deleted", None),
+    )
+
+    @property
+    def data(self):
+        items = super().data
+        if not items:
+            return items
+
+        # The archive is only queried when some listed period may be archived
+        sources = {Transaction: Transaction.objects.all()}
+        for item in items:
+            sources.update(
+                (source.model, source) for source in spending_sources(item["year"], item["month"])
+            )
+
+        # Date ranges rather than EXTRACT so the (user, category, date) index applies
+        periods = sorted({(item["year"], item["month"]) for item in items})
+        spent = {}
+        for source in sources.values():
+            totals = (
+                source.filter(
+                    periods_q(periods),
+                    user_id__in={item["user"] for item in items},
+                    category_id__in={item["category"] for item in items},
+                )
+                .annotate(period=period_index(periods))
+                .values_list("user_id", "category_id", "period")
+                .annotate(total=Sum(minor_units()))
+            )
+            for user_id, category_id, period, total in totals:
+                key = (str(user_id), str(category_id), *periods[period])
+                spent[key] = spent.get(key, 0) + int(total)
+
+        for item in items:
+            key = (item["user"], item["category"], item["year"], item["month"])
+            item["spent_amount"] = str(from_minor(spent.get(key, 0)))
+        return items
@@ -1,8 +1,12 @@
+import logging
 
-from rest_framework.views import APIView
+from asgiref.sync import sync_to_async
 from rest_framework.permissions import IsAuthenticated
-from django.shortcuts import get_object_or_404
+from django.shortcuts import aget_object_or_404, get_object_or_404
+from utils.async_views import AsyncReadAPIView
 from utils.permissions import IsStaffOrOwner
+from utils.versioning import conditional_get
+from utils.response_cache import cache_response
 from utils.responses import (
     success_response,
     success_single_response,
@@ -15,26 +19,32 @@ from utils.responses import (
     
 )
 from .models import Budget
-from .serializers import BudgetSerializer
+from .serializers import BudgetSerializer, BudgetListSerializer
 from rest_framework import status
 from category.models import Category
 from django.db.models import Q
 from datetime import datetime
 
-class BudgetListCreateView(APIView):
+logger = logging.getLogger(__name__)
+
+class BudgetListCreateView(AsyncReadAPIView):
     permission_classes = [IsAuthenticated]
     
-    def get(self, request):
+    @conditional_get
+    @cache_response
+    async def get(self, request):
         """List all budgets with optional filters"""
         try:
             # Get query parameters
             category_id = request.query_params.get('category')
             month_year = request.query_params.get('month_year')
             user = request.user
-            print(user)
+            logger.debug("Listing budgets for user %s", user.pk)
             queryset = self._get_filtered_queryset(category_id, month_year, user)
-            serializer = BudgetSerializer(queryset, many=True, context={'request': request})
-            return success_response(serializer.data)
+            rows = [row async for row in BudgetListSerializer.values(queryset)]
+            # Spent amounts come from a grouped aggregate inside .data
+            data = await sync_to_async(lambda: BudgetListSerializer(rows).data)()
+            return success_response(data)
             
         except Category.DoesNotExist:
             return not_found_error_response("Category not found")
@@ -52,7 +62,7 @@ class BudgetListCreateView(APIView):
                 data=request.data,
                 context={'request': request}
             )
-            print(serializer)
+            logger.debug("Creating budget for user %s", request.user.pk)
             
             if serializer.is_valid():
                 serializer.save()
@@ -65,12 +75,11 @@ class BudgetListCreateView(APIView):
 
     def _get_filtered_queryset(self, category_id=None, month_year=None, user=None):
         """Get filtered queryset based on user permissions and filters"""
-        queryset = Budget.objects.filter() 
-        
-
-        # Apply user filter for non-staff users
-        if not self.request.user.is_staff:
-            queryset = queryset.filter(user=self.request.user, is_deleted=False)
+        # Staff see every budget, including soft-deleted ones
+        if self.request.user.is_staff:
+            queryset = Budget.all_objects.all()
+        else:
+            queryset = Budget.objects.filter(user=self.request.user)
 
         # Apply category filter
         if category_id:
@@ -89,16 +98,24 @@ class BudgetListCreateView(APIView):
 
         return queryset.select_related('user', 'category')
 
-class BudgetDetailView(APIView):
+class BudgetDetailView(AsyncReadAPIView):
     permission_classes = [IsAuthenticated, IsStaffOrOwner]
+    # Single-row lookups stay on the primary (utils.db_router)
+    read_from_replica = False
 
-    def get(self, request, pk):
+    @conditional_get
+    async def get(self, request, pk):
         """Retrieve a specific budget"""
         try:
-            budget = self._get_budget_object(pk)
+            budget = await aget_object_or_404(
+                self._get_budget_queryset().select_related("user", "category"), pk=pk
+            )
             self.check_object_permissions(request, budget)
-            serializer = BudgetSerializer(budget, context={'request': request})
-            return success_single_response(serializer.data)
+            # get_spent_amount runs aggregate queries
+            data = await sync_to_async(
+                lambda: BudgetSerializer(budget, context={'request': request}).data
+            )()
+            return success_single_response(data)
             
         except Budget.DoesNotExist:
             return not_found_error_response("Budget not found")
@@ -109,7 +126,7 @@ class BudgetDetailView(APIView):
         """Update a budget"""
         try:
             budget = self._get_budget_object(pk)
-            print(budget)
+            logger.debug("Updating budget %s", budget.pk)
             self.check_object_permissions(request, budget)
             serializer = BudgetSerializer(
                 budget,
@@ -133,8 +150,7 @@ class BudgetDetailView(APIView):
         try:
             budget = self._get_budget_object(pk)
             self.check_object_permissions(request, budget)
-            budget.is_deleted = True
-            budget.save()
+            budget.soft_delete()
             return success_no_content_response()
             
         except Budget.DoesNotExist:
@@ -142,12 +158,16 @@ class BudgetDetailView(APIView):
         except Exception as e:
             return internal_server_error_response(str(e))
 
-    def _get_budget_object(self, pk):
-        """Get budget object with proper filtering"""
-        queryset = Budget.objects.filter(is_deleted=False)
+    def _get_budget_queryset(self):
+        """Budgets visible to the requesting user"""
+        queryset = Budget.objects.all()
         if not self.request.user.is_staff:
             queryset = queryset.filter(user=self.request.user)
-        budget = get_object_or_404(queryset, pk=pk)
+        return queryset
+
+    def _get_budget_object(self, pk):
+        """Get budget object with proper filtering"""
+        budget = get_object_or_404(self._get_budget_queryset(), pk=pk)
         
         return budget
  
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class CategoryConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'category'
+
+    def ready(self):
+        from utils.versioning import track_writes
+        from .models import Category
+
+        track_writes(Category)
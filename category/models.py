@@ -1,16 +1,18 @@
-import uuid
 from django.db import models
+from django.db.models import Q
+from django.db.models.functions import Lower
 from user.models import CustomUser
+from utils.models import AllRowsManager, LiveManager, SoftDeleteMixin, uuid7
 
 
-class Category(models.Model):
+class Category(SoftDeleteMixin, models.Model):
     """Creating table of Category"""
     CATEGORY_TYPES = (
         ("debit", "Debit"),
         ("credit", "Credit"),
     )
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=100)
     user = models.ForeignKey(
         CustomUser,
@@ -22,5 +24,40 @@ class Category(models.Model):
     is_predefined = models.BooleanField(default=False)
     is_deleted = models.BooleanField(default=False)
 
+    objects = LiveManager()
+    all_objects = AllRowsManager()
+
+    class Meta:
+        default_manager_name = "all_objects"
+        indexes = [
+            models.Index(
+                fields=["user", "type"],
+                condition=Q(is_deleted=False),
+                name="category_live_user_type",
+            ),
+        ]
+        constraints = [
+            # Case-insensitive names, unique per user and type among live rows
+            models.UniqueConstraint(
+                "user",
+                "type",
+                Lower("name"),
+                condition=Q(is_deleted=False),
+                name="category_unique_user_type_name",
+            ),
+            # ... and among predefined categories shared by all users
+            models.UniqueConstraint(
+                "type",
+                Lower("name"),
+                condition=Q(is_predefined=True, is_deleted=False),
+                name="category_unique_predefined_type_name",
+            ),
+        ]
+
+    # Violations of these mean the name is taken (see CategorySerializer._save)
+    NAME_CONSTRAINTS = frozenset(
+        {"category_unique_user_type_name", "category_unique_predefined_type_name"}
+    )
+
     def __str__(self):
         return str(self.name)
\ No newline at end of file
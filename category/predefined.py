@@ -0,0 +1,62 @@
+import threading
+
+from utils.db_router import primary_reads
+from utils.versioning import get_predefined_version
+from .models import Category
+
+
+class PredefinedCategoryCache:
+    """
+    Process-wide copy of the predefined categories.
+
+    Rows are stored in the tuple shape consumed by ``CategoryListSerializer``
+    together with a ``(type, lowercased name)`` index for uniqueness checks.
+    The shared predefined version is checked on every access; when staff
+    create, edit or delete a predefined category it changes and the rows are
+    reloaded with one query.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._rows = ()
+        self._names = frozenset()
+
+    def _refresh(self):
+        version = get_predefined_version()
+        if version == self._version:
+            return
+        with self._lock:
+            if version == self._version:
+                return
+            from .serializers import CategoryListSerializer
+
+            # Shared by every user, so never load it from a lagging replica
+            with primary_reads():
+                rows = tuple(
+                    CategoryListSerializer.values(
+                        Category.objects.filter(is_predefined=True)
+                    )
+                )
+            name_index, type_index = CategoryListSerializer.index("name"), CategoryListSerializer.index("type")
+            self._names = frozenset((row[type_index], row[name_index].lower()) for row in rows)
+            self._rows = rows
+            self._version = version
+
+    def rows(self, category_type=None):
+        """Predefined category rows, optionally limited to one type."""
+        self._refresh()
+        if category_type is None:
+            return list(self._rows)
+        from .serializers import CategoryListSerializer
+
+        type_index = CategoryListSerializer.index("type")
+        return [row for row in self._rows if row[type_index] == category_type]
+
+    def has_name(self, name, category_type):
+        """Whether a predefined category of this type already uses ``name`` (case-insensitive)."""
+        self._refresh()
+        return (category_type, name.lower()) in self._names
+
+
+predefined_categories = PredefinedCategoryCache()
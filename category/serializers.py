@@ -1,10 +1,18 @@
+import logging
+
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError, PermissionDenied
+from django.db import IntegrityError, transaction
 from .models import Category
+from .predefined import predefined_categories
 from user.models import CustomUser
+from utils.serialization import ValuesListSerializer, uuid_converter
+from utils.tracing import TracedValidationMixin
+
+logger = logging.getLogger(__name__)
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(TracedValidationMixin, serializers.ModelSerializer):
     # user = serializers.UUIDField(write_only=True, required=False)
 
     class Meta:
@@ -56,28 +64,41 @@ class CategorySerializer(serializers.ModelSerializer):
 
         return user
 
+    def _duplicate_name_error(self, value):
+        return serializers.ValidationError(
+            {
+                "name": f"A category with the name '{value}' already exists for the user or predifined."
+            }
+        )
+
     def _validate_name(self, value, user, type):
-        """Validate that the category name is unique for the determined user."""
-        request = self.context.get("request")
-        print(type)
-
-        # Check if a category with the same name exists for the determined user
-        if (
-            Category.objects.filter(
-                name__iexact=value, user=user, is_deleted=False, type=type
-            ).exists()
-            or Category.objects.filter(
-                name__iexact=value, is_deleted=False, is_predefined=True, type=type
-            ).exists()
-        ):
-            raise serializers.ValidationError(
-                {
-                    "name": f"A category with the name '{value}' already exists for the user or predifined."
-                }
-            )
+        """
+        Reject names already used by a predefined category of the same type.
+        Uniqueness among the user's own categories is enforced by the
+        lower(name) unique constraints and handled in ``_save``.
+        """
+        logger.debug("Checking predefined %s category names", type)
+
+        if predefined_categories.has_name(value, type):
+            raise self._duplicate_name_error(value)
 
         return value
 
+    def _save(self, save, *args):
+        """Run a create/update, mapping name constraint violations to a validation error."""
+        try:
+            with transaction.atomic():
+                return save(*args)
+        except IntegrityError as e:
+            # Only the lower(name) constraints mean a duplicate name; FK,
+            # NOT NULL and other violations propagate unchanged
+            diag = getattr(e.__cause__, "diag", None)
+            if getattr(diag, "constraint_name", None) not in Category.NAME_CONSTRAINTS:
+                raise
+            raise self._duplicate_name_error(
+                args[-1].get("name", getattr(self.instance, "name", ""))
+            )
+
     def validate(self, data):
         """Ensure the user field is handled correctly during creation and updates."""
         request = self.context.get("request")
@@ -103,8 +124,20 @@ class CategorySerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         """Ensure the user and is_predefined fields are always set correctly before creating the category."""
-        return super().create(validated_data)
+        return self._save(super().create, validated_data)
 
     def update(self, instance, validated_data):
         """Ensure the user field is not updated and other fields are updated correctly."""
-        return super().update(instance, validated_data)
+        return self._save(super().update, instance, validated_data)
+
+
+class CategoryListSerializer(ValuesListSerializer):
+    """Read-only list output identical to ``CategorySerializer(many=True)``."""
+
+    fields = (
+        ("id", "id", uuid_converter),
+        ("name", "name", None),
+        ("user", "user_id", uuid_converter),
+        ("is_predefined", "is_predefined", None),
+        ("type", "type", None),
+    )
@@ -1,17 +1,21 @@
+import logging
+
 from celery import shared_task
 from datetime import datetime
 
 from time import sleep
 
+logger = logging.getLogger(__name__)
+
 @shared_task
 def print_current_time():
     now = datetime.now().strftime('%Y-%m-%d %H:%M')
-    print(f"Current Time: {now}")
+    logger.info("Current Time: %s", now)
     return now
 
 @shared_task
 def sum_two_numbers(a, b):
-    print(f"Sum of {a} and {b} is {a + b}")
+    logger.info("Sum of %s and %s is %s", a, b, a + b)
     return a + b
 
 
@@ -1,3 +1,36 @@
+import uuid
+from unittest import skipUnless
+
+from django.db import connection
 from django.test import TestCase
 
-# Create your tests here.
+from user.models import CustomUser
+from user.tests import explain
+from .models import Category
+
+
+@skipUnless(connection.vendor == "postgresql", "plan shape is checked on PostgreSQL")
+class LiveCategoryIndexTests(TestCase):
+    def test_user_listing_uses_partial_index(self):
+        user = CustomUser.objects.create_user(
+            email="owner@example.com", username="owner", password="Owner#2024pass", name="Owner"
+        )
+        Category.all_objects.bulk_create(
+            [
+                Category(
+                    id=uuid.uuid4(),
+                    name=f"Category {i}",
+                    user=user,
+                    type="debit",
+                    is_deleted=i % 4 == 0,
+                )
+                for i in range(2_000)
+            ],
+            batch_size=1_000,
+        )
+        # CategoryListView for a regular user, filtered by type
+        plan = explain(
+            Category.objects.filter(user=user, is_predefined=False, type="debit"),
+            Category._meta.db_table,
+        )
+        self.assertIn("category_live_user_type", plan)
@@ -1,11 +1,15 @@
-from rest_framework.views import APIView
+from asgiref.sync import sync_to_async
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.exceptions import NotFound, PermissionDenied
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
 from .models import Category
-from .serializers import CategorySerializer
+from .serializers import CategorySerializer, CategoryListSerializer
+from .predefined import predefined_categories
+from utils.async_views import AsyncReadAPIView
 from utils.pagination import CustomPageNumberPagination
+from utils.versioning import conditional_get
+from utils.response_cache import cache_response
 from utils.responses import (
     validation_error_response,
     success_response,
@@ -14,21 +18,23 @@ from utils.responses import (
     success_no_content_response
 )
 from budget.models import Budget
-class CategoryListView(APIView, CustomPageNumberPagination):
+class CategoryListView(AsyncReadAPIView, CustomPageNumberPagination):
     """Handles listing all categories and creating a new category."""
     permission_classes = [IsAuthenticated]
     
-    def get(self, request):
+    @conditional_get
+    @cache_response
+    async def get(self, request):
         """List all categories for the authenticated user or all categories for staff."""
         try:
-            categories = self.get_categories_for_user(request.user)
             category_type = request.query_params.get("type")
-            
-            if category_type in ["debit", "credit"]:
-                categories = categories.filter(type=category_type)
-            
-            paginated_categories = self.paginate_queryset(categories, request)
-            serializer = CategorySerializer(paginated_categories, many=True)
+            if category_type not in ["debit", "credit"]:
+                category_type = None
+
+            categories = await self.aget_categories_for_user(request.user, category_type)
+            # Staff get a lazy queryset; the paginator counts and slices it
+            paginated_categories = await sync_to_async(self.paginate_queryset)(categories, request)
+            serializer = CategoryListSerializer(paginated_categories)
             return success_response(serializer.data)
         except Exception as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -41,39 +47,61 @@ class CategoryListView(APIView, CustomPageNumberPagination):
                 serializer.save()
                 return success_single_response(serializer.data, status_code=status.HTTP_201_CREATED)
             return validation_error_response(serializer.errors)
+        except ValidationError as e:
+            return validation_error_response(e.detail)
         except Exception as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
     
-    def get_categories_for_user(self, user):
-        """Get categories based on user role."""
+    async def aget_categories_for_user(self, user, category_type=None):
+        """
+        Get category rows based on user role. Regular users get their own
+        categories from one indexed query followed by the cached predefined ones.
+        """
+        filters = {}
+        if category_type:
+            filters["type"] = category_type
+
         if user.is_staff:
-            return Category.objects.filter(is_deleted=False)
-        
-        return Category.objects.filter(user=user, is_deleted=False) | Category.objects.filter(is_predefined=True, is_deleted=False)
+            return CategoryListSerializer.values(Category.objects.filter(**filters))
 
-class CategoryDetailView(APIView):
+        own = [
+            row
+            async for row in CategoryListSerializer.values(
+                Category.objects.filter(user=user, is_predefined=False, **filters)
+            )
+        ]
+        return own + await sync_to_async(predefined_categories.rows)(category_type)
+
+class CategoryDetailView(AsyncReadAPIView):
     """Handles retrieving, updating, and deleting a specific category."""
     permission_classes = [IsAuthenticated]
+    # Single-row lookups stay on the primary (utils.db_router)
+    read_from_replica = False
     
     def get_object(self, id, request):
         """Retrieve the category object and check permissions."""
 
-        category = Category.objects.filter(id=id, is_deleted=False).first()
+        category = Category.objects.filter(id=id).first()
         if not category:
             raise NotFound("Category not found")
         return category
+    async def aget_object(self, id, request):
+        """``get_object`` for async handlers."""
+        category = await Category.objects.filter(id=id).afirst()
+        if not category:
+            raise NotFound("Category not found")
+        return category
+
     def delete_associated_budgets(self, category):
         """Soft delete all budgets associated with this category and user."""
-        # Get all budgets associated with this category
-        budgets = Budget.objects.filter(category=category, user=category.user, is_deleted=False)
-        
-        # Soft delete the associated budgets
-        budgets.update(is_deleted=True)
+        # Soft delete all live budgets associated with this category in one UPDATE
+        Budget.objects.filter(category=category, user=category.user).soft_delete()
     
-    def get(self, request, id):
+    @conditional_get
+    async def get(self, request, id):
         """Retrieve a specific category."""
         try:
-            category = self.get_object(id, request)
+            category = await self.aget_object(id, request)
             self.check_object_permissions(request, category)
             serializer = CategorySerializer(category)
             return success_single_response(serializer.data)
@@ -88,6 +116,8 @@ class CategoryDetailView(APIView):
                 serializer.save()
                 return success_single_response(serializer.data)
             return validation_error_response(serializer.errors)
+        except ValidationError as e:
+            return validation_error_response(e.detail)
         except Exception as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
     
@@ -95,8 +125,7 @@ class CategoryDetailView(APIView):
         """Soft-delete a specific category."""
         category = self.get_object(id, request)
         try:
-            category.is_deleted = True
-            category.save()
+            category.soft_delete()
             self.delete_associated_budgets(category)
             return success_no_content_response()
         except Exception as e:
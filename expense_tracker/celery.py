@@ -16,11 +16,26 @@ app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
 
 
+@app.on_after_configure.connect
+def setup_metrics(sender, **kwargs):
+    # Registers the task signal handlers for metrics and trace propagation
+    import utils.metrics  # noqa: F401
+    import utils.tracing  # noqa: F401
+
+
 app.conf.beat_schedule = {
     "print-current-time-every-minute": {
         "task": "category.tasks.print_current_time",  # Correct task path
         "schedule": crontab(minute="*/1"),  # Run every minute
-    }
+    },
+    "archive-old-transactions-nightly": {
+        "task": "transaction.tasks.archive_old_transactions",
+        "schedule": crontab(hour=2, minute=30),
+    },
+    "create-future-transaction-partitions-daily": {
+        "task": "transaction.tasks.create_future_partitions",
+        "schedule": crontab(hour=3, minute=0),
+    },
 }
 
 # Load task modules from all registered Django app configs.
@@ -10,6 +10,8 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
+import sys
 from pathlib import Path
 from .secrets import SECRET_KEY, DATABASE_USER, DATABASE_PASSWORD
 from datetime import timedelta
@@ -46,21 +48,30 @@ INSTALLED_APPS = [
     "category",  # Category app
     "budget",  # Budget app
     'django_celery_results',
-    'django_celery_beat',
-    'drf_yasg',
 
 ]
 
 MIDDLEWARE = [
+    # First, so its timing covers the rest of the stack
+    "utils.metrics.MetricsMiddleware",
+    "utils.tracing.TracingMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
+    "utils.compression.CompressionMiddleware",
+    "utils.db_router.ReadReplicaMiddleware",
+    # Session, CSRF, auth and messages are skipped under LEAN_MIDDLEWARE prefixes
+    "utils.middleware.LeanSessionMiddleware",
     "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
+    "utils.middleware.LeanCsrfViewMiddleware",
+    "utils.middleware.LeanAuthenticationMiddleware",
+    "utils.middleware.LeanMessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# Token-authenticated API routes; /admin/ and /swagger/ keep the full stack
+LEAN_MIDDLEWARE = {
+    "PATH_PREFIXES": ["/api/", "/metrics"],
+}
+
 ROOT_URLCONF = "expense_tracker.urls"
 
 TEMPLATES = [
@@ -96,6 +107,108 @@ DATABASES = {
 }
 
 
+def _env_int(name, default):
+    return int(os.environ.get(name, default))
+
+
+def _env_bool(name, default):
+    return os.environ.get(name, str(default)).lower() in ("1", "true", "yes", "on")
+
+
+# Connection handling per process type: DJANGO_PROCESS_TYPE, or "worker" when
+# started by the celery command and "web" otherwise. Each value can be
+# overridden with DB_<TYPE>_<KEY>, e.g. DB_WEB_POOL=true DB_WEB_POOL_MAX_SIZE=20.
+PROCESS_TYPE = os.environ.get(
+    "DJANGO_PROCESS_TYPE", "worker" if Path(sys.argv[0]).name == "celery" else "web"
+)
+
+# django_celery_beat is only needed by `celery beat --scheduler
+# django_celery_beat.schedulers:DatabaseScheduler` and by manage.py (migrations);
+# web servers skip importing it. Force either way with CELERY_BEAT_APP.
+if _env_bool("CELERY_BEAT_APP", PROCESS_TYPE != "web" or Path(sys.argv[0]).name == "manage.py"):
+    INSTALLED_APPS.append("django_celery_beat")
+
+DB_CONNECTIONS = {
+    "web": {
+        # Seconds a connection is reused across requests (0 closes it after each)
+        "CONN_MAX_AGE": 60,
+        # Use psycopg_pool instead of persistent connections (requires psycopg 3)
+        "POOL": False,
+        "POOL_MIN_SIZE": 2,
+        "POOL_MAX_SIZE": 10,
+        "POOL_TIMEOUT": 10,  # seconds to wait for a free connection
+    },
+    "worker": {
+        "CONN_MAX_AGE": 600,
+        "POOL": False,
+        "POOL_MIN_SIZE": 1,
+        "POOL_MAX_SIZE": 4,
+        "POOL_TIMEOUT": 30,
+    },
+}
+
+_db_connection = {
+    key: (_env_bool if isinstance(default, bool) else _env_int)(
+        f"DB_{PROCESS_TYPE.upper()}_{key}", default
+    )
+    for key, default in DB_CONNECTIONS.get(PROCESS_TYPE, DB_CONNECTIONS["web"]).items()
+}
+
+# Check reused connections before each request/task so a dropped one is replaced
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+if _db_connection["POOL"]:
+    # Django's pool replaces persistent connections
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": _db_connection["POOL_MIN_SIZE"],
+            "max_size": _db_connection["POOL_MAX_SIZE"],
+            "timeout": _db_connection["POOL_TIMEOUT"],
+        }
+    }
+else:
+    DATABASES["default"]["CONN_MAX_AGE"] = _db_connection["CONN_MAX_AGE"]
+
+# Optional read replica, e.g. DB_REPLICA_HOST=replica.internal. Pointing it at
+# the primary (DB_REPLICA_HOST=localhost) gives a local stand-in.
+if os.environ.get("DB_REPLICA_HOST"):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "HOST": os.environ["DB_REPLICA_HOST"],
+        "PORT": os.environ.get("DB_REPLICA_PORT", ""),
+        "NAME": os.environ.get("DB_REPLICA_NAME", DATABASES["default"]["NAME"]),
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ["utils.db_router.ReplicaRouter"]
+
+# Replica routing for safe requests (utils.db_router)
+READ_REPLICAS = {
+    "ALIASES": [alias for alias in DATABASES if alias != "default"],
+    "STICKY_SECONDS": 5,  # reads stay on the primary this long after a user writes
+    # Staff reads after anyone's write; 0 lets staff listings trail by replica lag
+    "STAFF_STICKY_SECONDS": 0,
+}
+
+
+# Cache
+# Shared across processes: holds the per-user data versions behind ETags
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": "redis://localhost:6379/1",
+    }
+}
+
+# Two-level cache for list responses (utils.response_cache)
+RESPONSE_CACHE = {
+    "ALIAS": "default",
+    "TIMEOUT": 300,  # seconds
+    "L1_MAX_ENTRIES": 5000,
+    "L1_MAX_BYTES": 32 * 1024 * 1024,
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -147,6 +260,20 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
+    # orjson-backed when installed, stock DRF behaviour otherwise
+    "DEFAULT_RENDERER_CLASSES": [
+        "utils.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    # Token buckets per tier and scope (utils.throttling, THROTTLING below)
+    "DEFAULT_THROTTLE_CLASSES": [
+        "utils.throttling.ReadWriteThrottle",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "utils.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
 }
 
 
@@ -165,6 +292,160 @@ CELERY_BROKER_URL = "redis://localhost:6379/0"
 CELERY_RESULT_BACKEND = "django-db"
 CELERY_TIMEZONE = "Asia/Kolkata"
 
+# Archival of old transactions (transaction.archive)
+TRANSACTION_ARCHIVE = {
+    "SOFT_DELETED_RETENTION_DAYS": 90,
+    "ARCHIVE_AFTER_YEARS": None,  # e.g. 5 to also move rows older than 5 years
+    "BATCH_SIZE": 1000,
+}
+
+# Monthly transaction partitions (manage.py partition_transactions)
+TRANSACTION_PARTITIONS = {
+    "MONTHS_AHEAD": 3,
+}
+
+# Request throttling (utils.throttling): token buckets in Redis, refilled at
+# "requests/period" with bursts up to the same count. Auth endpoints use the
+# "auth" scope per client IP; everything else "read" or "write" per user.
+THROTTLING = {
+    "ENABLED": _env_bool("THROTTLING_ENABLED", True),
+    "ALIAS": "default",
+    "RATES": {
+        "anon": {"auth": "10/min", "read": "60/min", "write": "20/min"},
+        "user": {"auth": "10/min", "read": "300/min", "write": "60/min"},
+        "staff": {"auth": "30/min", "read": "1200/min", "write": "300/min"},
+    },
+}
+
+# Prometheus metrics at /metrics (utils.metrics). With several worker
+# processes set PROMETHEUS_MULTIPROC_DIR to an empty directory they share.
+METRICS = {
+    "ENABLED": _env_bool("METRICS_ENABLED", True),
+    "TOKEN": os.environ.get("METRICS_TOKEN"),  # bearer token scrapers must send
+    # Without a token /metrics is refused unless DEBUG or this is set (internal-only bind)
+    "ALLOW_ANONYMOUS": _env_bool("METRICS_ALLOW_ANONYMOUS", False),
+    "QUEUES": ["celery"],
+}
+
+# Request/task tracing (utils.tracing); spans go to TRACES_FILE. Change the
+# rate on running processes with `manage.py traces --rate 0.5`.
+TRACING = {
+    "ENABLED": _env_bool("TRACING_ENABLED", True),
+    "SAMPLE_RATE": float(os.environ.get("TRACE_SAMPLE_RATE", 0.01)),
+    "RATE_REFRESH_SECONDS": 10,
+}
+
+# Response compression (utils.compression.CompressionMiddleware)
+RESPONSE_COMPRESSION = {
+    "MIN_SIZE": 1024,  # bytes
+    "LEVELS": {"zstd": 3, "br": 4, "gzip": 6},
+}
+
+# Logging (utils.logging): JSON records are queued on the calling thread and
+# written by a background listener. LOG_LEVELS overrides levels per logger,
+# e.g. LOG_LEVELS="transaction=DEBUG,django.db.backends=DEBUG". LOG_ROTATION
+# is "size" (LOG_MAX_BYTES, LOG_BACKUP_COUNT) or "time" (rotates at midnight);
+# with several processes per host give each its own LOG_FILE.
+LOG_FILE = os.environ.get("LOG_FILE", str(BASE_DIR / "logs" / "app.log"))
+TRACES_FILE = os.environ.get("TRACES_FILE", str(BASE_DIR / "logs" / "traces.jsonl"))
+LOG_ROTATION = os.environ.get("LOG_ROTATION", "size")
+LOG_LEVELS = {
+    "root": "INFO",
+    "django": "INFO",
+    "django.db.backends": "WARNING",
+    "celery": "INFO",
+}
+LOG_LEVELS.update(
+    (name.strip(), level.strip().upper())
+    for name, _, level in (
+        item.partition("=") for item in os.environ.get("LOG_LEVELS", "").split(",") if "=" in item
+    )
+)
+
+os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
+os.makedirs(os.path.dirname(TRACES_FILE), exist_ok=True)
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "json": {"()": "utils.logging.JSONFormatter"},
+        # Spans are already JSON (utils.tracing)
+        "raw": {"format": "%(message)s"},
+    },
+    "filters": {
+        "redact_tokens": {"()": "utils.logging.RedactTokensFilter"},
+        # Share of DEBUG records kept when DEBUG is enabled for busy loggers
+        "sample_debug": {
+            "()": "utils.logging.SamplingFilter",
+            "rate": float(os.environ.get("LOG_DEBUG_SAMPLE_RATE", 0.1)),
+        },
+    },
+    "handlers": {
+        # Targets must sort before "queue" (dictConfig builds handlers by name)
+        "console": {"class": "logging.StreamHandler", "formatter": "json"},
+        "file": (
+            {
+                "class": "logging.handlers.TimedRotatingFileHandler",
+                "filename": LOG_FILE,
+                "when": "midnight",
+                "backupCount": _env_int("LOG_BACKUP_COUNT", 14),
+                "formatter": "json",
+            }
+            if LOG_ROTATION == "time"
+            else {
+                "class": "logging.handlers.RotatingFileHandler",
+                "filename": LOG_FILE,
+                "maxBytes": _env_int("LOG_MAX_BYTES", 50 * 1024 * 1024),
+                "backupCount": _env_int("LOG_BACKUP_COUNT", 5),
+                "formatter": "json",
+            }
+        ),
+        "queue": {
+            "()": "utils.logging.QueueListenerHandler",
+            "handlers": ["cfg://handlers.console", "cfg://handlers.file"],
+            "queue_size": _env_int("LOG_QUEUE_SIZE", 10_000),
+            "filters": ["redact_tokens", "sample_debug"],
+        },
+        "traces_file": {
+            "class": "logging.handlers.RotatingFileHandler",
+            "filename": TRACES_FILE,
+            "maxBytes": _env_int("LOG_MAX_BYTES", 50 * 1024 * 1024),
+            "backupCount": _env_int("LOG_BACKUP_COUNT", 5),
+            "formatter": "raw",
+        },
+        "traces_queue": {
+            "()": "utils.logging.QueueListenerHandler",
+            "handlers": ["cfg://handlers.traces_file"],
+            "queue_size": _env_int("LOG_QUEUE_SIZE", 10_000),
+        },
+    },
+    "root": {"handlers": ["queue"], "level": LOG_LEVELS["root"]},
+    "loggers": {
+        # Django's own handlers are replaced so everything goes through the queue
+        **{name: {"level": level} for name, level in LOG_LEVELS.items() if name != "root"},
+        # Span export (utils.tracing)
+        "tracing": {"handlers": ["traces_queue"], "level": "INFO", "propagate": False},
+    },
+}
+
+# API docs (utils.api_docs). Off outside DEBUG so production workers never
+# import drf_yasg. Build the schema ahead of time with
+#   API_DOCS_ENABLED=1 python manage.py generate_swagger --overwrite openapi.json
+# and point API_DOCS_SCHEMA_FILE at it to serve it without drf_yasg.
+API_DOCS = {
+    "ENABLED": _env_bool("API_DOCS_ENABLED", DEBUG),
+    "SCHEMA_FILE": os.environ.get("API_DOCS_SCHEMA_FILE"),
+}
+
+if API_DOCS["ENABLED"]:
+    INSTALLED_APPS.append("drf_yasg")
+
+SWAGGER_SETTINGS = {
+    "DEFAULT_INFO": "utils.openapi.API_INFO",
+    "DEFAULT_GENERATOR_CLASS": "utils.openapi.DocsSchemaGenerator",
+}
+
 # settings.py
 APPEND_SLASH = False
 
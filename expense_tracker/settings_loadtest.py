@@ -0,0 +1,38 @@
+"""
+Settings used when running the local load-test harness (benchmarks/loadtest.py).
+
+Celery tasks run eagerly inside the web process so the cost of
+track_and_notify_budget and the alert fan-out is part of every measured
+request, and SendGrid calls are built but never sent.
+
+Run the server with:
+    DJANGO_SETTINGS_MODULE=expense_tracker.settings_loadtest python manage.py runserver --noreload
+"""
+
+import os
+
+from .settings import *  # noqa: F401,F403
+
+DEBUG = False
+
+ALLOWED_HOSTS = ["127.0.0.1", "localhost"]
+
+# Celery stand-in: no broker, tasks execute in-process on .delay()
+CELERY_BROKER_URL = "memory://"
+CELERY_RESULT_BACKEND = "cache+memory://"
+CELERY_TASK_ALWAYS_EAGER = True
+CELERY_TASK_EAGER_PROPAGATES = False
+
+# Single runserver process, so an in-process cache is enough
+CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+# Build notification payloads but skip the network call
+SENDGRID_DRY_RUN = True
+
+# Virtual users would otherwise be rejected once they exceed their buckets
+THROTTLING = {**THROTTLING, "ENABLED": False}  # noqa: F405
+
+# Optional per-query delay emulating a remote database (benchmarks/asgi_concurrency.py)
+LOADTEST_DB_LATENCY_MS = int(os.environ.get("LOADTEST_DB_LATENCY_MS", "0"))
+if LOADTEST_DB_LATENCY_MS:
+    MIDDLEWARE = ["benchmarks.io_latency.QueryLatencyMiddleware", *MIDDLEWARE]  # noqa: F405
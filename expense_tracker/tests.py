@@ -0,0 +1,44 @@
+from datetime import date, datetime, timezone
+from unittest import skipUnless
+
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from rest_framework.renderers import JSONRenderer
+
+from utils import metrics
+from utils.renderers import FastJSONRenderer
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    def test_datetimes_match_drf(self):
+        # DRF truncates to milliseconds; orjson alone would keep microseconds
+        data = {
+            "created_at": datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc),
+            "date": date(2024, 1, 2),
+        }
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+
+class LeanMiddlewareTests(TestCase):
+    def test_api_paths_skip_session_middleware(self):
+        response = self.client.get("/api/categories/")
+        self.assertFalse(hasattr(response.wsgi_request, "session"))
+
+    def test_other_paths_keep_the_full_stack(self):
+        # Non-API paths such as the schema still get a session and a user
+        response = self.client.get("/swagger.json")
+        self.assertTrue(hasattr(response.wsgi_request, "session"))
+        self.assertTrue(hasattr(response.wsgi_request, "user"))
+
+
+@skipUnless(metrics.ENABLED, "prometheus_client is not installed")
+class MetricsViewTests(SimpleTestCase):
+    def scrape(self, **headers):
+        return metrics.metrics_view(RequestFactory().get("/metrics", **headers))
+
+    @override_settings(DEBUG=False, METRICS={"TOKEN": None, "ALLOW_ANONYMOUS": False})
+    def test_refused_without_token(self):
+        self.assertEqual(self.scrape().status_code, 403)
+
+    @override_settings(METRICS={"TOKEN": "scrape-token"})
+    def test_wrong_token_is_unauthorized(self):
+        self.assertEqual(self.scrape(HTTP_AUTHORIZATION="Bearer other").status_code, 401)
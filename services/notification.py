@@ -1,6 +1,11 @@
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail, Personalization, To
+import logging
+
+from django.conf import settings
 from expense_tracker.secrets import SENDGRID_API_KEY
+from utils.metrics import count_notification
+from utils.tracing import span
+
+logger = logging.getLogger(__name__)
 
 
 class NotificationService:
@@ -9,6 +14,10 @@ class NotificationService:
         cls, user_email, category_name, percentage, amount, spent, subject, content
     ):
         """Send budget alert notification via email."""
+        # sendgrid is imported on first send so web processes never load it
+        from sendgrid import SendGridAPIClient
+        from sendgrid.helpers.mail import Mail
+
         try:
 
             message = Mail(
@@ -21,7 +30,7 @@ class NotificationService:
             # Set the SendGrid template ID
             # message.template_id = "d-888153bb49e34263a7c51b2cddfb8659"
 
-            # Add dynamic template data
+            # Add dynamic template data (needs Personalization, To from sendgrid.helpers.mail)
             # personalization = Personalization()
             # personalization.add_to(To(user_email))
             # personalization.dynamic_template_data = {
@@ -32,8 +41,17 @@ class NotificationService:
             #     "amount": f"{amount}",
             #     "spent": f"{spent}",
             # }
+            if getattr(settings, "SENDGRID_DRY_RUN", False):
+                logger.info("Dry run: email to %s not sent", user_email)
+                count_notification("budget_alert", "dry_run")
+                return
             sg = SendGridAPIClient(SENDGRID_API_KEY)
-            response = sg.send(message)
-            print(f"Email sent to {user_email}, status code: {response.status_code}")
+            with span("sendgrid.send", kind="budget_alert") as current:
+                response = sg.send(message)
+                if current is not None:
+                    current.set(status_code=response.status_code)
+            logger.info("Email sent to %s, status code: %s", user_email, response.status_code)
+            count_notification("budget_alert", "sent" if response.status_code < 300 else "rejected")
         except Exception as e:
-            print(f"Error sending email: {e}")
+            logger.exception("Error sending email: %s", e)
+            count_notification("budget_alert", "failed")
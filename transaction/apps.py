@@ -24,3 +24,9 @@ from django.apps import AppConfig
 class TransactionConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "transaction"
+
+    def ready(self):
+        from utils.versioning import track_writes
+        from .models import Transaction
+
+        track_writes(Transaction)
@@ -0,0 +1,120 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction as db_transaction
+from django.utils import timezone
+
+from utils.periods import month_start
+from utils.versioning import bump_data_version
+from .models import ArchivedTransaction, Transaction
+
+DEFAULT_ARCHIVE = {
+    # Soft-deleted rows untouched for this many days are archived
+    "SOFT_DELETED_RETENTION_DAYS": 90,
+    # Archive every row dated more than this many years ago (None disables)
+    "ARCHIVE_AFTER_YEARS": None,
+    "BATCH_SIZE": 1000,
+}
+
+ARCHIVED_FIELDS = [
+    "id",
+    "created_at",
+    "updated_at",
+    "is_deleted",
+    "user_id",
+    "category_id",
+    "amount",
+    "date",
+    "description",
+    "type",
+]
+
+
+def archive_settings():
+    return {**DEFAULT_ARCHIVE, **getattr(settings, "TRANSACTION_ARCHIVE", {})}
+
+
+def aged_cutoff():
+    """Datetime before which every transaction is archived, or None."""
+    years = archive_settings()["ARCHIVE_AFTER_YEARS"]
+    if not years:
+        return None
+    now = timezone.localtime()
+    try:
+        return now.replace(year=now.year - years)
+    except ValueError:  # 29 February
+        return now.replace(year=now.year - years, day=28)
+
+
+def period_is_archived(year, month):
+    """Whether rows for this (year, month) may live in the archive table."""
+    cutoff = aged_cutoff()
+    if cutoff is None:
+        return False
+    return month_start(year, month) < cutoff
+
+
+def spending_sources(year, month):
+    """
+    Querysets holding live spending for a period: the hot table, plus the
+    archive when the period is old enough to have been moved, so rollups
+    stay correct after archival.
+    """
+    sources = [Transaction.objects.all()]
+    if period_is_archived(year, month):
+        sources.append(ArchivedTransaction.objects.filter(is_deleted=False))
+    return sources
+
+
+def _move_batch(ids):
+    """
+    Copy one batch into the archive and delete it from the hot table.
+
+    The delete skips the collector and its per-row ``post_delete`` signals
+    (nothing references transactions), so each affected user's data version
+    is bumped once per batch instead of once per row.
+    """
+    with db_transaction.atomic():
+        rows = list(Transaction.all_objects.filter(id__in=ids).values(*ARCHIVED_FIELDS))
+        ArchivedTransaction.objects.bulk_create(
+            [ArchivedTransaction(**row) for row in rows], ignore_conflicts=True
+        )
+        queryset = Transaction.all_objects.filter(id__in=ids)
+        deleted = queryset._raw_delete(queryset.db)
+    for user_id in {row["user_id"] for row in rows}:
+        bump_data_version(user_id)
+    return deleted
+
+
+def _archive(queryset, batch_size):
+    moved = 0
+    while True:
+        ids = list(queryset.order_by("date").values_list("id", flat=True)[:batch_size])
+        if not ids:
+            return moved
+        moved += _move_batch(ids)
+
+
+def archive_transactions():
+    """
+    Move soft-deleted transactions past the retention window, and optionally
+    all transactions older than ``ARCHIVE_AFTER_YEARS``, to the archive table
+    in batches. Returns the number of rows moved per rule.
+    """
+    config = archive_settings()
+    batch_size = config["BATCH_SIZE"]
+
+    retention_cutoff = timezone.now() - timedelta(days=config["SOFT_DELETED_RETENTION_DAYS"])
+    result = {
+        "soft_deleted": _archive(
+            Transaction.all_objects.filter(is_deleted=True, updated_at__lt=retention_cutoff),
+            batch_size,
+        ),
+        "aged": 0,
+    }
+
+    cutoff = aged_cutoff()
+    if cutoff is not None:
+        result["aged"] = _archive(Transaction.all_objects.filter(date__lt=cutoff), batch_size)
+
+    return result
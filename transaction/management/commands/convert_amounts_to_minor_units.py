@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction as db_transaction
+
+from budget.models import Budget
+from transaction.models import ArchivedTransaction, Transaction
+
+MODELS = (Transaction, ArchivedTransaction, Budget)
+
+
+class Command(BaseCommand):
+    help = "Convert NUMERIC amount columns to BIGINT minor units (PostgreSQL, one-off)."
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("Amount conversion requires PostgreSQL.")
+
+        with db_transaction.atomic(), connection.cursor() as cursor:
+            for model in MODELS:
+                table = model._meta.db_table
+                field = model._meta.get_field("amount")
+                cursor.execute(
+                    "SELECT data_type FROM information_schema.columns "
+                    "WHERE table_name = %s AND column_name = %s",
+                    [table, field.column],
+                )
+                row = cursor.fetchone()
+                if row is None:
+                    self.stdout.write(f"{table}: table not found, skipped")
+                    continue
+                if row[0] == "bigint":
+                    self.stdout.write(f"{table}.{field.column}: already bigint")
+                    continue
+
+                # Rewrites the table; on a partitioned table every partition follows
+                cursor.execute(
+                    f'ALTER TABLE "{table}" ALTER COLUMN "{field.column}" TYPE bigint '
+                    f'USING round("{field.column}" * {10 ** field.decimal_places})::bigint'
+                )
+                self.stdout.write(f"{table}.{field.column}: {row[0]} -> bigint")
+
+        self.stdout.write(self.style.SUCCESS("Amounts are stored in minor units."))
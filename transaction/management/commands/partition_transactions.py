@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from transaction.partitioning import (
+    TABLE,
+    convert_to_partitioned,
+    ensure_future_partitions,
+    existing_partitions,
+    is_partitioned,
+)
+
+
+class Command(BaseCommand):
+    help = "Convert the transactions table to monthly partitions (PostgreSQL) or create upcoming partitions."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--convert",
+            action="store_true",
+            help="Rebuild the table as a partitioned table and copy existing rows.",
+        )
+        parser.add_argument(
+            "--keep-old",
+            action="store_true",
+            help=f"Keep the original table as {TABLE}_unpartitioned after converting.",
+        )
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=None,
+            help="Months of partitions to create ahead of the current month.",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("Table partitioning requires PostgreSQL.")
+
+        if options["convert"]:
+            convert_to_partitioned(
+                months_ahead=options["months_ahead"],
+                keep_old=options["keep_old"],
+                log=self.stdout.write,
+            )
+        elif not is_partitioned():
+            raise CommandError(f"{TABLE} is not partitioned yet; run with --convert first.")
+
+        created = ensure_future_partitions(options["months_ahead"])
+        for name in created:
+            self.stdout.write(f"created {name}")
+        self.stdout.write(self.style.SUCCESS(f"{len(existing_partitions())} partitions on {TABLE}"))
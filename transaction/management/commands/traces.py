@@ -0,0 +1,65 @@
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.tracing import RATE_CACHE_KEY, set_sample_rate, tracing_settings
+
+
+class Command(BaseCommand):
+    help = "Change the trace sample rate of running processes or print a recorded trace."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rate", type=float, help="New sample rate between 0 and 1.")
+        parser.add_argument(
+            "--reset-rate", action="store_true", help="Go back to TRACING['SAMPLE_RATE']."
+        )
+        parser.add_argument("--show", metavar="TRACE_ID", help="Print the spans of one trace as a tree.")
+        parser.add_argument(
+            "--file", default=None, help="Span file to read (defaults to settings.TRACES_FILE)."
+        )
+
+    def handle(self, *args, **options):
+        if options["rate"] is not None:
+            if not 0 <= options["rate"] <= 1:
+                raise CommandError("--rate must be between 0 and 1.")
+            set_sample_rate(options["rate"])
+            self.stdout.write(f"Sample rate set to {options['rate']}.")
+        elif options["reset_rate"]:
+            set_sample_rate(None)
+            self.stdout.write(f"Sample rate reset to {tracing_settings()['SAMPLE_RATE']}.")
+
+        if options["show"]:
+            self.show(options["show"], options["file"] or settings.TRACES_FILE)
+        elif options["rate"] is None and not options["reset_rate"]:
+            from django.core.cache import cache
+
+            override = cache.get(RATE_CACHE_KEY)
+            rate = tracing_settings()["SAMPLE_RATE"] if override is None else override
+            self.stdout.write(f"Sample rate: {rate}{' (runtime override)' if override is not None else ''}")
+
+    def show(self, trace_id, path):
+        with open(path) as fh:
+            spans = [span for span in map(json.loads, fh) if span["trace_id"] == trace_id]
+        if not spans:
+            raise CommandError(f"No spans for trace {trace_id} in {path}.")
+
+        children = {}
+        for span in spans:
+            children.setdefault(span["parent_id"], []).append(span)
+        ids = {span["span_id"] for span in spans}
+        roots = [span for span in spans if span["parent_id"] not in ids]
+        origin = min(span["start"] for span in spans)
+
+        def walk(span, depth):
+            offset = (span["start"] - origin) * 1000
+            self.stdout.write(
+                f"{offset:>9.1f}ms {span['duration_ms']:>9.1f}ms  {'  ' * depth}{span['name']}"
+                f"  [{span['process']}]{' ERROR' if span['status'] == 'error' else ''}"
+            )
+            for child in sorted(children.get(span["span_id"], []), key=lambda item: item["start"]):
+                walk(child, depth + 1)
+
+        self.stdout.write(f"{'offset':>11} {'duration':>11}  span")
+        for root in sorted(roots, key=lambda item: item["start"]):
+            walk(root, 0)
@@ -1,7 +1,9 @@
 import uuid
 from django.db import models
+from django.db.models import Q
 from user.models import CustomUser
 from category.models import Category
+from utils.amounts import MinorUnitDecimalField
 from utils.models import BaseModel
 
 
@@ -19,7 +21,61 @@ class Transaction(BaseModel):
     category = models.ForeignKey(
         Category, on_delete=models.CASCADE, related_name="transactions"
     )
-    amount = models.DecimalField(max_digits=10, decimal_places=2)
+    amount = MinorUnitDecimalField(max_digits=10, decimal_places=2)
     date = models.DateTimeField()
     description = models.TextField(blank=True)
     type = models.CharField(max_length=10, choices=TYPE_CHOICES)
+
+    class Meta(BaseModel.Meta):
+        indexes = [
+            # Budget aggregates: user + category over a date range
+            models.Index(
+                fields=["user", "category", "date"],
+                condition=Q(is_deleted=False),
+                name="transaction_live_user_cat_date",
+            ),
+            # Per-user listings
+            models.Index(
+                fields=["user", "date"],
+                condition=Q(is_deleted=False),
+                name="transaction_live_user_date",
+            ),
+        ]
+
+
+class ArchivedTransaction(models.Model):
+    """
+    Cold copy of transactions moved out of the hot table by
+    ``transaction.archive``. Columns mirror ``Transaction`` so the same
+    list serializer and aggregates work on both.
+    """
+
+    id = models.UUIDField(primary_key=True, editable=False)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    is_deleted = models.BooleanField(default=False)
+    user = models.ForeignKey(
+        CustomUser, on_delete=models.CASCADE, related_name="archived_transactions"
+    )
+    category = models.ForeignKey(
+        Category, on_delete=models.CASCADE, related_name="archived_transactions"
+    )
+    amount = MinorUnitDecimalField(max_digits=10, decimal_places=2)
+    date = models.DateTimeField()
+    description = models.TextField(blank=True)
+    type = models.CharField(max_length=10, choices=Transaction.TYPE_CHOICES)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user", "category", "date"],
+                condition=Q(is_deleted=False),
+                name="archived_txn_user_cat_date",
+            ),
+            models.Index(
+                fields=["user", "date"],
+                condition=Q(is_deleted=False),
+                name="archived_txn_user_date",
+            ),
+        ]
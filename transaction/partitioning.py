@@ -0,0 +1,203 @@
+"""
+Monthly range partitioning of the transactions table on ``date`` (PostgreSQL).
+
+PostgreSQL requires the partition key in every unique constraint, so the
+partitioned table's primary key is ``(id, date)``. Django keeps treating
+``id`` as the primary key; UUIDs stay unique in practice and nothing holds a
+foreign key to this table. Month boundaries follow ``settings.TIME_ZONE``,
+the same zone the app uses to bucket transactions into budget months.
+"""
+
+import logging
+
+from django.conf import settings
+from django.db import DatabaseError, connection, transaction as db_transaction
+from django.utils import timezone
+
+from utils.periods import add_months, month_start
+from .models import Transaction
+
+logger = logging.getLogger(__name__)
+
+TABLE = Transaction._meta.db_table
+OLD_TABLE = f"{TABLE}_unpartitioned"
+DEFAULT_PARTITION = f"{TABLE}_default"
+
+DEFAULT_PARTITIONS = {
+    # Months of empty partitions kept ahead of the current month
+    "MONTHS_AHEAD": 3,
+}
+
+
+def partition_settings():
+    return {**DEFAULT_PARTITIONS, **getattr(settings, "TRANSACTION_PARTITIONS", {})}
+
+
+def partition_name(year, month):
+    return f"{TABLE}_p{year}_{month:02d}"
+
+
+def is_partitioned():
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = %s",
+            [TABLE],
+        )
+        return cursor.fetchone() is not None
+
+
+def existing_partitions():
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = %s",
+            [TABLE],
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+
+def create_month_partition(year, month):
+    """
+    Create the partition for one month if it does not exist yet.
+
+    PostgreSQL refuses to add a partition while the default partition holds
+    rows in its range (e.g. a transaction dated beyond ``MONTHS_AHEAD``), so
+    in that case the default partition is detached, the month is created,
+    the matching rows are moved into it and the default is attached again,
+    all in one transaction.
+    """
+    name = partition_name(year, month)
+    end_year, end_month = add_months(year, month, 1)
+    bounds = [month_start(year, month), month_start(end_year, end_month)]
+    with db_transaction.atomic(), connection.cursor() as cursor:
+        stray = DEFAULT_PARTITION in existing_partitions()
+        if stray:
+            cursor.execute(
+                f'SELECT EXISTS (SELECT 1 FROM "{DEFAULT_PARTITION}" WHERE date >= %s AND date < %s)',
+                bounds,
+            )
+            stray = cursor.fetchone()[0]
+        if stray:
+            cursor.execute(f'ALTER TABLE "{TABLE}" DETACH PARTITION "{DEFAULT_PARTITION}"')
+        cursor.execute(
+            f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{TABLE}" '
+            f"FOR VALUES FROM (%s) TO (%s)",
+            bounds,
+        )
+        if stray:
+            cursor.execute(
+                f'WITH moved AS (DELETE FROM "{DEFAULT_PARTITION}" WHERE date >= %s AND date < %s '
+                f'RETURNING *) INSERT INTO "{name}" SELECT * FROM moved',
+                bounds,
+            )
+            logger.info(f"Moved {cursor.rowcount} rows from {DEFAULT_PARTITION} to {name}")
+            cursor.execute(f'ALTER TABLE "{TABLE}" ATTACH PARTITION "{DEFAULT_PARTITION}" DEFAULT')
+    return name
+
+
+def ensure_future_partitions(months_ahead=None):
+    """
+    Create partitions from the current month up to ``months_ahead`` months
+    ahead, so new rows never land in the default partition. No-op when the
+    table has not been converted. A month that cannot be created is logged
+    and skipped, so the remaining months are still created.
+    """
+    if not is_partitioned():
+        return []
+    if months_ahead is None:
+        months_ahead = partition_settings()["MONTHS_AHEAD"]
+
+    existing = existing_partitions()
+    now = timezone.localtime()
+    created = []
+    for offset in range(months_ahead + 1):
+        year, month = add_months(now.year, now.month, offset)
+        if partition_name(year, month) in existing:
+            continue
+        try:
+            created.append(create_month_partition(year, month))
+        except DatabaseError:
+            logger.exception(f"Could not create partition {partition_name(year, month)}")
+    return created
+
+
+def _create_partitioned_parent(cursor, schema_editor):
+    cursor.execute(f'ALTER TABLE "{TABLE}" RENAME TO "{OLD_TABLE}"')
+    cursor.execute(
+        f'CREATE TABLE "{TABLE}" (LIKE "{OLD_TABLE}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+        f"PARTITION BY RANGE (date)"
+    )
+    cursor.execute(f'ALTER TABLE "{TABLE}" ADD PRIMARY KEY (id, date)')
+
+    # Foreign keys and indexes are not copied by LIKE; indexes created on the
+    # parent are created on every partition automatically.
+    for field in ("user", "category"):
+        remote = Transaction._meta.get_field(field).remote_field.model._meta.db_table
+        cursor.execute(
+            f'ALTER TABLE "{TABLE}" ADD CONSTRAINT "{TABLE}_{field}_id_fk" '
+            f'FOREIGN KEY ("{field}_id") REFERENCES "{remote}" ("id") '
+            f"DEFERRABLE INITIALLY DEFERRED"
+        )
+        cursor.execute(f'CREATE INDEX "{TABLE}_{field}_id_part_idx" ON "{TABLE}" ("{field}_id")')
+
+    # Index names are unique per schema; free them up before recreating
+    for index in Transaction._meta.indexes:
+        cursor.execute(f'DROP INDEX IF EXISTS "{index.name}"')
+        schema_editor.add_index(Transaction, index)
+
+    cursor.execute(f'CREATE TABLE "{DEFAULT_PARTITION}" PARTITION OF "{TABLE}" DEFAULT')
+
+
+def convert_to_partitioned(months_ahead=None, keep_old=False, log=logger.info):
+    """
+    Replace the plain transactions table with a monthly partitioned one.
+
+    Partitions are created from the oldest row's month to ``months_ahead``
+    months ahead, rows are copied one month at a time and the old table is
+    dropped (or kept as ``<table>_unpartitioned`` with ``keep_old``). Runs in
+    a single transaction, so writes to the table block until it commits.
+    """
+    if is_partitioned():
+        log(f"{TABLE} is already partitioned")
+        return
+    if months_ahead is None:
+        months_ahead = partition_settings()["MONTHS_AHEAD"]
+
+    with db_transaction.atomic(), connection.schema_editor(atomic=False) as schema_editor:
+        with connection.cursor() as cursor:
+            cursor.execute(f'LOCK TABLE "{TABLE}" IN EXCLUSIVE MODE')
+            cursor.execute(f'SELECT MIN(date) FROM "{TABLE}"')
+            oldest = cursor.fetchone()[0]
+
+            _create_partitioned_parent(cursor, schema_editor)
+
+            now = timezone.localtime()
+            start = timezone.localtime(oldest) if oldest else now
+            year, month = start.year, start.month
+            last_year, last_month = add_months(now.year, now.month, months_ahead)
+            while (year, month) <= (last_year, last_month):
+                name = create_month_partition(year, month)
+                end_year, end_month = add_months(year, month, 1)
+                cursor.execute(
+                    f'INSERT INTO "{TABLE}" SELECT * FROM "{OLD_TABLE}" '
+                    f"WHERE date >= %s AND date < %s",
+                    [month_start(year, month), month_start(end_year, end_month)],
+                )
+                log(f"{name}: {cursor.rowcount} rows")
+                year, month = end_year, end_month
+
+            # Anything outside the created range (e.g. far-future dates)
+            cursor.execute(
+                f'INSERT INTO "{TABLE}" SELECT * FROM "{OLD_TABLE}" o '
+                f'WHERE NOT EXISTS (SELECT 1 FROM "{TABLE}" n WHERE n.id = o.id AND n.date = o.date)'
+            )
+            log(f"{DEFAULT_PARTITION}: {cursor.rowcount} rows")
+
+            if not keep_old:
+                cursor.execute(f'DROP TABLE "{OLD_TABLE}"')
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'ANALYZE "{TABLE}"')
@@ -1,3 +1,5 @@
+import logging
+
 from rest_framework import serializers
 from .models import Transaction
 from budget.models import Budget
@@ -5,8 +7,18 @@ from rest_framework.exceptions import ValidationError
 from django.utils import timezone
 from django.db.models import F
 from django.db import transaction
+from utils.tracing import TracedValidationMixin
+from utils.serialization import (
+    ValuesListSerializer,
+    datetime_converter,
+    decimal_converter,
+    uuid_converter,
+)
+
+logger = logging.getLogger(__name__)
+
 
-class TransactionSerializer(serializers.ModelSerializer):
+class TransactionSerializer(TracedValidationMixin, serializers.ModelSerializer):
     class Meta:
         model = Transaction
         fields = "__all__"
@@ -28,8 +40,7 @@ class TransactionSerializer(serializers.ModelSerializer):
     def validate_category(self, value):
         """Validate the category"""
         user = self.context['request'].user
-        print(user)
-        print(value.user)
+        logger.debug("Validating category %s for user %s", value.pk, user.pk)
         if value.user != user or value.is_deleted:
             raise serializers.ValidationError("Category does not belong to the user")
 
@@ -45,10 +56,27 @@ class TransactionSerializer(serializers.ModelSerializer):
         # Manually passed date or current date if not provided
         transaction_date = data.get('date', timezone.now().date())
 
-        print(transaction_date)
+        logger.debug("Validating transaction dated %s", transaction_date)
         # Find user's budget for this category within the date range
       
 
     
 
         return data
+
+
+class TransactionListSerializer(ValuesListSerializer):
+    """Read-only list output identical to ``TransactionSerializer(many=True)``."""
+
+    fields = (
+        ("id", "id", uuid_converter),
+        ("created_at", "created_at", datetime_converter),
+        ("updated_at", "updated_at", datetime_converter),
+        ("is_deleted", "is_deleted", None),
+        ("amount", "amount", decimal_converter(2)),
+        ("date", "date", datetime_converter),
+        ("description", "description", None),
+        ("type", "type", None),
+        ("user", "user_id", uuid_converter),
+        ("category", "category_id", uuid_converter),
+    )
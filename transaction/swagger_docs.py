@@ -1,45 +1,50 @@
-from drf_yasg import openapi
-from drf_yasg.utils import swagger_auto_schema
+from utils.api_docs import api_docs
 from .serializers import TransactionSerializer
 
-# Define common responses
-error_response = openapi.Response("Error Response", openapi.Schema(type=openapi.TYPE_OBJECT))
+# Each factory runs only when the schema is generated, so drf_yasg is not
+# imported with the views.
+
+
+def error_response():
+    from drf_yasg import openapi
+
+    return openapi.Response("Error Response", openapi.Schema(type=openapi.TYPE_OBJECT))
 
 def transaction_list_docs():
-    return swagger_auto_schema(
+    return api_docs(lambda: dict(
         operation_description="Retrieve all transactions for the authenticated user.",
         responses={200: TransactionSerializer(many=True)},
-    )
+    ))
 
 def transaction_create_docs():
-    return swagger_auto_schema(
+    return api_docs(lambda: dict(
         operation_description="Create a new transaction.",
         request_body=TransactionSerializer,
-        responses={201: TransactionSerializer(), 400: error_response},
-    )
+        responses={201: TransactionSerializer(), 400: error_response()},
+    ))
 
 def transaction_detail_docs():
-    return swagger_auto_schema(
+    return api_docs(lambda: dict(
         operation_description="Retrieve details of a specific transaction.",
         responses={200: TransactionSerializer()},
-    )
+    ))
 
 def transaction_update_docs():
-    return swagger_auto_schema(
+    return api_docs(lambda: dict(
         operation_description="Update a transaction (full update).",
         request_body=TransactionSerializer,
         responses={200: TransactionSerializer()},
-    )
+    ))
 
 def transaction_partial_update_docs():
-    return swagger_auto_schema(
+    return api_docs(lambda: dict(
         operation_description="Partially update a transaction.",
         request_body=TransactionSerializer,
         responses={200: TransactionSerializer()},
-    )
+    ))
 
 def transaction_delete_docs():
-    return swagger_auto_schema(
+    return api_docs(lambda: dict(
         operation_description="Delete a transaction (soft delete).",
         responses={204: "No Content"},
-    )
+    ))
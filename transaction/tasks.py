@@ -1,13 +1,31 @@
 # utils/tasks.py
+import logging
+
 from celery import shared_task
 from django.utils import timezone
 from budget.models import Budget
 from transaction.models import Transaction
+from transaction.archive import archive_transactions, spending_sources
+from transaction.partitioning import ensure_future_partitions
+from utils.amounts import from_minor, percentage, sum_minor, to_minor
+from utils.periods import month_of, period_filter
 from services.notification import (
     NotificationService,
 )  # Assuming your NotificationService is already set up
-from django.db.models import Sum
-from decimal import Decimal
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def archive_old_transactions():
+    """Move old soft-deleted (and optionally aged) transactions to the archive table."""
+    return archive_transactions()
+
+
+@shared_task
+def create_future_partitions():
+    """Keep monthly transaction partitions created ahead of incoming rows."""
+    return ensure_future_partitions()
 
 
 @shared_task
@@ -17,36 +35,42 @@ def track_and_notify_budget(transaction_id):
     """
     try:
         # Fetch the transaction from the database by ID
-        transaction = Transaction.objects.get(id=transaction_id)
+        # Deleted transactions are tracked too, so look across all rows
+        transaction = Transaction.all_objects.get(id=transaction_id)
+        year, month = month_of(transaction.date)
 
         # Get the budget for the category and time of the transaction
         budget = Budget.objects.filter(
             user=transaction.user,
             category=transaction.category,
-            year=transaction.date.year,
-            month=transaction.date.month,
-            is_deleted=False,
+            year=year,
+            month=month,
         ).first()
 
-        # Calculate the total spending for the category and time period
-        total_spent = Transaction.objects.filter(
-            user=transaction.user,
-            category=transaction.category,
-            date__year=transaction.date.year,
-            date__month=transaction.date.month,
-            is_deleted=False,
-        ).aggregate(Sum("amount"))["amount__sum"] or Decimal("0")
-        print(budget.amount)
-        print(total_spent)
+        # Calculate the total spending for the category and time period (minor units)
+        spent_minor = sum(
+            sum_minor(
+                source.filter(
+                    user=transaction.user,
+                    category=transaction.category,
+                    **period_filter(year, month),
+                )
+            )
+            for source in spending_sources(year, month)
+        )
+        total_spent = from_minor(spent_minor)
         # Check if the spending has exceeded any thresholds
-        total_spent_percentage = (total_spent / budget.amount) * 100
-        print(total_spent_percentage)
+        total_spent_percentage = percentage(spent_minor, to_minor(budget.amount))
+        logger.debug(
+            "Budget %s: spent %s of %s (%.1f%%)",
+            budget.pk, total_spent, budget.amount, total_spent_percentage,
+        )
         # Check for warning and critical thresholds
         if total_spent_percentage >= budget.CRITICAL_THRESHOLD:
-            print(total_spent)
+            logger.info("Budget %s crossed the critical threshold", budget.pk)
             send_budget_alert(budget, total_spent, transaction.amount, critical=True)
         elif total_spent_percentage >= budget.WARNING_THRESHOLD:
-            print("Hello")
+            logger.info("Budget %s crossed the warning threshold", budget.pk)
             send_budget_alert(budget, total_spent, transaction.amount)
 
         # Update the last warning sent time after notifying, use timezone.now() for timezone-aware datetime
@@ -59,14 +83,13 @@ def track_and_notify_budget(transaction_id):
 
 def send_budget_alert(budget, total_spent, new_spent, critical=False):
     """Send an email notification if the budget limit is reached or exceeded."""
-    print("HEllo from send ")
-    percentage = (total_spent / budget.amount) * 100
-    subject = f"Budget Alert: {budget.category.name} - {percentage:.1f}% used"
+    used = percentage(to_minor(total_spent), to_minor(budget.amount))
+    subject = f"Budget Alert: {budget.category.name} - {used:.1f}% used"
 
     # If critical, mention in the subject line
     if critical:
         subject = (
-            f"CRITICAL Budget Alert: {budget.category.name} - {percentage:.1f}% used"
+            f"CRITICAL Budget Alert: {budget.category.name} - {used:.1f}% used"
         )
 
     # Prepare the email content
@@ -79,7 +102,7 @@ def send_budget_alert(budget, total_spent, new_spent, critical=False):
     NotificationService.send_budget_alert(
         user_email=budget.user.email,
         category_name=budget.category.name,
-        percentage=percentage,
+        percentage=used,
         amount=budget.amount,
         spent=total_spent,
         subject=subject,
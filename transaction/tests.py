@@ -1,3 +1,258 @@
-from django.test import TestCase
+import time
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest import skipUnless
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db import connection, router
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from category.models import Category
+from user.models import CustomUser
+from user.tests import explain
+from utils.db_router import primary_reads, record_write, replica_reads
+from utils.versioning import ALL_SCOPE
+from .models import Transaction
+
+
+class SpreadTransactionsMixin:
+    """Live and soft-deleted transactions for one user, spread back in time."""
+
+    ROWS = 2_000
+    STEP = timedelta(hours=6)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(
+            email="owner@example.com", username="owner", password="Owner#2024pass", name="Owner"
+        )
+        cls.category = Category.objects.create(name="Groceries", user=cls.user, type="debit")
+        cls.now = timezone.now()
+        Transaction.all_objects.bulk_create(
+            [
+                Transaction(
+                    id=uuid.uuid4(),
+                    user=cls.user,
+                    category=cls.category,
+                    amount=Decimal("10.00"),
+                    date=cls.now - cls.STEP * i,
+                    type="debit",
+                    is_deleted=i % 4 == 0,
+                )
+                for i in range(cls.ROWS)
+            ],
+            batch_size=1_000,
+        )
+
+
+@skipUnless(connection.vendor == "postgresql", "plan shape is checked on PostgreSQL")
+class LiveTransactionIndexTests(SpreadTransactionsMixin, TestCase):
+    def test_user_listing_uses_partial_index(self):
+        plan = explain(
+            Transaction.objects.filter(user=self.user).order_by("-date"),
+            Transaction._meta.db_table,
+        )
+        self.assertIn("transaction_live_user_date", plan)
+
+
+class PeriodFilterTests(SpreadTransactionsMixin, TestCase):
+    """``utils.periods.period_filter`` (a date range) vs date__year/date__month."""
+
+    def setUp(self):
+        self.month = timezone.localtime(self.now - timedelta(days=180))
+
+    def month_queryset(self, **period):
+        return Transaction.objects.filter(user=self.user, category=self.category, **period)
+
+    def test_range_matches_extract(self):
+        from django.db.models import Sum
+
+        from utils.periods import period_filter
+
+        by_range = self.month_queryset(**period_filter(self.month.year, self.month.month))
+        by_extract = self.month_queryset(date__year=self.month.year, date__month=self.month.month)
+        self.assertEqual(
+            by_range.aggregate(total=Sum("amount")), by_extract.aggregate(total=Sum("amount"))
+        )
+
+    @skipUnless(connection.vendor == "postgresql", "plan shape is checked on PostgreSQL")
+    def test_range_plan_uses_date_index(self):
+        from utils.periods import period_filter
+
+        plan = explain(
+            self.month_queryset(**period_filter(self.month.year, self.month.month)),
+            Transaction._meta.db_table,
+        )
+        self.assertIn("transaction_live_user_cat_date", plan)
+        # Both range bounds are index conditions, not a filter applied afterwards
+        index_cond = next(line for line in plan.splitlines() if "Index Cond" in line)
+        self.assertIn("date >=", index_cond)
+        self.assertIn("date <", index_cond)
+
+    @skipUnless(connection.vendor == "postgresql", "plan shape is checked on PostgreSQL")
+    def test_extract_plan_filters_date(self):
+        plan = explain(
+            self.month_queryset(date__year=self.month.year, date__month=self.month.month),
+            Transaction._meta.db_table,
+        )
+        index_cond = next((line for line in plan.splitlines() if "Index Cond" in line), "")
+        self.assertNotIn("date", index_cond)
+
+
+REPLICA = "replica"
+
+
+def _user(is_staff=False):
+    # The router only reads the id and flags
+    return SimpleNamespace(id=uuid.uuid4(), is_authenticated=True, is_staff=is_staff)
+
+
+def _run(method, user, view):
+    """Call ``view`` through ReadReplicaMiddleware as the handler would."""
+    from utils.db_router import ReadReplicaMiddleware
+
+    request = getattr(RequestFactory(), method.lower())("/api/transactions/")
+    request.user = user
+
+    def get_response(request):
+        middleware.process_view(request, view, (), {})
+        return view(request)
+
+    middleware = ReadReplicaMiddleware(get_response)
+    return middleware(request)
+
+
+def transaction_reads(request=None):
+    return Transaction.objects.all().db
+
+
+def token_reads(request=None):
+    from user.models import ActiveTokens
+
+    return ActiveTokens.objects.all().db
+
+
+def write_then_read(request):
+    router.db_for_write(Transaction)
+    return transaction_reads()
+
+
+def primary_view(request):
+    return transaction_reads()
+
+
+primary_view.read_from_replica = False
+
+
+def reads_and_cacheable(request):
+    from utils.db_router import reads_cacheable
+
+    return transaction_reads(), reads_cacheable()
+
+
+@override_settings(
+    READ_REPLICAS={"ALIASES": [REPLICA], "STICKY_SECONDS": 5, "STAFF_STICKY_SECONDS": 0},
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class ReplicaRoutingTests(SimpleTestCase):
+    """
+    Routing rules of ``utils.db_router``. ``replica`` is the alias settings
+    add for ``DB_REPLICA_HOST`` (a test mirror of ``default``); only the
+    routing decision is checked, through ``QuerySet.db``, so no query runs.
+    """
+
+    def setUp(self):
+        cache.clear()
+
+    def test_safe_methods_read_from_replica(self):
+        for method in ("GET", "HEAD", "OPTIONS"):
+            with self.subTest(method=method):
+                self.assertEqual(_run(method, _user(), transaction_reads), REPLICA)
+
+    def test_unsafe_methods_read_from_primary(self):
+        for method in ("POST", "PUT", "PATCH", "DELETE"):
+            with self.subTest(method=method):
+                self.assertEqual(_run(method, _user(), transaction_reads), "default")
+
+    def test_no_replicas_configured(self):
+        with override_settings(READ_REPLICAS={"ALIASES": []}):
+            self.assertEqual(_run("GET", _user(), transaction_reads), "default")
+
+    def test_primary_only_models(self):
+        self.assertEqual(_run("GET", _user(), token_reads), "default")
+
+    def test_request_that_wrote_reads_primary(self):
+        self.assertEqual(_run("GET", _user(), write_then_read), "default")
+
+    def test_view_opts_out(self):
+        self.assertEqual(_run("GET", _user(), primary_view), "default")
+
+    @override_settings(READ_REPLICAS={"ALIASES": [REPLICA], "STICKY_SECONDS": 1})
+    def test_sticky_window_after_write(self):
+        writer, other = _user(), _user()
+        record_write([ALL_SCOPE, f"user:{writer.id}"])
+
+        self.assertEqual(_run("GET", writer, transaction_reads), "default")
+        self.assertEqual(_run("GET", other, transaction_reads), REPLICA)
+        time.sleep(1.1)
+        self.assertEqual(_run("GET", writer, transaction_reads), REPLICA)
+
+    def test_acting_user_sticks_after_writing_for_someone_else(self):
+        staff, owner = _user(is_staff=True), _user()
+
+        def staff_write(request):
+            # e.g. staff creating a transaction for another user
+            record_write([ALL_SCOPE, f"user:{owner.id}"])
+
+        _run("POST", staff, staff_write)
+        self.assertEqual(_run("GET", staff, transaction_reads), "default")
+        self.assertEqual(_run("GET", owner, transaction_reads), "default")
+
+    def test_staff_not_sticky_after_other_users_write(self):
+        record_write([ALL_SCOPE, f"user:{_user().id}"])
+        self.assertEqual(_run("GET", _user(is_staff=True), transaction_reads), REPLICA)
+
+    @override_settings(
+        READ_REPLICAS={"ALIASES": [REPLICA], "STICKY_SECONDS": 5, "STAFF_STICKY_SECONDS": 1}
+    )
+    def test_staff_window_after_any_write(self):
+        record_write([ALL_SCOPE, f"user:{_user().id}"])
+
+        self.assertEqual(_run("GET", _user(is_staff=True), transaction_reads), "default")
+        self.assertEqual(_run("GET", _user(), transaction_reads), REPLICA)
+        time.sleep(1.1)
+        self.assertEqual(_run("GET", _user(is_staff=True), transaction_reads), REPLICA)
+
+    def test_staff_replica_reads_after_a_write_are_not_cacheable(self):
+        record_write([ALL_SCOPE, f"user:{_user().id}"])
+
+        self.assertEqual(_run("GET", _user(is_staff=True), reads_and_cacheable), (REPLICA, False))
+        # Regular users only reach a replica after their own sticky window
+        self.assertEqual(_run("GET", _user(), reads_and_cacheable), (REPLICA, True))
+
+    def test_replica_reads_without_recent_writes_are_cacheable(self):
+        self.assertEqual(_run("GET", _user(is_staff=True), reads_and_cacheable), (REPLICA, True))
+
+    def test_outside_requests_reads_use_primary(self):
+        self.assertEqual(transaction_reads(), "default")
+
+    def test_replica_reads_block(self):
+        with replica_reads():
+            self.assertEqual(transaction_reads(), REPLICA)
+            self.assertEqual(token_reads(), "default")
+        self.assertEqual(transaction_reads(), "default")
+
+    def test_primary_reads_block(self):
+        with replica_reads():
+            with primary_reads():
+                self.assertEqual(transaction_reads(), "default")
+            self.assertEqual(transaction_reads(), REPLICA)
+
+        def view(request):
+            with primary_reads():
+                return transaction_reads()
+
+        self.assertEqual(_run("GET", _user(), view), "default")
@@ -1,17 +1,21 @@
 from rest_framework import permissions, status
-from rest_framework.views import APIView
 from rest_framework.response import Response
-from django.shortcuts import get_object_or_404
+from django.http import Http404
 from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
-from .models import Transaction
-from .serializers import TransactionSerializer
+from .models import ArchivedTransaction, Transaction
+from .archive import period_is_archived
+from .serializers import TransactionSerializer, TransactionListSerializer
 from utils.responses import (
     success_response,
     success_no_content_response,
     validation_error_response,
     permission_error_response,
 )
+from utils.async_views import AsyncReadAPIView
 from utils.permissions import IsStaffOrOwner
+from utils.periods import period_filter
+from utils.versioning import conditional_get
+from utils.response_cache import cache_response
 from .swagger_docs import (
     transaction_list_docs,
     transaction_create_docs,
@@ -22,9 +26,10 @@ from .swagger_docs import (
 )
 
 
-class BaseTransactionView(APIView):
+class BaseTransactionView(AsyncReadAPIView):
     """
     Base view for transaction-related views. Implements error handling and helper methods.
+    GET handlers are async; writes stay synchronous.
     """
 
     def handle_exception(self, exc):
@@ -44,23 +49,49 @@ def get_transaction_queryset(user):
     Raises no response, only fetches data.
     """
     return (
-        Transaction.objects.filter(is_deleted=False)
+        Transaction.objects.filter(user=user)
         if not user.is_staff
-        else Transaction.objects.all()
+        else Transaction.all_objects.all()
     )
 
 
-def get_transaction_object(pk, user):
+def get_archived_queryset(user):
+    """Archived counterpart of ``get_transaction_queryset``."""
+    return (
+        ArchivedTransaction.objects.filter(user=user, is_deleted=False)
+        if not user.is_staff
+        else ArchivedTransaction.objects.all()
+    )
+
+
+def get_transaction_object(pk, user, include_archived=False):
     """
     Fetches a transaction by ID and checks permissions.
     Raises exceptions instead of returning responses.
+    Archived transactions are only returned (read-only) when include_archived is set.
     """
-    transaction = get_object_or_404(Transaction.objects.filter(is_deleted=False), pk=pk)
+    transaction = Transaction.objects.filter(pk=pk).first()
+    if transaction is None and include_archived:
+        transaction = get_archived_queryset(user).filter(pk=pk).first()
+    if transaction is None:
+        raise Http404("No Transaction matches the given query.")
     if not (user.is_staff or transaction.user == user):
         raise PermissionDenied("You do not have permission to access this transaction.")
     return transaction
 
 
+async def aget_transaction_object(pk, user, include_archived=False):
+    """``get_transaction_object`` for async views (compares ``user_id`` to avoid a lazy fetch)."""
+    transaction = await Transaction.objects.filter(pk=pk).afirst()
+    if transaction is None and include_archived:
+        transaction = await get_archived_queryset(user).filter(pk=pk).afirst()
+    if transaction is None:
+        raise Http404("No Transaction matches the given query.")
+    if not (user.is_staff or transaction.user_id == user.id):
+        raise PermissionDenied("You do not have permission to access this transaction.")
+    return transaction
+
+
 # class TransactionListCreateView(BaseTransactionView):
 #     permission_classes = [permissions.IsAuthenticated]
 
@@ -138,9 +169,42 @@ class TransactionListCreateView(BaseTransactionView):
     permission_classes = [permissions.IsAuthenticated]
 
     @transaction_list_docs()
-    def get(self, request):
+    @conditional_get
+    @cache_response
+    async def get(self, request):
         transactions = get_transaction_queryset(request.user)
-        serializer = TransactionSerializer(transactions, many=True)
+
+        # Optional MM-YYYY filter; old periods also read from the archive table
+        period = None
+        month_year = request.query_params.get("month_year")
+        if month_year:
+            try:
+                month, year = (int(part) for part in month_year.split("-"))
+                period = (year, month)
+            except ValueError:
+                pass
+
+        if period is None:
+            rows = [row async for row in TransactionListSerializer.values(transactions)]
+            serializer = TransactionListSerializer(rows)
+            return success_response(data=serializer.data)
+
+        try:
+            date_range = period_filter(*period)
+        except ValueError:  # no such month, so nothing matches
+            return success_response(data=[])
+
+        rows = [
+            row async for row in TransactionListSerializer.values(transactions.filter(**date_range))
+        ]
+        if period_is_archived(*period):
+            rows += [
+                row
+                async for row in TransactionListSerializer.values(
+                    get_archived_queryset(request.user).filter(**date_range)
+                )
+            ]
+        serializer = TransactionListSerializer(rows)
         return success_response(data=serializer.data)
 
     @transaction_create_docs()
@@ -168,11 +232,14 @@ class TransactionListCreateView(BaseTransactionView):
 
 class TransactionDetailView(BaseTransactionView):
     permission_classes = [IsStaffOrOwner]
+    # Single-row lookups stay on the primary (utils.db_router)
+    read_from_replica = False
 
     @transaction_detail_docs()
-    def get(self, request, pk):
+    @conditional_get
+    async def get(self, request, pk):
         try:
-            transaction = get_transaction_object(pk, request.user)
+            transaction = await aget_transaction_object(pk, request.user, include_archived=True)
             serializer = TransactionSerializer(transaction)
             return success_response(data=serializer.data)
         except Exception as exc:
@@ -207,8 +274,7 @@ class TransactionDetailView(BaseTransactionView):
     def delete(self, request, pk):
         try:
             transaction = get_transaction_object(pk, request.user)
-            transaction.is_deleted = True
-            transaction.save()
+            transaction.soft_delete()
 
             # Track budget limit after deletion of transaction
             track_and_notify_budget.delay(transaction.id)
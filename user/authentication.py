@@ -3,6 +3,8 @@ from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import AuthenticationFailed
 from django.conf import settings
 from rest_framework import exceptions
+from utils.metrics import count_auth
+from utils.tracing import span
 from .models import ActiveTokens
 
 
@@ -13,34 +15,71 @@ class CustomTokenAuthentication(BaseAuthentication):
 
         Validates JWT token, checks token validity, and user status.
         """
+        with span("auth.token"):
+            token = self._get_token(request)
+            if token is None:
+                return None
+
+            try:
+                # Check token in ActiveTokens
+                active_token = ActiveTokens.objects.select_related("user").filter(
+                    token=token,
+                ).first()
+                return self._check_active_token(active_token, token)
+            except AuthenticationFailed:
+                raise
+            except Exception as e:
+                raise AuthenticationFailed(str(e))
+
+    async def aauthenticate(self, request):
+        """``authenticate`` for async views, using the async ORM."""
+        with span("auth.token"):
+            token = self._get_token(request)
+            if token is None:
+                return None
+
+            try:
+                active_token = await ActiveTokens.objects.select_related("user").filter(
+                    token=token,
+                ).afirst()
+                return self._check_active_token(active_token, token)
+            except AuthenticationFailed:
+                raise
+            except Exception as e:
+                raise AuthenticationFailed(str(e))
+
+    def _get_token(self, request):
+        """Bearer token from the request after validating the JWT, or None."""
         auth_header = request.headers.get("Authorization")
         if not auth_header or not auth_header.startswith("Bearer "):
             return None
 
         try:
             token = auth_header.split(" ")[1]
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
-
-            # Check token in ActiveTokens
-            active_token = ActiveTokens.objects.filter(
-                token=token,
-            ).first()
-            if not active_token:
-                raise AuthenticationFailed("Invalid or expired token")
-
-            user = active_token.user
-            if not user.is_active:
-                raise AuthenticationFailed("User account is inactive")
-
-            return (user, token)
-
+            jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+            return token
         except jwt.ExpiredSignatureError:
+            count_auth("expired")
             raise AuthenticationFailed("Token has expired")
         except jwt.InvalidTokenError:
+            count_auth("invalid")
             raise AuthenticationFailed("Invalid token")
         except Exception as e:
             raise AuthenticationFailed(str(e))
 
+    def _check_active_token(self, active_token, token):
+        if not active_token:
+            count_auth("unknown")
+            raise AuthenticationFailed("Invalid or expired token")
+
+        user = active_token.user
+        if not user.is_active:
+            count_auth("inactive")
+            raise AuthenticationFailed("User account is inactive")
+
+        count_auth("valid")
+        return (user, token)
+
 
 class TokenAuthorizationMixin:
     """
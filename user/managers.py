@@ -1,14 +1,21 @@
+import logging
+
 from django.contrib.auth.models import BaseUserManager
 from django.core.exceptions import ValidationError
 
+logger = logging.getLogger(__name__)
+
 
 class CustomUserManager(BaseUserManager):
+    def active(self):
+        return self.filter(is_active=True)
+
     def create_user(self, email, username, password, **extra_fields):
         if not username:
             raise ValueError("Username must be present")
         email = self.normalize_email(email)
         user = self.model(email=email, username=username, **extra_fields)
-        print(user)
+        logger.debug("Creating user %s", username)
         user.set_password(password)
         user.save(using=self._db)
         return user
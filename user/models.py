@@ -1,7 +1,8 @@
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.db import models
-import uuid
+from django.db.models import Q
 from .managers import CustomUserManager
+from utils.models import uuid7
 from django.core.validators import (
     MinLengthValidator,
     RegexValidator,
@@ -16,7 +17,7 @@ username_validator = RegexValidator(
 
 class CustomUser(AbstractBaseUser, PermissionsMixin):
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     email = models.EmailField(unique=True)
     username = models.CharField(
         max_length=50,
@@ -34,6 +35,16 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = "username"
     REQUIRED_FIELDS = ["email"]
 
+    class Meta:
+        indexes = [
+            # Staff user listing; deactivated accounts are soft-deleted
+            models.Index(
+                fields=["-created_at"],
+                condition=Q(is_active=True),
+                name="user_active_created",
+            ),
+        ]
+
     def __str__(self):
         return self.email
 
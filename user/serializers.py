@@ -172,6 +172,7 @@ from rest_framework.exceptions import ValidationError, AuthenticationFailed
 from .models import CustomUser, ActiveTokens
 from category.models import Category
 from utils.token import TokenHandler
+from utils.versioning import bump_data_version
 from django.contrib.auth.password_validation import validate_password
 
 logger = logging.getLogger(__name__)
@@ -331,7 +332,6 @@ class UpdatePasswordSerializer(BaseUserValidationMixin, serializers.Serializer):
         user = self.context["user"]
         request_user = self.context["request"].user
         # print(self.context)
-        print(data.get("current_password"))
         # Staff validation
         if request_user.is_staff:
             if user.is_staff and user != request_user:
@@ -339,7 +339,6 @@ class UpdatePasswordSerializer(BaseUserValidationMixin, serializers.Serializer):
                     "Staff members cannot modify other staff members' passwords"
                 )
         else:
-            print(data["current_password"])
             if "current_password" not in data:
                 raise ValidationError("Current password is required.")
             self.validate_current_password(data["current_password"])
@@ -371,7 +370,6 @@ class DeleteUserSerializer(serializers.Serializer, BaseUserValidationMixin):
     def validate(self, data):
         user = self.context["request"].user
         target_user = self.context.get("user")
-        print(data["current_password"])
         if user.is_staff:
             if target_user.is_staff:
                 raise ValidationError(
@@ -389,7 +387,8 @@ class DeleteUserSerializer(serializers.Serializer, BaseUserValidationMixin):
         user.save()
 
         if user.is_staff:
-            Category.objects.filter(user=user).update(user=None)
+            Category.all_objects.filter(user=user).update(user=None)
+            bump_data_version(user.id, predefined=True)
 
         ActiveTokens.objects.filter(user=user).delete()
         logger.info(f"User {user.username} soft-deleted successfully.")
@@ -1,11 +1,15 @@
+import logging
 
 from celery import shared_task
 from datetime import datetime
 from utils.send_mail import send_email
 
+logger = logging.getLogger(__name__)
+
 
 
 @shared_task
 def send_email_task(to_email, reset_link):
-    print(f"Sending email to {to_email} with subject: {reset_link}")
+    # The reset link carries a one-time token, so it is not logged
+    logger.info("Sending password reset email to %s", to_email)
     return send_email(to_email,reset_link )
\ No newline at end of file
@@ -1,3 +1,56 @@
-from django.test import TestCase
+import uuid
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from .models import CustomUser
+
+
+def explain(queryset, table):
+    """Plan of ``queryset`` with fresh statistics and seq scans discouraged."""
+    with connection.cursor() as cursor:
+        cursor.execute(f'ANALYZE "{table}"')
+        # Keep the planner from picking a seq scan just because the table is small
+        cursor.execute("SET LOCAL enable_seqscan = off")
+    return queryset.explain()
+
+
+@skipUnless(connection.vendor == "postgresql", "plan shape is checked on PostgreSQL")
+class ActiveUserIndexTests(TestCase):
+    def test_active_listing_uses_partial_index(self):
+        CustomUser.objects.bulk_create(
+            [
+                CustomUser(
+                    id=uuid.uuid4(),
+                    username=f"user_{i}",
+                    email=f"user_{i}@example.com",
+                    name="Test",
+                    is_active=i % 4 != 0,
+                )
+                for i in range(2_000)
+            ],
+            batch_size=1_000,
+        )
+        # UserListView with active=true
+        plan = explain(
+            CustomUser.objects.active().order_by("-created_at"), CustomUser._meta.db_table
+        )
+        self.assertIn("user_active_created", plan)
+
+
+LOCMEM = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(
+    CACHES=LOCMEM,
+    THROTTLING={"ENABLED": True, "RATES": {"anon": {"auth": "1/min", "read": "1/min", "write": "1/min"}}},
+)
+class AuthThrottleTests(TestCase):
+    def test_second_login_is_throttled_with_retry_after(self):
+        # Fresh in-process buckets, so earlier tests can't have used the token
+        with mock.patch("utils.throttling._buckets", None):
+            for _ in range(2):
+                response = self.client.post("/api/auth/login/", {}, REMOTE_ADDR="203.0.113.7")
+        self.assertEqual(response.status_code, 429)
+        self.assertGreaterEqual(int(response["Retry-After"]), 1)
@@ -233,10 +233,16 @@ from .serializers import (
     PasswordResetRequestSerializer,
 )
 from .authentication import TokenAuthorizationMixin
+import logging
+
 from .tasks import send_email_task as send_mail
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from django.contrib.auth.tokens import default_token_generator
 from rest_framework.exceptions import NotFound
+from utils.throttling import AuthThrottle
+from utils.compression import never_compress
+
+logger = logging.getLogger(__name__)
 
 
 class BaseUserView:
@@ -286,7 +292,9 @@ class UserCreateView(APIView):
             user = serializer.save()
             tokens = TokenHandler.generate_tokens_for_user(user)
             response_data = {"user": serializer.data, "tokens": tokens}
-            return success_response(response_data, status_code=status.HTTP_201_CREATED)
+            return never_compress(
+                success_response(response_data, status_code=status.HTTP_201_CREATED)
+            )
         except Exception as e:
             return Response(
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -299,6 +307,7 @@ class LoginView(APIView):
     """
 
     permission_classes = [AllowAny]
+    throttle_classes = [AuthThrottle]
 
     def post(self, request):
         """
@@ -318,7 +327,7 @@ class LoginView(APIView):
             user = serializer.validated_data["user"]
             tokens = TokenHandler.generate_tokens_for_user(user)
             response_data = {"user": UserSerializer(user).data, "tokens": tokens}
-            return success_response(response_data)
+            return never_compress(success_response(response_data))
         except Exception as e:
             return Response(
                 {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -363,7 +372,8 @@ class UserListView(APIView):
 
     def get(self, request):
         """
-        Retrieve a list of all users.
+        Retrieve a list of all users. Pass ``active=true`` to list only
+        active users, newest first.
 
         Args:
             request (Request): The request object.
@@ -374,6 +384,9 @@ class UserListView(APIView):
         """
         try:
             users = CustomUser.objects.all()
+            if request.query_params.get("active") == "true":
+                # Answered from the user_active_created partial index
+                users = CustomUser.objects.active().order_by("-created_at")
             serializer = UserSerializer(users, many=True)
             return success_response(serializer.data)
         except Exception as e:
@@ -388,6 +401,8 @@ class UserProfileView(BaseUserView, TokenAuthorizationMixin, APIView):
     """
 
     permission_classes = [IsStaffOrOwner]
+    # Single-row lookups stay on the primary (utils.db_router)
+    read_from_replica = False
 
     def get(self, request, id):
         """
@@ -457,7 +472,7 @@ class UserProfileView(BaseUserView, TokenAuthorizationMixin, APIView):
             user = self.get_user_or_404(id)
             self.check_object_permissions(request, user)
             target_user = CustomUser.objects.get(id=id)
-            print(request.data)
+            logger.debug("Deleting user %s", id)
             serializer = DeleteUserSerializer(
                 data=request.data, context={"request": request, "user": target_user}
             )
@@ -495,7 +510,7 @@ class UpdatePasswordView(BaseUserView, APIView):
         try:
             user = self.get_user_or_404(id)
             self.check_object_permissions(request, user)
-            print(request.data["current_password"])
+            logger.debug("Updating password for user %s", id)
             serializer = UpdatePasswordSerializer(
                 data=request.data, context={"request": request, "user": user}
             )
@@ -515,6 +530,7 @@ class PasswordResetRequestView(APIView):
     """
 
     permission_classes = [AllowAny]
+    throttle_classes = [AuthThrottle]
 
     def post(self, request):
         """
@@ -556,6 +572,7 @@ class PasswordResetConfirmView(APIView):
     """
 
     permission_classes = [AllowAny]
+    throttle_classes = [AuthThrottle]
 
     def post(self, request, uidb64, token):
         """
@@ -0,0 +1,89 @@
+"""
+Money amounts stored as BIGINT minor units (cents).
+
+``MinorUnitDecimalField`` behaves like ``DecimalField`` everywhere above the
+database (forms, DRF serializers, validators and lookups all see
+``Decimal``) but the column holds integers, so sums and comparisons run on
+integer arithmetic. Code that only needs totals can stay in integers with
+``sum_minor`` / ``minor_array`` and convert once at the API boundary.
+"""
+
+import array
+import functools
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db import models
+from django.db.models import ExpressionWrapper, F, Sum
+
+DECIMAL_PLACES = 2
+
+
+def to_minor(value, decimal_places=DECIMAL_PLACES):
+    """Decimal (or str/int) amount to an integer count of minor units."""
+    return int(Decimal(value).scaleb(decimal_places).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def from_minor(value, decimal_places=DECIMAL_PLACES):
+    """Integer minor units to a Decimal with ``decimal_places`` places."""
+    return Decimal(value).scaleb(-decimal_places)
+
+
+def percentage(part_minor, whole_minor):
+    """``part`` as a percentage of ``whole``, both in minor units."""
+    return part_minor * 100 / whole_minor
+
+
+class MinorUnitDecimalField(models.DecimalField):
+    """``DecimalField`` persisted as a BIGINT number of minor units."""
+
+    def get_internal_type(self):
+        return "BigIntegerField"
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return from_minor(value, self.decimal_places)
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if not prepared:
+            value = self.get_prep_value(value)
+        if value is None or hasattr(value, "as_sql"):
+            return value
+        return to_minor(value, self.decimal_places)
+
+    def get_db_prep_save(self, value, connection):
+        return self.get_db_prep_value(value, connection)
+
+
+def minor_units(field="amount"):
+    """Expression selecting the stored integer instead of the Decimal."""
+    return ExpressionWrapper(F(field), output_field=models.BigIntegerField())
+
+
+@functools.cache
+def _numpy():
+    # Imported on first use; most processes never build arrays
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def sum_minor(queryset, field="amount"):
+    """Total of ``field`` over ``queryset`` in minor units (0 when empty)."""
+    total = queryset.aggregate(total=Sum(minor_units(field)))["total"]
+    # PostgreSQL returns SUM(bigint) as numeric
+    return int(total or 0)
+
+
+def minor_array(queryset, field="amount"):
+    """
+    The stored integers of ``field`` as a NumPy int64 array, or an
+    ``array('q')`` when NumPy is not installed, for in-process rollups.
+    """
+    values = queryset.annotate(_minor=minor_units(field)).values_list("_minor", flat=True)
+    numpy = _numpy()
+    if numpy is not None:
+        return numpy.fromiter(values, dtype=numpy.int64)
+    return array.array("q", values)
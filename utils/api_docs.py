@@ -0,0 +1,60 @@
+"""
+OpenAPI documentation settings, the lazy ``@api_docs`` decorator and the
+prebuilt schema view.
+
+Nothing here imports drf_yasg. Views attach a factory with ``api_docs``
+that returns ``swagger_auto_schema`` keyword arguments; it only runs when
+``utils.openapi`` generates the schema. With ``API_DOCS["ENABLED"]`` off
+(the default outside DEBUG) drf_yasg is neither installed as an app nor
+mounted, so workers never import it. ``SCHEMA_FILE`` points at a schema
+built ahead of time (``manage.py generate_swagger``) and is served as is
+at ``/swagger.json`` whether or not the docs UI is enabled.
+"""
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.urls import include, path
+
+DEFAULT_API_DOCS = {
+    # Mount the Swagger/ReDoc UI and generate the schema on demand
+    "ENABLED": True,
+    # Prebuilt OpenAPI JSON to serve at /swagger.json
+    "SCHEMA_FILE": None,
+}
+
+_schema_file_cache = {}
+
+
+def docs_settings():
+    return {**DEFAULT_API_DOCS, **getattr(settings, "API_DOCS", {})}
+
+
+def api_docs(factory):
+    """Attach ``swagger_auto_schema`` arguments, built by ``factory`` on demand."""
+
+    def decorator(view_method):
+        view_method._api_docs = factory
+        return view_method
+
+    return decorator
+
+
+def schema_file(request):
+    """The prebuilt schema, read once per process."""
+    file_path = docs_settings()["SCHEMA_FILE"]
+    if file_path not in _schema_file_cache:
+        with open(file_path, "rb") as fh:
+            _schema_file_cache[file_path] = fh.read()
+    response = HttpResponse(_schema_file_cache[file_path], content_type="application/json")
+    response["Cache-Control"] = "public, max-age=3600"
+    return response
+
+
+def docs_urlpatterns():
+    config = docs_settings()
+    patterns = []
+    if config["SCHEMA_FILE"]:
+        patterns.append(path("swagger.json", schema_file, name="schema-file"))
+    if config["ENABLED"]:
+        patterns.append(path("", include("utils.openapi")))
+    return patterns
@@ -0,0 +1,87 @@
+"""
+DRF views whose read handlers are coroutines.
+
+``AsyncReadAPIView`` lets a view define ``async def get`` while keeping its
+synchronous ``post``/``patch``/``delete``. Under ASGI the request stays on
+the event loop: authentication uses ``aauthenticate`` when the
+authentication class provides one and the handler awaits the async ORM.
+Synchronous handlers run unchanged in a worker thread. Under WSGI Django
+runs the view through ``async_to_sync``, so behaviour is the same.
+"""
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from rest_framework import exceptions
+from rest_framework.views import APIView
+
+
+class AsyncReadAPIView(APIView):
+    view_is_async = True
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        handler = None
+        if request.method.lower() in self.http_method_names:
+            handler = getattr(self, request.method.lower(), None)
+        if handler is None or not iscoroutinefunction(handler):
+            return await sync_to_async(self._dispatch_sync)(request, handler, args, kwargs)
+
+        try:
+            await self.ainitial(request, *args, **kwargs)
+            response = await handler(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    def _dispatch_sync(self, request, handler, args, kwargs):
+        """``APIView.dispatch`` for synchronous handlers (writes, OPTIONS, 405)."""
+        try:
+            self.initial(request, *args, **kwargs)
+            if handler is None:
+                handler = self.http_method_not_allowed
+            response = handler(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def ainitial(self, request, *args, **kwargs):
+        """``APIView.initial`` with authentication awaited."""
+        self.format_kwarg = self.get_format_suffix(**kwargs)
+
+        neg = self.perform_content_negotiation(request)
+        request.accepted_renderer, request.accepted_media_type = neg
+
+        version, scheme = self.determine_version(request, *args, **kwargs)
+        request.version, request.versioning_scheme = version, scheme
+
+        await self.aperform_authentication(request)
+        self.check_permissions(request)
+        if self.get_throttles():
+            await sync_to_async(self.check_throttles)(request)
+
+    async def aperform_authentication(self, request):
+        """Mirrors ``Request._authenticate``; sets ``request.user`` and ``request.auth``."""
+        for authenticator in request.authenticators:
+            try:
+                if hasattr(authenticator, "aauthenticate"):
+                    user_auth = await authenticator.aauthenticate(request)
+                else:
+                    user_auth = await sync_to_async(authenticator.authenticate)(request)
+            except exceptions.APIException:
+                request._not_authenticated()
+                raise
+
+            if user_auth is not None:
+                request._authenticator = authenticator
+                request.user, request.auth = user_auth
+                return
+
+        request._not_authenticated()
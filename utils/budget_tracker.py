@@ -1,9 +1,9 @@
 # utils/budget_tracker.py
 
 from budget.models import Budget
-from django.db.models import Sum
-from decimal import Decimal
 from services.notification import NotificationService
+from utils.amounts import from_minor, percentage, sum_minor, to_minor
+from utils.periods import month_of, period_filter
 
 
 from datetime import datetime, timedelta
@@ -12,22 +12,26 @@ from datetime import datetime, timedelta
 def track_budget_limit(transaction):
     """Track the budget and check if the limit is reached."""
     try:
+        year, month = month_of(transaction.date)
+
         # Get the budget for the category and time of the transaction
         budget = Budget.objects.get(
             user=transaction.user,
             category=transaction.category,
-            year=transaction.date.year,
-            month=transaction.date.month,
+            year=year,
+            month=month,
         )
 
         # Calculate the total spending for the category and time period
-        total_spent = transaction.__class__.objects.filter(
-            user=transaction.user,
-            category=transaction.category,
-            date__year=transaction.date.year,
-            date__month=transaction.date.month,
-            is_deleted=False,
-        ).aggregate(Sum("amount"))["amount__sum"] or Decimal("0")
+        total_spent = from_minor(
+            sum_minor(
+                transaction.__class__.objects.filter(
+                    user=transaction.user,
+                    category=transaction.category,
+                    **period_filter(year, month),
+                )
+            )
+        )
 
         # Check if the spending has exceeded any thresholds
         if total_spent >= budget.amount:
@@ -49,14 +53,14 @@ def track_budget_limit(transaction):
 
 def send_budget_alert(budget, total_spent, new_spent, critical=False):
     """Send an email notification if the budget limit is reached or exceeded."""
-    percentage = (total_spent / budget.amount) * 100
-    subject = f"Budget Alert: {budget.category.name} - {percentage:.1f}% used"
+    used = percentage(to_minor(total_spent), to_minor(budget.amount))
+    subject = f"Budget Alert: {budget.category.name} - {used:.1f}% used"
 
     # If critical, mention in the subject line
     if critical:
 
         subject = (
-            f"CRITICAL Budget Alert: {budget.category.name} - {percentage:.1f}% used"
+            f"CRITICAL Budget Alert: {budget.category.name} - {used:.1f}% used"
         )
 
     # Prepare the email content
@@ -69,7 +73,7 @@ def send_budget_alert(budget, total_spent, new_spent, critical=False):
     NotificationService.send_budget_alert(
         user_email=budget.user.email,
         category_name=budget.category.name,
-        percentage=percentage,
+        percentage=used,
         amount=budget.amount,
         spent=total_spent,
         subject=subject,
@@ -0,0 +1,219 @@
+import zlib
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional accelerator
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional accelerator
+    zstandard = None
+
+
+DEFAULT_COMPRESSION = {
+    "MIN_SIZE": 1024,
+    "LEVELS": {"zstd": 3, "br": 4, "gzip": 6},
+    "CONTENT_TYPES": [
+        "application/json",
+        "text/csv",
+        "application/x-ndjson",
+        "application/ndjson",
+    ],
+    # Credential endpoints echo secrets; compressing them would allow
+    # BREACH-style length probing
+    "EXCLUDE_PATH_PREFIXES": ["/api/auth/"],
+}
+
+
+class GzipStream:
+    def __init__(self, level):
+        # wbits=31 writes a gzip header with mtime 0, so output is deterministic
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data):
+        return self._obj.compress(data) + self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._obj.flush(zlib.Z_FINISH)
+
+
+class BrotliStream:
+    def __init__(self, level):
+        self._obj = brotli.Compressor(quality=level)
+
+    def compress(self, data):
+        return self._obj.process(data) + self._obj.flush()
+
+    def finish(self):
+        return self._obj.finish()
+
+
+class ZstdStream:
+    def __init__(self, level):
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data):
+        return self._obj.compress(data) + self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self):
+        return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+def available_encodings():
+    """Supported encodings in server preference order."""
+    encodings = []
+    if zstandard is not None:
+        encodings.append("zstd")
+    if brotli is not None:
+        encodings.append("br")
+    encodings.append("gzip")
+    return encodings
+
+
+STREAMS = {"gzip": GzipStream, "br": BrotliStream, "zstd": ZstdStream}
+
+
+def compress_bytes(encoding, data, level):
+    """One-shot compression of a complete body."""
+    if encoding == "gzip":
+        obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+        return obj.compress(data) + obj.flush()
+    if encoding == "br":
+        return brotli.compress(data, quality=level)
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+def never_compress(response):
+    """Marks ``response`` (e.g. one carrying tokens) to be sent uncompressed."""
+    response.compression_exempt = True
+    return response
+
+
+def parse_accept_encoding(header):
+    """Return the set of encodings the client accepts with a non-zero q-value."""
+    accepted = set()
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > 0:
+            accepted.add(token)
+    return accepted
+
+
+class CompressionMiddleware:
+    """
+    Compresses JSON, CSV and NDJSON responses with the best encoding the
+    client accepts (zstd, then brotli, then gzip).
+
+    Regular responses are compressed only above ``MIN_SIZE`` bytes and only
+    when the result is smaller. Paths under ``EXCLUDE_PATH_PREFIXES`` and
+    responses passed through ``never_compress`` are left alone. Streaming
+    responses are compressed chunk by chunk, flushing after each one so
+    exports keep streaming. Configure with the ``RESPONSE_COMPRESSION``
+    setting (see ``DEFAULT_COMPRESSION``).
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        config = {**DEFAULT_COMPRESSION, **getattr(settings, "RESPONSE_COMPRESSION", {})}
+        self.min_size = config["MIN_SIZE"]
+        self.levels = {**DEFAULT_COMPRESSION["LEVELS"], **config["LEVELS"]}
+        self.content_types = set(config["CONTENT_TYPES"])
+        self.exclude_prefixes = tuple(config["EXCLUDE_PATH_PREFIXES"])
+        self.encodings = available_encodings()
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        response = self.get_response(request)
+        return self.process_response(request, response)
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        return self.process_response(request, response)
+
+    def process_response(self, request, response):
+        if response.has_header("Content-Encoding"):
+            return response
+
+        if getattr(response, "compression_exempt", False) or request.path_info.startswith(
+            self.exclude_prefixes
+        ):
+            return response
+
+        content_type = response.get("Content-Type", "").split(";")[0].strip().lower()
+        if content_type not in self.content_types:
+            return response
+
+        if not response.streaming and len(response.content) < self.min_size:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        accepted = parse_accept_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        encoding = next((name for name in self.encodings if name in accepted), None)
+        if encoding is None:
+            return response
+
+        level = self.levels[encoding]
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = self._compress_async(
+                    response.streaming_content, encoding, level
+                )
+            else:
+                response.streaming_content = self._compress_sync(
+                    response.streaming_content, encoding, level
+                )
+            del response.headers["Content-Length"]
+        else:
+            compressed = compress_bytes(encoding, response.content, level)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        # A compressed body is not byte-identical to the original
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+    @staticmethod
+    def _compress_sync(chunks, encoding, level):
+        stream = STREAMS[encoding](level)
+        for chunk in chunks:
+            data = stream.compress(chunk)
+            if data:
+                yield data
+        yield stream.finish()
+
+    @staticmethod
+    async def _compress_async(chunks, encoding, level):
+        stream = STREAMS[encoding](level)
+        async for chunk in chunks:
+            data = stream.compress(chunk)
+            if data:
+                yield data
+        yield stream.finish()
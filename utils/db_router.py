@@ -0,0 +1,221 @@
+"""
+Read-replica routing.
+
+``ReadReplicaMiddleware`` marks GET/HEAD/OPTIONS requests as replica-eligible
+unless the view sets ``read_from_replica = False``. ``ReplicaRouter`` then
+sends their ORM reads to one of ``READ_REPLICAS["ALIASES"]``, except:
+
+* models listed in ``PRIMARY_ONLY_MODELS`` (auth tokens must be readable the
+  moment they are issued),
+* once the request itself has written, and
+* for ``STICKY_SECONDS`` after the requesting user wrote anything, either to
+  their own rows or, for staff, to anyone's. Writes by other users only pin
+  staff reads when ``STAFF_STICKY_SECONDS`` is set, and only for that window.
+
+Staff listings cover every user's rows, and their data version changes as
+soon as anyone writes. A staff response built from replica reads within
+``STICKY_SECONDS`` of any write may predate that write, so ``reads_cacheable()``
+tells the response cache and ETag layer (utils.response_cache,
+utils.versioning) not to store it under the new version.
+
+Outside a request (Celery tasks, management commands) everything stays on the
+primary unless wrapped in ``replica_reads()``.
+"""
+
+import contextvars
+import random
+from contextlib import contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+
+DEFAULT_READ_REPLICAS = {
+    # Database aliases that serve reads; empty disables routing
+    "ALIASES": [],
+    # Seconds a user's reads stay on the primary after they write
+    "STICKY_SECONDS": 5,
+    # Seconds staff reads stay on the primary after anyone writes; 0 lets
+    # staff listings lag behind other users' writes by the replication delay
+    "STAFF_STICKY_SECONDS": 0,
+    "PRIMARY_ONLY_MODELS": [
+        "user.activetokens",
+        "token_blacklist.outstandingtoken",
+        "token_blacklist.blacklistedtoken",
+        "sessions.session",
+    ],
+}
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def replica_settings():
+    return {**DEFAULT_READ_REPLICAS, **getattr(settings, "READ_REPLICAS", {})}
+
+
+class _ReadState:
+    __slots__ = ("request", "allowed", "wrote", "sticky", "replica")
+
+    def __init__(self, request=None, allowed=False):
+        self.request = request
+        self.allowed = allowed
+        self.wrote = False
+        self.sticky = None
+        self.replica = False
+
+
+_state = contextvars.ContextVar("db_read_state", default=None)
+
+
+def _sticky_key(scope):
+    return f"db-primary:{scope}"
+
+
+# Set for STICKY_SECONDS after any write, whatever the staff window
+RECENT_WRITE_KEY = "db-recent-write"
+
+
+def _acting_user():
+    user = getattr(getattr(_state.get(), "request", None), "user", None)
+    if user is None or not user.is_authenticated:
+        return None
+    return user
+
+
+def record_write(scopes):
+    """
+    Keep reads on the primary for a short window after a write: for the
+    owners in these version scopes, for the user making the request and,
+    with ``STAFF_STICKY_SECONDS``, for all staff.
+    """
+    from utils.versioning import ALL_SCOPE
+
+    config = replica_settings()
+    if not config["ALIASES"]:
+        return
+    if config["STICKY_SECONDS"]:
+        owners = {scope for scope in scopes if scope.startswith("user:")}
+        actor = _acting_user()
+        if actor is not None:
+            owners.add(f"user:{actor.id}")
+        keys = {_sticky_key(scope): 1 for scope in owners}
+        keys[RECENT_WRITE_KEY] = 1
+        cache.set_many(keys, timeout=config["STICKY_SECONDS"])
+    if config["STAFF_STICKY_SECONDS"] and ALL_SCOPE in scopes:
+        cache.set(_sticky_key(ALL_SCOPE), 1, timeout=config["STAFF_STICKY_SECONDS"])
+
+
+def _is_sticky(state):
+    if state.sticky is not None:
+        return state.sticky
+    user = getattr(state.request, "user", None)
+    if user is None or not user.is_authenticated:
+        # Not authenticated yet; decide again once the user is known
+        return False
+    from utils.versioning import ALL_SCOPE
+
+    scopes = [f"user:{user.id}"]
+    if user.is_staff and replica_settings()["STAFF_STICKY_SECONDS"]:
+        scopes.append(ALL_SCOPE)
+    state.sticky = bool(cache.get_many([_sticky_key(scope) for scope in scopes]))
+    return state.sticky
+
+
+def reads_cacheable():
+    """
+    Whether a response built from this request's reads may be cached and
+    given an ETag under the user's current data version. False only for
+    staff requests that read from a replica within ``STICKY_SECONDS`` of a
+    write; other users' reads only reach a replica once their own writes
+    are past that window.
+    """
+    state = _state.get()
+    if state is None or not state.replica:
+        return True
+    user = getattr(state.request, "user", None)
+    if user is None or not user.is_staff:
+        return True
+    return cache.get(RECENT_WRITE_KEY) is None
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if state is None or not state.allowed or state.wrote:
+            return None
+        config = replica_settings()
+        if not config["ALIASES"] or model._meta.label_lower in config["PRIMARY_ONLY_MODELS"]:
+            return None
+        if _is_sticky(state):
+            return None
+        state.replica = True
+        return random.choice(config["ALIASES"])
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in replica_settings()["ALIASES"]:
+            return False
+        return None
+
+
+class ReadReplicaMiddleware:
+    """Decides per request whether the view's reads may use a replica."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = _state.set(_ReadState(request))
+        try:
+            return self.get_response(request)
+        finally:
+            _state.reset(token)
+
+    async def __acall__(self, request):
+        token = _state.set(_ReadState(request))
+        try:
+            return await self.get_response(request)
+        finally:
+            _state.reset(token)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view = getattr(view_func, "cls", None) or getattr(view_func, "view_class", None) or view_func
+        state = _state.get()
+        if state is not None:
+            state.allowed = request.method in SAFE_METHODS and getattr(view, "read_from_replica", True)
+
+
+@contextmanager
+def replica_reads():
+    """Let reads in this block use a replica, for read-only work that tolerates replication lag."""
+    token = _state.set(_ReadState(allowed=True))
+    try:
+        yield
+    finally:
+        _state.reset(token)
+
+
+@contextmanager
+def primary_reads():
+    """Force reads in this block onto the primary."""
+    token = _state.set(_ReadState(allowed=False))
+    try:
+        yield
+    finally:
+        _state.reset(token)
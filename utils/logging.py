@@ -1,19 +1,150 @@
+"""
+Logging building blocks referenced from ``settings.LOGGING``.
+
+Application code only calls ``logging.getLogger(__name__)``; records go to
+one ``QueueListenerHandler`` on the root logger, which puts them on an
+in-memory queue and returns. A background ``QueueListener`` thread formats
+them as JSON and writes them to the console and the rotating log file, so
+request and task threads never wait on I/O. When the queue is full, records
+are dropped and counted rather than blocking.
+
+Before a record is queued, ``RedactTokensFilter`` masks JWTs and bearer
+credentials and ``SamplingFilter`` keeps only a fraction of DEBUG records.
+"""
+
+import atexit
+import copy
+import json
 import logging
 import os
+import queue
+import random
+import re
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+# Attributes every LogRecord has; anything else came in through ``extra``
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+_JWT = re.compile(r"eyJ[\w-]+\.[\w-]+\.[\w-]+")
+_BEARER = re.compile(r"(Bearer\s+)[\w.~+/=-]+", re.IGNORECASE)
+
+
+def redact_token(token):
+    """A token shortened to its last characters, enough to correlate log lines."""
+    token = str(token or "")
+    return f"<token ...{token[-6:]}>" if len(token) > 12 else "<token>"
+
+
+def redact(text):
+    """``text`` with JWTs and bearer credentials masked."""
+    text = _JWT.sub(lambda match: redact_token(match.group()), text)
+    return _BEARER.sub(lambda match: match.group(1) + "<redacted>", text)
+
+
+class RedactTokensFilter(logging.Filter):
+    """Masks tokens in the rendered message (f-strings included) before it is queued."""
+
+    def filter(self, record):
+        message = record.getMessage()
+        redacted = redact(message)
+        if redacted != message:
+            record.msg, record.args = redacted, None
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Passes records above ``level`` and a ``rate`` fraction of the rest."""
+
+    def __init__(self, rate=1.0, level="DEBUG"):
+        super().__init__()
+        self.rate = float(rate)
+        self.level = logging.getLevelName(level) if isinstance(level, str) else level
+
+    def filter(self, record):
+        return record.levelno > self.level or random.random() < self.rate
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line; ``extra`` fields are included as keys."""
+
+    def format(self, record):
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "func": record.funcName,
+            "line": record.lineno,
+            "process": record.process,
+            "thread": record.threadName,
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc_info"] = record.exc_text
+        if record.stack_info:
+            payload["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(payload, default=str)
+
+
+class QueueListenerHandler(QueueHandler):
+    """
+    Queues records for ``handlers``, which a listener thread writes.
+
+    In ``LOGGING`` the target handlers are passed as ``cfg://handlers.<name>``
+    and must sort before this handler's name, since dictConfig builds
+    handlers in name order. The listener is restarted in forked children
+    (Celery prefork, gunicorn with ``--preload``), where the parent's thread
+    does not exist.
+    """
+
+    def __init__(self, handlers, queue_size=10_000):
+        self.targets = [handlers[i] for i in range(len(handlers))]
+        for target in self.targets:
+            if not isinstance(target, logging.Handler):
+                raise ValueError(f"{target!r} is not a configured handler; check handler names sort first")
+        self.queue_size = queue_size
+        self.dropped = 0
+        super().__init__(queue.Queue(queue_size))
+        self._start()
+        atexit.register(self._stop)
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._restart)
+
+    def _start(self):
+        self.listener = QueueListener(self.queue, *self.targets, respect_handler_level=True)
+        self.listener.start()
+
+    def _stop(self):
+        if self.listener._thread is not None:
+            self.listener.stop()
+
+    def _restart(self):
+        self.queue = queue.Queue(self.queue_size)
+        self.dropped = 0
+        self._start()
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def prepare(self, record):
+        # Render the message and traceback now; args may not be picklable or
+        # may change before the listener gets to them
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        if self.dropped:
+            record.dropped_records, self.dropped = self.dropped, 0
+        return record
 
-# Define log directory
-LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
-os.makedirs(LOG_DIR, exist_ok=True)
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.FileHandler(os.path.join(LOG_DIR, "app.log")),  # Logs to a file
-        logging.StreamHandler(),  # Logs to the console
-    ],
-)
-
-# Get a logger instance
-logger = logging.getLogger(__name__)
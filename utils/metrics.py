@@ -0,0 +1,284 @@
+"""
+Prometheus metrics for requests, database, caches, Celery and notifications.
+
+``MetricsMiddleware`` counts and times each request per view (the URL name),
+method and status, and how many queries it ran. Queries are counted by a
+wrapper installed on every new database connection; the per-request count
+lives in a context variable, so queries that async views run through
+``sync_to_async`` are included. Celery publish/prerun/postrun signals record
+how long tasks waited in the queue and how long they ran. ``metrics_view``
+serves everything at ``/metrics`` in the text exposition format and reads
+the broker queue lengths at scrape time.
+
+Set ``PROMETHEUS_MULTIPROC_DIR`` (an empty directory, shared by every process
+on the host) for gunicorn or Celery prefork workers: each process then
+writes its samples to memory-mapped files there and ``/metrics`` aggregates
+them. Without ``prometheus_client`` installed every hook is a no-op and
+``/metrics`` answers 503.
+
+Scrapes need ``Authorization: Bearer <METRICS["TOKEN"]>``. Without a token
+``/metrics`` is only served with ``DEBUG`` on, or with ``ALLOW_ANONYMOUS``
+for deployments where the path is reachable from the internal network only.
+"""
+
+import contextvars
+import hmac
+import os
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.http import HttpResponse
+
+try:
+    import prometheus_client
+    from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, multiprocess
+    from prometheus_client.core import GaugeMetricFamily
+except ImportError:  # pragma: no cover - optional dependency
+    prometheus_client = None
+
+DEFAULT_METRICS = {
+    "ENABLED": True,
+    # Bearer token required to scrape /metrics
+    "TOKEN": None,
+    # Serve /metrics without a token outside DEBUG; only when the path is
+    # not reachable from outside (internal bind or proxy rule)
+    "ALLOW_ANONYMOUS": False,
+    # Broker queues whose length is reported
+    "QUEUES": ["celery"],
+}
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+TASK_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300, 900)
+
+
+def metrics_settings():
+    return {**DEFAULT_METRICS, **getattr(settings, "METRICS", {})}
+
+
+ENABLED = prometheus_client is not None and metrics_settings()["ENABLED"]
+
+if ENABLED:
+    REQUESTS = Counter(
+        "http_requests_total", "HTTP requests by view, method and status.", ["view", "method", "status"]
+    )
+    REQUEST_LATENCY = Histogram(
+        "http_request_duration_seconds", "HTTP request latency by view.", ["view", "method"],
+        buckets=LATENCY_BUCKETS,
+    )
+    REQUEST_QUERIES = Histogram(
+        "http_request_db_queries", "Database queries per HTTP request by view.", ["view"],
+        buckets=QUERY_BUCKETS,
+    )
+    DB_QUERIES = Counter("db_queries_total", "Database queries by connection alias.", ["alias"])
+    CACHE_LOOKUPS = Counter(
+        "cache_lookups_total", "Cache lookups by cache and result.", ["cache", "result"]
+    )
+    CACHE_EVICTIONS = Counter(
+        "cache_evictions_total", "Entries evicted from in-process caches to stay within bounds.", ["cache"]
+    )
+    # Summed over live processes in multiprocess mode
+    CACHE_ENTRIES = Gauge(
+        "cache_l1_entries", "Entries held by in-process caches.", ["cache"], multiprocess_mode="livesum"
+    )
+    CACHE_BYTES = Gauge(
+        "cache_l1_bytes", "Pickled bytes held by in-process caches.", ["cache"],
+        multiprocess_mode="livesum",
+    )
+    AUTH_ATTEMPTS = Counter(
+        "auth_token_checks_total", "Bearer token checks by result.", ["result"]
+    )
+    TASK_QUEUE_WAIT = Histogram(
+        "celery_task_queue_wait_seconds", "Time from publish to start by task.", ["task"],
+        buckets=TASK_BUCKETS,
+    )
+    TASK_DURATION = Histogram(
+        "celery_task_duration_seconds", "Task run time by task and final state.", ["task", "state"],
+        buckets=TASK_BUCKETS,
+    )
+    NOTIFICATIONS = Counter(
+        "notifications_total", "Notification sends by kind and outcome.", ["kind", "outcome"]
+    )
+
+
+def count_cache_lookup(cache, result):
+    if ENABLED:
+        CACHE_LOOKUPS.labels(cache, result).inc()
+
+
+def record_cache_size(cache, entries, size, evicted=0):
+    """Current size of an in-process cache and how many entries it just evicted."""
+    if ENABLED:
+        CACHE_ENTRIES.labels(cache).set(entries)
+        CACHE_BYTES.labels(cache).set(size)
+        if evicted:
+            CACHE_EVICTIONS.labels(cache).inc(evicted)
+
+
+def count_auth(result):
+    if ENABLED:
+        AUTH_ATTEMPTS.labels(result).inc()
+
+
+def count_notification(kind, outcome):
+    if ENABLED:
+        NOTIFICATIONS.labels(kind, outcome).inc()
+
+
+# Database queries
+
+_request_queries = contextvars.ContextVar("request_queries", default=None)
+
+
+def _count_query(execute, sql, params, many, context):
+    if ENABLED:
+        DB_QUERIES.labels(context["connection"].alias).inc()
+    counter = _request_queries.get()
+    if counter is not None:
+        counter[0] += 1
+    return execute(sql, params, many, context)
+
+
+def _install_query_counter(sender, connection, **kwargs):
+    if _count_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_count_query)
+
+
+connection_created.connect(_install_query_counter)
+
+
+# Requests
+
+
+def _view_label(request):
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        # Bounded label set: unknown paths are not recorded individually
+        return "<unmatched>"
+    return match.view_name or match._func_path
+
+
+class MetricsMiddleware:
+    """Request count, latency and query count per view; goes first in MIDDLEWARE."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not ENABLED:
+            return self.get_response(request)
+        counter, token = self._start()
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_queries.reset(token)
+        self._record(request, response, started, counter[0])
+        return response
+
+    async def __acall__(self, request):
+        if not ENABLED:
+            return await self.get_response(request)
+        counter, token = self._start()
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _request_queries.reset(token)
+        self._record(request, response, started, counter[0])
+        return response
+
+    def _start(self):
+        counter = [0]
+        return counter, _request_queries.set(counter)
+
+    def _record(self, request, response, started, queries):
+        view = _view_label(request)
+        REQUEST_LATENCY.labels(view, request.method).observe(time.perf_counter() - started)
+        REQUESTS.labels(view, request.method, response.status_code).inc()
+        REQUEST_QUERIES.labels(view).observe(queries)
+
+
+# Celery
+
+
+def _connect_task_signals():
+    from celery.signals import before_task_publish, task_postrun, task_prerun
+
+    @before_task_publish.connect(weak=False)
+    def stamp_published(headers=None, **kwargs):
+        if headers is not None:
+            headers["published_at"] = time.time()
+
+    @task_prerun.connect(weak=False)
+    def observe_queue_wait(task=None, **kwargs):
+        task.request.metrics_started = time.monotonic()
+        published_at = getattr(task.request, "published_at", None)
+        if published_at is not None:
+            # Wall clocks of the publisher and the worker host are compared
+            TASK_QUEUE_WAIT.labels(task.name).observe(max(time.time() - published_at, 0))
+
+    @task_postrun.connect(weak=False)
+    def observe_duration(task=None, state=None, **kwargs):
+        started = getattr(task.request, "metrics_started", None)
+        if started is not None:
+            TASK_DURATION.labels(task.name, state or "UNKNOWN").observe(time.monotonic() - started)
+
+
+if ENABLED:
+    _connect_task_signals()
+
+
+class QueueLengthCollector:
+    """Broker queue lengths, read when /metrics is scraped."""
+
+    def __init__(self, queues):
+        self.queues = queues
+
+    def collect(self):
+        from expense_tracker.celery import app
+
+        family = GaugeMetricFamily("celery_queue_length", "Messages waiting in the broker queue.", labels=["queue"])
+        try:
+            with app.connection_for_read() as connection:
+                channel = connection.default_channel
+                for queue in self.queues:
+                    family.add_metric([queue], channel.queue_declare(queue, passive=True).message_count)
+        except Exception:
+            # An unreachable broker must not break the scrape
+            pass
+        yield family
+
+
+def metrics_view(request):
+    if not ENABLED:
+        return HttpResponse("metrics are disabled", status=503, content_type="text/plain")
+    config = metrics_settings()
+    if config["TOKEN"]:
+        supplied = request.headers.get("Authorization", "")
+        if not hmac.compare_digest(supplied.encode(), f"Bearer {config['TOKEN']}".encode()):
+            return HttpResponse(status=401)
+    elif not (settings.DEBUG or config["ALLOW_ANONYMOUS"]):
+        return HttpResponse(
+            "set METRICS_TOKEN to scrape metrics", status=403, content_type="text/plain"
+        )
+
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        output = prometheus_client.generate_latest(registry)
+    else:
+        output = prometheus_client.generate_latest(prometheus_client.REGISTRY)
+    queues = CollectorRegistry()
+    queues.register(QueueLengthCollector(config["QUEUES"]))
+    output += prometheus_client.generate_latest(queues)
+    return HttpResponse(output, content_type=prometheus_client.CONTENT_TYPE_LATEST)
@@ -0,0 +1,64 @@
+"""
+Path-aware versions of Django's session, CSRF, auth and message middleware.
+
+API routes authenticate with Bearer tokens only, so loading a session,
+checking CSRF cookies, building a lazy ``request.user`` and setting up
+message storage is wasted work there. Each class here subclasses the Django
+middleware it replaces (so admin system checks still find it) and steps
+aside for paths under ``LEAN_MIDDLEWARE["PATH_PREFIXES"]``. Every other path,
+including ``/admin/`` and ``/swagger/``, gets the full behaviour.
+"""
+
+from django.conf import settings
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.middleware.csrf import CsrfViewMiddleware
+
+DEFAULT_LEAN_MIDDLEWARE = {
+    # Requests under these prefixes skip session, CSRF, auth and messages
+    "PATH_PREFIXES": ["/api/"],
+}
+
+
+def lean_prefixes():
+    config = {**DEFAULT_LEAN_MIDDLEWARE, **getattr(settings, "LEAN_MIDDLEWARE", {})}
+    return tuple(config["PATH_PREFIXES"])
+
+
+class LeanPathMixin:
+    """Skips the wrapped middleware for requests under the lean prefixes."""
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.lean_prefixes = lean_prefixes()
+
+    def is_lean(self, request):
+        return request.path_info.startswith(self.lean_prefixes)
+
+    def __call__(self, request):
+        if self.is_lean(request):
+            # A coroutine in async mode; the caller awaits it either way
+            return self.get_response(request)
+        return super().__call__(request)
+
+
+class LeanSessionMiddleware(LeanPathMixin, SessionMiddleware):
+    pass
+
+
+class LeanCsrfViewMiddleware(LeanPathMixin, CsrfViewMiddleware):
+    # Django calls process_view separately from the middleware chain
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        if self.is_lean(request):
+            return None
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+
+class LeanAuthenticationMiddleware(LeanPathMixin, AuthenticationMiddleware):
+    # DRF sets request.user from the token during authentication
+    pass
+
+
+class LeanMessageMiddleware(LeanPathMixin, MessageMiddleware):
+    pass
@@ -1,14 +1,96 @@
 # helpers/models.py
+import os
+import threading
+import time
 import uuid
 from django.db import models
+from django.utils import timezone
 
 
-class BaseModel(models.Model):
+_uuid7_lock = threading.Lock()
+_uuid7_last = [0, 0]  # [unix ms, 12-bit sequence]
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+def uuid7():
+    """
+    Time-ordered UUID (RFC 9562 version 7): 48-bit Unix milliseconds, a
+    12-bit sequence that keeps IDs from the same millisecond increasing
+    within a process, then 62 random bits. New rows append to the right
+    edge of the primary-key index instead of landing on random pages.
+    """
+    with _uuid7_lock:
+        ms = time.time_ns() // 1_000_000
+        last_ms, seq = _uuid7_last
+        if ms > last_ms:
+            seq = int.from_bytes(os.urandom(2), "big") & 0x7FF  # leave room to count up
+        else:
+            ms, seq = last_ms, seq + 1
+            if seq > 0xFFF:  # sequence exhausted: borrow the next millisecond
+                ms, seq = ms + 1, 0
+        _uuid7_last[:] = [ms, seq]
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (ms << 80) | (0x7 << 76) | (seq << 64) | (0b10 << 62) | rand_b
+    return uuid.UUID(int=value)
+
+
+class SoftDeleteQuerySet(models.QuerySet):
+    def live(self):
+        return self.filter(is_deleted=False)
+
+    def soft_delete(self):
+        """
+        Mark all rows deleted with a single UPDATE. ``update()`` skips
+        post_save, so the owners' data versions are bumped here.
+        """
+        from utils.versioning import bump_data_version
+
+        user_ids = set(self.values_list("user_id", flat=True).distinct())
+        changes = {"is_deleted": True}
+        if any(field.name == "updated_at" for field in self.model._meta.fields):
+            changes["updated_at"] = timezone.now()
+        count = self.update(**changes)
+        for user_id in user_ids:
+            bump_data_version(user_id)
+        return count
+
+
+class LiveManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
+    """Default manager for soft-deletable models: only rows with is_deleted=False."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(is_deleted=False)
+
+
+AllRowsManager = models.Manager.from_queryset(SoftDeleteQuerySet)
+
+
+class SoftDeleteMixin:
+    """
+    ``objects`` returns live rows and ``all_objects`` every row. Models set
+    ``Meta.default_manager_name = "all_objects"`` so admin, serializer
+    relation fields and related lookups still see soft-deleted rows and keep
+    their existing error messages.
+    """
+
+    def soft_delete(self):
+        self.is_deleted = True
+        update_fields = ["is_deleted"]
+        if hasattr(self, "updated_at"):
+            update_fields.append("updated_at")
+        self.save(update_fields=update_fields)
+
+
+class BaseModel(SoftDeleteMixin, models.Model):
+
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_deleted = models.BooleanField(default=False)
 
+    objects = LiveManager()
+    all_objects = AllRowsManager()
+
     class Meta:
         abstract = True
+        default_manager_name = "all_objects"
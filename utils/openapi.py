@@ -0,0 +1,65 @@
+"""
+drf_yasg schema generation and the docs UI routes.
+
+Only imported when ``API_DOCS["ENABLED"]`` is on (see ``utils.api_docs``).
+The schema is public, so it is generated on the first request and reused
+for the life of the process instead of being rebuilt on every hit.
+"""
+
+import threading
+
+from django.urls import path, re_path
+from drf_yasg import openapi
+from drf_yasg.generators import OpenAPISchemaGenerator
+from drf_yasg.views import get_schema_view
+from rest_framework import permissions
+
+API_INFO = openapi.Info(
+    title="Transaction API",
+    default_version="v1",
+    description="API documentation for Transactions",
+    terms_of_service="https://www.shaktisingh.tech/",
+    contact=openapi.Contact(email="support@example.com"),
+    license=openapi.License(name="MIT License"),
+)
+
+
+class DocsSchemaGenerator(OpenAPISchemaGenerator):
+    """Applies ``@api_docs`` overrides and memoises public schemas per process."""
+
+    _schemas = {}
+    _lock = threading.Lock()
+
+    def get_overrides(self, view, method):
+        overrides = super().get_overrides(view, method)
+        action = getattr(view, "action", method.lower())
+        factory = getattr(getattr(view, action, None), "_api_docs", None)
+        if factory is not None:
+            overrides = {**factory(), **overrides}
+        return overrides
+
+    def get_schema(self, request=None, public=False):
+        if not public:
+            # Depends on the requesting user's permissions
+            return super().get_schema(request, public)
+        # A public schema only varies with the base URL it is served under
+        base_url = self.url or (request.build_absolute_uri("/") if request else None)
+        key = (base_url, self.version)
+        with self._lock:
+            if key not in self._schemas:
+                self._schemas[key] = super().get_schema(request, public)
+            return self._schemas[key]
+
+
+schema_view = get_schema_view(
+    API_INFO,
+    public=True,
+    permission_classes=(permissions.AllowAny,),
+    generator_class=DocsSchemaGenerator,
+)
+
+urlpatterns = [
+    path("swagger/", schema_view.with_ui("swagger", cache_timeout=0), name="schema-swagger-ui"),
+    path("redoc/", schema_view.with_ui("redoc", cache_timeout=0), name="schema-redoc"),
+    re_path(r"^swagger(?P<format>\.json|\.yaml)$", schema_view.without_ui(cache_timeout=0), name="schema-json"),
+]
@@ -0,0 +1,74 @@
+"""
+Calendar-month periods as half-open ``[start, end)`` datetime ranges.
+
+Filtering with ``date__year``/``date__month`` compiles to ``EXTRACT`` over a
+timezone-converted column, which no index on ``date`` can serve. These
+helpers turn a (year, month) into aware boundaries instead, so the same
+filter becomes ``date >= start AND date < end``. Months follow
+``settings.TIME_ZONE`` unless another timezone (a ``tzinfo`` or IANA name)
+is passed.
+"""
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.utils import timezone
+
+
+def resolve_timezone(tz=None):
+    if tz is None:
+        return timezone.get_default_timezone()
+    if isinstance(tz, str):
+        return ZoneInfo(tz)
+    return tz
+
+
+def add_months(year, month, count):
+    """(year, month) shifted by ``count`` months."""
+    index = year * 12 + (month - 1) + count
+    return index // 12, index % 12 + 1
+
+
+def month_start(year, month, tz=None):
+    """Aware midnight on the first day of the month. Raises ValueError for a bad month."""
+    return datetime(year, month, 1, tzinfo=resolve_timezone(tz))
+
+
+def month_range(year, month, tz=None):
+    """``(start, end)`` of the month; ``end`` is the start of the next month."""
+    return month_start(year, month, tz), month_start(*add_months(year, month, 1), tz)
+
+
+def month_of(value, tz=None):
+    """(year, month) an aware datetime falls in, in the given timezone."""
+    local = timezone.localtime(value, resolve_timezone(tz))
+    return local.year, local.month
+
+
+def period_filter(year, month, field="date", tz=None):
+    """Filter kwargs selecting ``field`` within the month."""
+    start, end = month_range(year, month, tz)
+    return {f"{field}__gte": start, f"{field}__lt": end}
+
+
+def periods_q(periods, field="date", tz=None):
+    """``Q`` matching any of the (year, month) periods."""
+    query = Q()
+    for year, month in periods:
+        query |= Q(**period_filter(year, month, field, tz))
+    return query
+
+
+def period_index(periods, field="date", tz=None):
+    """
+    Expression numbering the period each row falls in (its position in
+    ``periods``), for grouping aggregates by month without ``EXTRACT``.
+    """
+    return Case(
+        *(
+            When(Q(**period_filter(year, month, field, tz)), then=Value(position))
+            for position, (year, month) in enumerate(periods)
+        ),
+        output_field=IntegerField(),
+    )
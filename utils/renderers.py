@@ -0,0 +1,62 @@
+from decimal import Decimal
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+
+_encoder = JSONEncoder()
+
+
+def _default(obj):
+    """
+    Fallback for types orjson does not encode natively. Decimals are emitted
+    as strings so amounts never lose precision; everything else, including
+    datetimes, dates and times (passed through by orjson), follows DRF's
+    JSONEncoder.
+    """
+    if isinstance(obj, Decimal):
+        return str(obj)
+    return _encoder.default(obj)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer backed by orjson when it is installed.
+
+    Produces the same bytes as DRF's compact, non-ASCII-escaping output for
+    the envelopes built in utils/responses.py: datetimes are formatted by
+    DRF's encoder (milliseconds, UTC as ``Z``), UUIDs are hyphenated strings
+    and U+2028/U+2029 are escaped. Indented output, custom encoders,
+    ``STRICT_JSON = False`` and anything orjson rejects (e.g. integers beyond
+    64 bits) go through the stock renderer.
+
+    One difference remains: with ``STRICT_JSON`` on (the default), DRF raises
+    on NaN and Infinity while orjson writes them as ``null``.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        renderer_context = renderer_context or {}
+        if (
+            self.encoder_class is not JSONEncoder
+            or not self.compact
+            or self.ensure_ascii
+            or not self.strict
+            or self.get_indent(accepted_media_type, renderer_context)
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=_default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Match JSONRenderer, which escapes these for JavaScript compatibility
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
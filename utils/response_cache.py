@@ -0,0 +1,185 @@
+import hashlib
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework import status
+from rest_framework.response import Response
+
+from utils.db_router import reads_cacheable
+from utils.metrics import count_cache_lookup, record_cache_size
+from utils.versioning import get_request_data_version
+
+DEFAULT_RESPONSE_CACHE = {
+    "ALIAS": "default",
+    "TIMEOUT": 300,  # seconds
+    "L1_MAX_ENTRIES": 5000,
+    "L1_MAX_BYTES": 32 * 1024 * 1024,
+}
+
+
+class LRUCache:
+    """
+    Thread-safe in-process LRU bounded by entry count and by the pickled
+    size of its values. Expired entries are dropped on read.
+    """
+
+    def __init__(self, max_entries, max_bytes):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, size, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.bytes -= size
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, size, timeout):
+        """Store ``value``; returns how many entries were evicted to make room."""
+        if size > self.max_bytes:
+            return 0
+        evicted = 0
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._data[key] = (value, size, time.monotonic() + timeout)
+            self.bytes += size
+            while len(self._data) > self.max_entries or self.bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._data.popitem(last=False)
+                self.bytes -= evicted_size
+                evicted += 1
+            self.evictions += evicted
+        return evicted
+
+    def __len__(self):
+        return len(self._data)
+
+
+class ResponseCache:
+    """
+    Two-level cache for serialized response data: an in-process LRU (L1) in
+    front of the shared Django cache (L2, Redis). Keys embed the user's data
+    version, so writes invalidate implicitly and stale entries simply age out.
+    """
+
+    def __init__(self):
+        config = {**DEFAULT_RESPONSE_CACHE, **getattr(settings, "RESPONSE_CACHE", {})}
+        self.alias = config["ALIAS"]
+        self.timeout = config["TIMEOUT"]
+        self.l1 = LRUCache(config["L1_MAX_ENTRIES"], config["L1_MAX_BYTES"])
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        value = self.l1.get(key)
+        if value is not None:
+            self.l1_hits += 1
+            count_cache_lookup("response", "l1_hit")
+            return value
+
+        raw = caches[self.alias].get(key)
+        if raw is None:
+            self.misses += 1
+            count_cache_lookup("response", "miss")
+            return None
+
+        self.l2_hits += 1
+        count_cache_lookup("response", "l2_hit")
+        value = pickle.loads(raw)
+        self._l1_set(key, value, len(raw))
+        return value
+
+    def set(self, key, value):
+        raw = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        caches[self.alias].set(key, raw, self.timeout)
+        self._l1_set(key, value, len(raw))
+
+    def _l1_set(self, key, value, size):
+        evicted = self.l1.set(key, value, size, self.timeout)
+        record_cache_size("response", len(self.l1), self.l1.bytes, evicted)
+
+    def stats(self):
+        lookups = self.l1_hits + self.l2_hits + self.misses
+        return {
+            "lookups": lookups,
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "misses": self.misses,
+            "hit_ratio": round((self.l1_hits + self.l2_hits) / lookups, 4) if lookups else 0.0,
+            "l1_entries": len(self.l1),
+            "l1_bytes": self.l1.bytes,
+            "l1_max_bytes": self.l1.max_bytes,
+            "l1_evictions": self.l1.evictions,
+        }
+
+
+response_cache = ResponseCache()
+
+
+def make_cache_key(request, version):
+    """Key from view path, user, data version and sorted query params (incl. page)."""
+    params = sorted(request.query_params.lists())
+    source = f"{request.path}|{params}|{getattr(request, 'accepted_media_type', '')}"
+    digest = hashlib.md5(source.encode(), usedforsecurity=False).hexdigest()
+    return f"resp:{request.user.id}:{version}:{digest}"
+
+
+def cache_response(view_method):
+    """
+    Serve a GET from the response cache when this user's data is unchanged,
+    otherwise run the view and cache its 200 response data (unless it may
+    predate the current version, see ``db_router.reads_cacheable``). Works
+    on sync and async handlers.
+    """
+
+    if iscoroutinefunction(view_method):
+
+        @wraps(view_method)
+        async def async_wrapper(self, request, *args, **kwargs):
+            version = await sync_to_async(get_request_data_version)(request)
+            key = make_cache_key(request, version)
+
+            data = await sync_to_async(response_cache.get)(key)
+            if data is not None:
+                return Response(data, status=status.HTTP_200_OK)
+
+            response = await view_method(self, request, *args, **kwargs)
+            if response.status_code == status.HTTP_200_OK:
+                if await sync_to_async(reads_cacheable)():
+                    await sync_to_async(response_cache.set)(key, response.data)
+            return response
+
+        return async_wrapper
+
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        key = make_cache_key(request, get_request_data_version(request))
+
+        data = response_cache.get(key)
+        if data is not None:
+            return Response(data, status=status.HTTP_200_OK)
+
+        response = view_method(self, request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK and reads_cacheable():
+            response_cache.set(key, response.data)
+        return response
+
+    return wrapper
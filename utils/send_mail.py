@@ -1,25 +1,41 @@
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail
+import logging
+
 from django.conf import settings
 from expense_tracker.secrets import SENDGRID_API_KEY
+from utils.metrics import count_notification
+from utils.tracing import span
+
+logger = logging.getLogger(__name__)
 
 
 def send_email(to_email, reset_link):
     """Sends an email using SendGrid API"""
+    # Imported here so only the worker that sends mail loads sendgrid
+    from sendgrid import SendGridAPIClient
+    from sendgrid.helpers.mail import Mail
+
     message = Mail(
         from_email="shakti@gkmit.co",
         to_emails=to_email,
     )
     dynamic_template_data = {"reset_link": reset_link}
-    print("Hello")
     message.dynamic_template_data = dynamic_template_data
     message.template_id = "d-36f7a9ccf47a4a199e7acb16f3c1f0e6"
 
     try:
+        if getattr(settings, "SENDGRID_DRY_RUN", False):
+            logger.info("Dry run: password reset email to %s not sent", to_email)
+            count_notification("password_reset", "dry_run")
+            return (202,)
         sg = SendGridAPIClient(SENDGRID_API_KEY)  # Use API key from settings
-        response = sg.send(message)
-        print("Hello mail is sended successfully to the user")
+        with span("sendgrid.send", kind="password_reset") as current:
+            response = sg.send(message)
+            if current is not None:
+                current.set(status_code=response.status_code)
+        logger.info("Password reset email sent to %s, status code: %s", to_email, response.status_code)
+        count_notification("password_reset", "sent" if response.status_code < 300 else "rejected")
         return (response.status_code,)  # 202 means email is sent
     except Exception as e:
-        print(f"Email sending failed: {str(e)}")  # Log the error
+        logger.exception("Email sending failed: %s", e)
+        count_notification("password_reset", "failed")
         return None
@@ -0,0 +1,111 @@
+from decimal import Decimal
+
+from django.db.models.query import QuerySet
+from django.utils import timezone
+from rest_framework.settings import api_settings
+
+
+def uuid_converter():
+    """UUIDs are rendered in their hyphenated string form."""
+    return str
+
+
+def decimal_converter(decimal_places):
+    """
+    Returns a converter factory matching DRF's DecimalField output
+    (quantized, fixed-point string).
+    """
+    exponent = Decimal(".1") ** decimal_places
+
+    def factory():
+        if not api_settings.COERCE_DECIMAL_TO_STRING:
+            return lambda value: value.quantize(exponent)
+        return lambda value: "{:f}".format(value.quantize(exponent))
+
+    return factory
+
+
+def datetime_converter():
+    """
+    Matches DRF's DateTimeField output: converted to the active timezone and
+    rendered as ISO 8601 with a trailing ``Z`` for UTC.
+    """
+    tz = timezone.get_current_timezone()
+    output_format = api_settings.DATETIME_FORMAT
+
+    if output_format is None:
+        return None
+
+    if output_format.lower() != "iso-8601":
+        return lambda value: value.astimezone(tz).strftime(output_format)
+
+    def convert(value):
+        value = value.astimezone(tz).isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+
+    return convert
+
+
+class ValuesListSerializer:
+    """
+    Read-only serializer for large list responses.
+
+    Rows are fetched with ``values_list`` using only the declared columns and
+    converted with per-field functions built once per serializer instance,
+    skipping model instantiation and DRF field machinery. Output must stay
+    identical to the matching ModelSerializer, so ``fields`` lists
+    ``(output name, ORM lookup, converter factory)`` in the same order.
+    A lookup of ``None`` reserves the key for a value filled in by a subclass.
+    """
+
+    fields = ()
+
+    def __init__(self, rows):
+        self.rows = rows
+        self._converters = []
+        for index, (_, _, factory) in enumerate(self._selected_fields()):
+            convert = factory() if factory else None
+            if convert:
+                self._converters.append((index, convert))
+
+    @classmethod
+    def _selected_fields(cls):
+        return [field for field in cls.fields if field[1] is not None]
+
+    @classmethod
+    def index(cls, name):
+        """Position of field ``name`` in the tuples returned by ``values``."""
+        return [field[0] for field in cls._selected_fields()].index(name)
+
+    @classmethod
+    def values(cls, queryset):
+        """Narrow a queryset to the tuples this serializer consumes."""
+        return queryset.values_list(*[lookup for _, lookup, _ in cls._selected_fields()])
+
+    @property
+    def data(self):
+        rows = self.rows
+        if isinstance(rows, QuerySet):
+            rows = self.values(rows)
+
+        selected = [name for name, _, _ in self._selected_fields()]
+        order = [name for name, _, _ in self.fields]
+        has_computed = len(order) != len(selected)
+        converters = self._converters
+
+        items = []
+        for row in rows:
+            row = list(row)
+            for index, convert in converters:
+                value = row[index]
+                if value is not None:
+                    row[index] = convert(value)
+            if has_computed:
+                item = dict.fromkeys(order)
+                item.update(zip(selected, row))
+            else:
+                item = dict(zip(selected, row))
+            items.append(item)
+        return items
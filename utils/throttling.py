@@ -0,0 +1,207 @@
+"""
+Token-bucket request throttling.
+
+Each (scope, client) pair has a bucket holding up to N tokens that refills
+at N per period, so a rate of ``"60/min"`` allows bursts of 60 and a
+sustained 1 request per second. Scopes:
+
+* ``auth``: login and password reset, keyed by client IP (``AuthThrottle``),
+* ``read`` / ``write``: safe vs unsafe methods on every other view, keyed by
+  user id, or by IP for anonymous clients (``ReadWriteThrottle``, the default).
+
+Rates are looked up by tier (``anon``, ``user`` or ``staff``) in
+``THROTTLING["RATES"]``. With a Redis cache the bucket is refilled and
+debited by one Lua script, so each check is a single atomic round trip and
+every process shares the same buckets. Other cache backends, or Redis being
+unreachable, fall back to per-process buckets. Rejected requests get 429
+with a ``Retry-After`` header.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.throttling import BaseThrottle
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THROTTLING = {
+    "ENABLED": True,
+    "ALIAS": "default",
+    # tier -> scope -> "requests/period" (period: s, sec, m, min, h, hour, d, day)
+    "RATES": {
+        "anon": {"auth": "10/min", "read": "60/min", "write": "20/min"},
+        "user": {"auth": "10/min", "read": "300/min", "write": "60/min"},
+        "staff": {"auth": "30/min", "read": "1200/min", "write": "300/min"},
+    },
+    # Buckets kept per process when Redis is not available
+    "LOCAL_MAX_BUCKETS": 100_000,
+}
+
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# KEYS[1] bucket; ARGV capacity, refill per second. Uses the Redis clock so
+# web hosts with skewed clocks share buckets correctly.
+TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local refill = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * refill)
+local allowed = 0
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    wait = (1 - tokens) / refill
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / refill * 1000) + 1000)
+return {allowed, tostring(wait)}
+"""
+
+
+def throttle_settings():
+    return {**DEFAULT_THROTTLING, **getattr(settings, "THROTTLING", {})}
+
+
+def parse_rate(rate):
+    """``"60/min"`` to ``(capacity, tokens per second)``."""
+    count, period = rate.split("/")
+    return int(count), int(count) / PERIODS[period.strip()[0]]
+
+
+class LocalBuckets:
+    """In-process token buckets, bounded by evicting the least recently used."""
+
+    def __init__(self, max_buckets):
+        self.max_buckets = max_buckets
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def consume(self, key, capacity, refill):
+        now = time.monotonic()
+        with self._lock:
+            tokens, ts = self._buckets.pop(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - ts) * refill)
+            if tokens >= 1:
+                allowed, wait, tokens = True, 0.0, tokens - 1
+            else:
+                allowed, wait = False, (1 - tokens) / refill
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+        return allowed, wait
+
+
+class TokenBuckets:
+    """Bucket storage: Redis through the Django cache, else ``LocalBuckets``."""
+
+    def __init__(self):
+        config = throttle_settings()
+        self.cache = caches[config["ALIAS"]]
+        self.local = LocalBuckets(config["LOCAL_MAX_BUCKETS"])
+        self._script = None
+        self._lock = threading.Lock()
+        self._warned_at = 0.0
+
+    def _redis_script(self, key):
+        # Django's RedisCache; other backends have no server-side scripting
+        client_factory = getattr(self.cache, "_cache", None)
+        if not hasattr(client_factory, "get_client"):
+            return None
+        client = client_factory.get_client(key, write=True)
+        if self._script is None:
+            with self._lock:
+                if self._script is None:
+                    self._script = client.register_script(TOKEN_BUCKET_LUA)
+        return lambda capacity, refill: self._script(keys=[key], args=[capacity, refill], client=client)
+
+    def consume(self, key, capacity, refill):
+        """``(allowed, seconds until a token is available)``."""
+        key = self.cache.make_key(f"throttle:{key}")
+        try:
+            script = self._redis_script(key)
+            if script is not None:
+                allowed, wait = script(capacity, refill)
+                return bool(allowed), float(wait)
+        except Exception as exc:
+            if time.monotonic() - self._warned_at > 60:
+                self._warned_at = time.monotonic()
+                logger.warning("Throttle falling back to in-process buckets: %s", exc)
+        return self.local.consume(key, capacity, refill)
+
+
+_buckets = None
+
+
+def get_buckets():
+    global _buckets
+    if _buckets is None:
+        _buckets = TokenBuckets()
+    return _buckets
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """Base class; subclasses choose the scope and the client identity."""
+
+    def get_scope(self, request, view):
+        raise NotImplementedError
+
+    def get_tier(self, request):
+        user = getattr(request, "user", None)
+        if user is None or not user.is_authenticated:
+            return "anon"
+        return "staff" if user.is_staff else "user"
+
+    def get_cache_key(self, request, view):
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            return f"user:{user.pk}"
+        return f"ip:{self.get_ident(request)}"
+
+    def allow_request(self, request, view):
+        self.wait_seconds = None
+        config = throttle_settings()
+        if not config["ENABLED"]:
+            return True
+        scope = self.get_scope(request, view)
+        rate = config["RATES"].get(self.get_tier(request), {}).get(scope)
+        if rate is None:
+            return True
+        capacity, refill = parse_rate(rate)
+        allowed, wait = get_buckets().consume(
+            f"{scope}:{self.get_cache_key(request, view)}", capacity, refill
+        )
+        if not allowed:
+            self.wait_seconds = wait
+        return allowed
+
+    def wait(self):
+        # Whole seconds, rounded up, for the Retry-After header
+        return math.ceil(self.wait_seconds) if self.wait_seconds else None
+
+
+class ReadWriteThrottle(TokenBucketThrottle):
+    """``read`` bucket for safe methods, ``write`` for the rest."""
+
+    def get_scope(self, request, view):
+        return "read" if request.method in ("GET", "HEAD", "OPTIONS") else "write"
+
+
+class AuthThrottle(TokenBucketThrottle):
+    """``auth`` bucket per client IP, for credential endpoints."""
+
+    def get_scope(self, request, view):
+        return "auth"
+
+    def get_cache_key(self, request, view):
+        return f"ip:{self.get_ident(request)}"
@@ -2,6 +2,7 @@ import logging
 from rest_framework_simplejwt.tokens import RefreshToken, AccessToken
 from rest_framework.exceptions import ValidationError
 from user.models import ActiveTokens
+from utils.logging import redact_token
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -54,9 +55,9 @@ class TokenHandler:
         """
         deleted_count, _ = ActiveTokens.objects.filter(token=token).delete()
         if deleted_count == 0:
-            logger.warning(f"Attempted to invalidate a non-existent token: {token}.")
+            logger.warning(f"Attempted to invalidate a non-existent token: {redact_token(token)}.")
         else:
-            logger.info(f"Invalidated access token: {token}.")
+            logger.info(f"Invalidated access token: {redact_token(token)}.")
 
     @staticmethod
     def blacklist_refresh_token(refresh_token):
@@ -66,9 +67,9 @@ class TokenHandler:
         try:
             token = RefreshToken(refresh_token)
             token.blacklist()
-            logger.info(f"Blacklisted refresh token: {refresh_token}.")
+            logger.info(f"Blacklisted refresh token: {redact_token(refresh_token)}.")
         except Exception as e:
-            logger.error(f"Error blacklisting refresh token {refresh_token}: {str(e)}")
+            logger.error(f"Error blacklisting refresh token {redact_token(refresh_token)}: {str(e)}")
             raise ValidationError(f"Error blacklisting refresh token: {str(e)}")
 
     @staticmethod
@@ -80,7 +81,7 @@ class TokenHandler:
             active_token = ActiveTokens.objects.filter(token=token).first()
             if not active_token:
                 raise ValidationError("Token is invalid or has been logged out.")
-            logger.info(f"Token {token} is valid.")
+            logger.info(f"Token {redact_token(token)} is valid.")
             return active_token.user
         except ValidationError as e:
             logger.error(f"Token validation failed: {str(e)}.")
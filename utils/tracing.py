@@ -0,0 +1,343 @@
+"""
+Request-to-task tracing with W3C ``traceparent`` propagation.
+
+``TracingMiddleware`` starts a trace per request (continuing an incoming
+``traceparent``). While a sampled span is current, ``span()`` blocks, bearer
+token authentication, serializer validation (``TracedValidationMixin``) and
+every database query open child spans. ``traceparent`` is copied into the
+headers of Celery tasks published during the request. The worker continues
+the trace with a ``celery.queue_wait`` span, covering publish to start, and a
+span for the task itself, so notification sends appear under the request
+that caused them.
+
+Sampling is decided once, at the root, and inherited by everything
+downstream. The rate comes from ``TRACING["SAMPLE_RATE"]`` and can be changed
+at runtime with ``manage.py traces --rate`` (stored in the shared cache and
+re-read every ``RATE_REFRESH_SECONDS``). Finished spans of sampled traces go
+to the ``tracing`` logger as JSON lines, which settings.LOGGING writes to
+``TRACES_FILE`` off the request thread.
+"""
+
+import contextvars
+import json
+import logging
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.db.backends.signals import connection_created
+
+DEFAULT_TRACING = {
+    "ENABLED": True,
+    # Share of new traces that are recorded; downstream spans follow the root
+    "SAMPLE_RATE": 0.01,
+    # How often each process re-reads a rate set with ``manage.py traces --rate``
+    "RATE_REFRESH_SECONDS": 10,
+    # Characters of SQL kept on db.query spans
+    "SQL_MAX_LENGTH": 300,
+}
+
+RATE_CACHE_KEY = "tracing:sample-rate"
+
+exporter = logging.getLogger("tracing")
+
+
+def tracing_settings():
+    return {**DEFAULT_TRACING, **getattr(settings, "TRACING", {})}
+
+
+ENABLED = tracing_settings()["ENABLED"]
+
+
+# Sampling
+
+
+class _Sampler:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rate = None
+        self._checked_at = 0.0
+
+    def rate(self):
+        config = tracing_settings()
+        now = time.monotonic()
+        if self._rate is None or now - self._checked_at > config["RATE_REFRESH_SECONDS"]:
+            with self._lock:
+                try:
+                    override = cache.get(RATE_CACHE_KEY)
+                except Exception:
+                    # An unreachable cache keeps the last known rate
+                    override = self._rate
+                self._rate = config["SAMPLE_RATE"] if override is None else float(override)
+                self._checked_at = now
+        return self._rate
+
+    def sample(self):
+        return random.random() < self.rate()
+
+
+sampler = _Sampler()
+
+
+def set_sample_rate(rate):
+    """Change the sample rate for every process; None restores the setting."""
+    if rate is None:
+        cache.delete(RATE_CACHE_KEY)
+    else:
+        cache.set(RATE_CACHE_KEY, float(rate), timeout=None)
+
+
+# Spans
+
+
+class Span:
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "sampled", "start", "attributes", "status")
+
+    def __init__(self, name, trace_id, parent_id, sampled, start=None, **attributes):
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.name = name
+        self.sampled = sampled
+        self.start = time.time() if start is None else start
+        self.attributes = attributes
+        self.status = "ok"
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def child(self, name, **attributes):
+        return Span(name, self.trace_id, self.span_id, self.sampled, **attributes)
+
+    @property
+    def traceparent(self):
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def finish(self, error=None):
+        if not self.sampled:
+            return
+        if error is not None:
+            self.status = "error"
+            self.attributes["error"] = f"{type(error).__name__}: {error}"
+        end = time.time()
+        exporter.info(
+            json.dumps(
+                {
+                    "trace_id": self.trace_id,
+                    "span_id": self.span_id,
+                    "parent_id": self.parent_id,
+                    "name": self.name,
+                    "start": round(self.start, 6),
+                    "duration_ms": round((end - self.start) * 1000, 3),
+                    "status": self.status,
+                    "process": f"{getattr(settings, 'PROCESS_TYPE', 'web')}:{os.getpid()}",
+                    "attributes": self.attributes,
+                },
+                default=str,
+            )
+        )
+
+
+_current = contextvars.ContextVar("trace_span", default=None)
+
+
+def current_span():
+    return _current.get()
+
+
+def parse_traceparent(value):
+    """``(trace_id, parent_span_id, sampled)`` from a traceparent header, or None."""
+    parts = (value or "").split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    try:
+        int(parts[1], 16), int(parts[2], 16), int(parts[3], 16)
+    except ValueError:
+        return None
+    return parts[1], parts[2], bool(int(parts[3], 16) & 1)
+
+
+def start_trace(name, traceparent=None, start=None, **attributes):
+    """
+    Begin a root span (or continue a remote parent) and make it current.
+    Returns ``(span, token)``; pass both to ``end_trace``.
+    """
+    parent = parse_traceparent(traceparent)
+    if parent is None:
+        trace_id, parent_id, sampled = f"{random.getrandbits(128):032x}", None, sampler.sample()
+    else:
+        trace_id, parent_id, sampled = parent
+    root = Span(name, trace_id, parent_id, sampled, start=start, **attributes)
+    return root, _current.set(root)
+
+
+def end_trace(root, token, error=None):
+    _current.reset(token)
+    root.finish(error)
+
+
+@contextmanager
+def span(name, **attributes):
+    """A child of the current span; does nothing outside a sampled trace."""
+    parent = _current.get()
+    if parent is None or not parent.sampled:
+        yield None
+        return
+    child = parent.child(name, **attributes)
+    token = _current.set(child)
+    try:
+        yield child
+    except BaseException as exc:
+        child.finish(exc)
+        raise
+    else:
+        child.finish()
+    finally:
+        _current.reset(token)
+
+
+class TracedValidationMixin:
+    """Records ``is_valid`` of a serializer as a ``serializer.validate`` span."""
+
+    def is_valid(self, *args, **kwargs):
+        with span("serializer.validate", serializer=type(self).__name__) as current:
+            valid = super().is_valid(*args, **kwargs)
+            if current is not None:
+                current.set(valid=valid)
+            return valid
+
+
+# Database queries
+
+
+def _trace_query(execute, sql, params, many, context):
+    parent = _current.get()
+    if parent is None or not parent.sampled:
+        return execute(sql, params, many, context)
+    with span(
+        "db.query",
+        alias=context["connection"].alias,
+        sql=sql[: tracing_settings()["SQL_MAX_LENGTH"]],
+        many=many,
+    ):
+        return execute(sql, params, many, context)
+
+
+def _install_query_tracer(sender, connection, **kwargs):
+    if _trace_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_trace_query)
+
+
+# Requests
+
+
+class TracingMiddleware:
+    """Root span per request, continuing an incoming ``traceparent``."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not ENABLED:
+            return self.get_response(request)
+        root, token = self._start(request)
+        try:
+            response = self.get_response(request)
+        except Exception as exc:
+            end_trace(root, token, exc)
+            raise
+        return self._finish(request, response, root, token)
+
+    async def __acall__(self, request):
+        if not ENABLED:
+            return await self.get_response(request)
+        root, token = self._start(request)
+        try:
+            response = await self.get_response(request)
+        except Exception as exc:
+            end_trace(root, token, exc)
+            raise
+        return self._finish(request, response, root, token)
+
+    def _start(self, request):
+        return start_trace(
+            f"{request.method} {request.path}",
+            request.headers.get("traceparent"),
+            method=request.method,
+            path=request.path,
+        )
+
+    def _finish(self, request, response, root, token):
+        if root.sampled:
+            match = getattr(request, "resolver_match", None)
+            user = getattr(request, "user", None)
+            root.set(
+                view=match.view_name if match else None,
+                status=response.status_code,
+                user_id=getattr(user, "id", None),
+            )
+            response["X-Trace-Id"] = root.trace_id
+        end_trace(root, token)
+        return response
+
+
+# Celery
+
+
+def _task_header(request, name):
+    value = getattr(request, name, None)
+    if value is None:
+        value = (getattr(request, "headers", None) or {}).get(name)
+    return value
+
+
+def _connect_task_signals():
+    from celery.signals import before_task_publish, task_postrun, task_prerun
+
+    @before_task_publish.connect(weak=False)
+    def inject_context(headers=None, **kwargs):
+        current = _current.get()
+        if headers is not None and current is not None:
+            headers["traceparent"] = current.traceparent
+            headers.setdefault("published_at", time.time())
+
+    @task_prerun.connect(weak=False)
+    def start_task_span(task=None, task_id=None, **kwargs):
+        traceparent = _task_header(task.request, "traceparent")
+        published_at = _task_header(task.request, "published_at")
+        root, token = start_trace(f"celery.task {task.name}", traceparent, task=task.name, task_id=task_id)
+        if root.sampled and published_at is not None:
+            # Sibling of the task span, under the span that published it
+            Span(
+                "celery.queue_wait", root.trace_id, root.parent_id, True,
+                start=float(published_at), task=task.name,
+            ).finish()
+        task.request.trace_state = (root, token)
+
+    @task_postrun.connect(weak=False)
+    def end_task_span(task=None, state=None, **kwargs):
+        trace_state = getattr(task.request, "trace_state", None)
+        if trace_state is None:
+            return
+        root, token = trace_state
+        root.set(state=state)
+        if state == "FAILURE":
+            root.status = "error"
+        end_trace(root, token)
+
+
+if ENABLED:
+    connection_created.connect(_install_query_tracer)
+    _connect_task_signals()
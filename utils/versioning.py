@@ -0,0 +1,159 @@
+import hashlib
+import time
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+from utils.db_router import reads_cacheable, record_write
+
+# Every write bumps the owner's version and ALL_SCOPE (used for staff, who
+# can see every row). Predefined categories are shared by all users, so
+# changes to them also bump PREDEFINED_SCOPE.
+ALL_SCOPE = "all"
+PREDEFINED_SCOPE = "predefined"
+
+
+def _version_key(scope):
+    return f"data-version:{scope}"
+
+
+def _initial_version():
+    # Start from a time-based value so a key lost to eviction never reuses
+    # a version (and ETag) that was handed out before.
+    return time.time_ns()
+
+
+def bump_data_version(user_id=None, predefined=False):
+    """Invalidate cached reads for a user (and for staff / shared data)."""
+    scopes = [ALL_SCOPE]
+    if user_id is not None:
+        scopes.append(f"user:{user_id}")
+    if predefined:
+        scopes.append(PREDEFINED_SCOPE)
+    record_write(scopes)
+
+    for scope in scopes:
+        key = _version_key(scope)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, _initial_version(), timeout=None)
+
+
+def _get_versions(scopes):
+    keys = [_version_key(scope) for scope in scopes]
+    found = cache.get_many(keys)
+    versions = []
+    for key in keys:
+        if key not in found:
+            cache.add(key, _initial_version(), timeout=None)
+            found[key] = cache.get(key)
+        versions.append(str(found[key]))
+    return ":".join(versions)
+
+
+def get_data_version(user):
+    """
+    Return the version string covering everything ``user`` can read,
+    fetched with a single cache round trip.
+    """
+    if user.is_staff:
+        return _get_versions([ALL_SCOPE])
+    return _get_versions([f"user:{user.id}", PREDEFINED_SCOPE])
+
+
+def get_predefined_version():
+    """Version of the shared predefined categories."""
+    return _get_versions([PREDEFINED_SCOPE])
+
+
+def get_request_data_version(request):
+    """``get_data_version`` for the request's user, looked up once per request."""
+    version = getattr(request, "_data_version", None)
+    if version is None:
+        version = get_data_version(request.user)
+        request._data_version = version
+    return version
+
+
+def make_etag(request, version):
+    """ETag for this URL and representation at the given data version."""
+    source = f"{version}|{request.get_full_path()}|{getattr(request, 'accepted_media_type', '')}"
+    return '"%s"' % hashlib.md5(source.encode(), usedforsecurity=False).hexdigest()
+
+
+def _etag_matches(etag, header):
+    if not header:
+        return False
+    candidates = parse_etags(header)
+    if "*" in candidates:
+        return True
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def conditional_get(view_method):
+    """
+    Adds an ETag derived from the user's data version to successful GET
+    responses and answers matching ``If-None-Match`` requests with 304
+    before the view queries or serializes anything. Responses that may
+    predate the current version (``db_router.reads_cacheable``) get no ETag.
+    Works on sync and async handlers.
+    """
+
+    def finish(response, etag):
+        response["ETag"] = etag
+        patch_vary_headers(response, ("Authorization",))
+        return response
+
+    if iscoroutinefunction(view_method):
+
+        @wraps(view_method)
+        async def async_wrapper(self, request, *args, **kwargs):
+            version = await sync_to_async(get_request_data_version)(request)
+            etag = make_etag(request, version)
+
+            if _etag_matches(etag, request.META.get("HTTP_IF_NONE_MATCH")):
+                return finish(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
+            response = await view_method(self, request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            if not await sync_to_async(reads_cacheable)():
+                return response
+            return finish(response, etag)
+
+        return async_wrapper
+
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        etag = make_etag(request, get_request_data_version(request))
+
+        if _etag_matches(etag, request.META.get("HTTP_IF_NONE_MATCH")):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK or not reads_cacheable():
+                return response
+
+        return finish(response, etag)
+
+    return wrapper
+
+
+def _on_write(sender, instance, **kwargs):
+    bump_data_version(
+        getattr(instance, "user_id", None),
+        predefined=getattr(instance, "is_predefined", False),
+    )
+
+
+def track_writes(model):
+    """Bump the owner's data version whenever ``model`` rows are saved or deleted."""
+    uid = f"data-version:{model._meta.label}"
+    post_save.connect(_on_write, sender=model, dispatch_uid=uid, weak=False)
+    post_delete.connect(_on_write, sender=model, dispatch_uid=uid, weak=False)